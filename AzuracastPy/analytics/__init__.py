@@ -0,0 +1,4 @@
+from .time_series import ListenerTimeSeries
+from .listener_snapshot import ListenerSnapshot
+from .session_tracker import ListenerSessionTracker, SessionEvent
+from .song_history_store import SongHistoryStore
@@ -0,0 +1,139 @@
+"""Base class for the column-oriented analytics stores."""
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from ..exceptions import ClientException
+
+class TextColumn:
+    """A column of text values, stored as integer codes into a list of the distinct values."""
+    def __init__(self):
+        self.codes = array("i")
+        self.values: List[Any] = []
+        self.lookup: Dict[Any, int] = {}
+
+    def code_for(self, value) -> int:
+        code = self.lookup.get(value)
+
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+
+        return code
+
+    def extend(self, values):
+        self.codes.extend(map(self.code_for, values))
+
+class ColumnStore:
+    """
+    Rows of data stored column by column, with each field kept in a compact typed array.
+
+    Text fields are stored once per distinct value, yes/no fields as ``0`` or ``1`` and number
+    fields as 64-bit integers. Subclasses list their fields in ``_TEXT_FIELDS``,
+    ``_FLAG_FIELDS`` and ``_NUMBER_FIELDS``, and name their rows in ``_ROW_NAME``.
+
+    .. note::
+
+        This class should not be initialized directly.
+    """
+    _TEXT_FIELDS: Tuple[str, ...] = ()
+    _FLAG_FIELDS: Tuple[str, ...] = ()
+    _NUMBER_FIELDS: Tuple[str, ...] = ()
+    _ROW_NAME = "row"
+
+    def __init__(self):
+        self._text = {field: TextColumn() for field in self._TEXT_FIELDS}
+        self._flags = {field: array("b") for field in self._FLAG_FIELDS}
+        self._numbers = {field: array("q") for field in self._NUMBER_FIELDS}
+
+    @property
+    def _fields(self) -> Tuple[str, ...]:
+        return self._TEXT_FIELDS + self._FLAG_FIELDS + self._NUMBER_FIELDS
+
+    def column(
+        self,
+        field: str
+    ) -> List[Any]:
+        """
+        Retrieves every value of a field, in row order.
+
+        :param field: The name of the field.
+
+        :returns: A list of values.
+
+        Usage:
+
+        .. code-block:: python
+
+            countries = snapshot.column("country")
+            artists = store.column("artist")
+        """
+        self._validate_field(field)
+
+        if field in self._text:
+            column = self._text[field]
+            return list(map(column.values.__getitem__, column.codes))
+
+        if field in self._flags:
+            return [bool(value) for value in self._flags[field]]
+
+        return list(self._numbers[field])
+
+    def _keys(self, field):
+        # The stored values of a field, and how to turn one back into its value, if needed.
+        self._validate_field(field)
+
+        if field in self._text:
+            column = self._text[field]
+            return column.codes, column.values.__getitem__
+
+        if field in self._flags:
+            return self._flags[field], bool
+
+        return self._numbers[field], None
+
+    def _count(self, field) -> Dict[Any, int]:
+        keys, decode = self._keys(field)
+        counts = Counter(keys).most_common()
+
+        if decode is None:
+            return dict(counts)
+
+        return {decode(key): count for key, count in counts}
+
+    def _totals(self, field, value_field):
+        if value_field not in self._numbers:
+            message = f"value_field param must be one of: {', '.join(self._NUMBER_FIELDS)}."
+            raise ClientException(message)
+
+        keys, decode = self._keys(field)
+
+        totals = {}
+        for key, value in zip(keys, self._numbers[value_field]):
+            totals[key] = totals.get(key, 0) + value
+
+        return totals, decode
+
+    def _sum(self, field, value_field) -> Dict[Any, int]:
+        totals, decode = self._totals(field, value_field)
+        ordered = sorted(totals.items(), key=lambda pair: pair[1], reverse=True)
+
+        if decode is None:
+            return dict(ordered)
+
+        return {decode(key): total for key, total in ordered}
+
+    def _extend(self, columns):
+        for field, values in zip(self._fields, columns):
+            if field in self._text:
+                self._text[field].extend(values)
+            elif field in self._flags:
+                self._flags[field].extend(1 if value else 0 for value in values)
+            else:
+                self._numbers[field].extend(int(value or 0) for value in values)
+
+    def _validate_field(self, field):
+        if field not in self._fields:
+            raise ClientException(f"'{field}' is not a {self._ROW_NAME} field. Valid fields: "
+                                  f"{', '.join(self._fields)}.")
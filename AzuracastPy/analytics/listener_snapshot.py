@@ -0,0 +1,339 @@
+"""Class for a column-oriented snapshot of the listeners of one or more stations."""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import compress, repeat
+from operator import floordiv
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..exceptions import ClientException
+from ..models.listener import Listener
+from .columns import ColumnStore
+
+def _listener_row(listener, station_id) -> Tuple:
+    if isinstance(listener, Listener):
+        device = listener.device
+        location = listener.location
+
+        return (
+            station_id, listener.hash, listener.mount_name, location.country, location.region,
+            location.city, device.client, device.browser_family, device.os_family,
+            listener.mount_is_local, device.is_browser, device.is_mobile, device.is_bot,
+            listener.connected_on, listener.connected_until, listener.connected_time
+        )
+
+    device = listener.get('device') or {}
+    location = listener.get('location') or {}
+
+    return (
+        station_id, listener.get('hash'), listener.get('mount_name'), location.get('country'),
+        location.get('region'), location.get('city'), device.get('client'),
+        device.get('browser_family'), device.get('os_family'), listener.get('mount_is_local'),
+        device.get('is_browser'), device.get('is_mobile'), device.get('is_bot'),
+        listener.get('connected_on'), listener.get('connected_until'),
+        listener.get('connected_time')
+    )
+
+class ListenerSnapshot(ColumnStore):
+    """
+    The listeners of one or more stations at a point in time, stored column by column.
+
+    Each field is kept in a compact typed array, with text fields stored once per distinct value.
+    Counting, summing and bucketing listeners then runs over flat arrays instead of thousands of
+    :class:`~.models.listener.Listener` objects.
+
+    The fields are ``station_id``, ``hash``, ``mount_name``, ``country``, ``region``, ``city``,
+    ``client``, ``browser_family``, ``os_family``, ``mount_is_local``, ``is_browser``,
+    ``is_mobile``, ``is_bot``, ``connected_on``, ``connected_until`` and ``connected_time``.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.analytics import ListenerSnapshot
+
+        snapshot = ListenerSnapshot.merge(
+            *(ListenerSnapshot.from_station(station) for station in client.stations())
+        )
+
+        by_country = snapshot.count_by("country")
+        mobile_by_os = snapshot.filter(is_mobile=True).count_by("os_family")
+        connections_per_hour = snapshot.histogram("connected_on", 3600)
+    """
+    # Text fields, stored as integer codes into a list of the distinct values.
+    _TEXT_FIELDS = (
+        "station_id", "hash", "mount_name", "country", "region", "city", "client",
+        "browser_family", "os_family"
+    )
+
+    # Yes/no fields, stored as 0 or 1.
+    _FLAG_FIELDS = ("mount_is_local", "is_browser", "is_mobile", "is_bot")
+
+    # Number fields, stored as 64-bit integers.
+    _NUMBER_FIELDS = ("connected_on", "connected_until", "connected_time")
+
+    _ROW_NAME = "listener"
+
+    def __init__(self):
+        """
+        Initializes an empty :class:`ListenerSnapshot` instance.
+
+        .. note::
+
+            Obtain a filled instance via :meth:`from_station`, :meth:`from_listeners` or
+            :meth:`merge`.
+        """
+        super().__init__()
+
+    def __len__(self) -> int:
+        return len(self._numbers["connected_time"])
+
+    def __repr__(self):
+        return f"ListenerSnapshot(listeners={len(self)})"
+
+    @classmethod
+    def from_station(
+        cls,
+        station
+    ) -> "ListenerSnapshot":
+        """
+        Creates a snapshot of the current listeners of a station.
+
+        The API response is stored directly, without creating a
+        :class:`~.models.listener.Listener` object for every listener.
+
+        :param station: The :class:`~.models.Station` whose listeners are retrieved.
+
+        :returns: A :class:`ListenerSnapshot` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            snapshot = ListenerSnapshot.from_station(station)
+        """
+        response = station._request_multiple_instances_of("station_listeners")
+
+        return cls.from_listeners(response, station.id)
+
+    @classmethod
+    def from_listeners(
+        cls,
+        listeners: Iterable[Any],
+        station_id: Optional[Any] = None
+    ) -> "ListenerSnapshot":
+        """
+        Creates a snapshot from listeners that were already retrieved.
+
+        :param listeners: :class:`~.models.listener.Listener` objects, or the listener
+            dictionaries returned by the API.
+        :param station_id: (Optional) The ID of the station the listeners belong to.
+            Default: ``None``.
+
+        :returns: A :class:`ListenerSnapshot` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            snapshot = ListenerSnapshot.from_listeners(station.listeners(), station.id)
+        """
+        snapshot = cls()
+        rows = [_listener_row(listener, station_id) for listener in listeners]
+
+        if rows:
+            snapshot._extend(zip(*rows))
+
+        return snapshot
+
+    @classmethod
+    def merge(
+        cls,
+        *snapshots: "ListenerSnapshot"
+    ) -> "ListenerSnapshot":
+        """
+        Combines several snapshots into one, e.g. the snapshots of every station on a radio.
+
+        :param snapshots: The :class:`ListenerSnapshot` objects to combine.
+
+        :returns: A new :class:`ListenerSnapshot` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            snapshot = ListenerSnapshot.merge(first_snapshot, second_snapshot)
+        """
+        merged = cls()
+
+        for snapshot in snapshots:
+            for field, column in snapshot._text.items():
+                target = merged._text[field]
+
+                if not target.values:
+                    target.values = list(column.values)
+                    target.lookup = dict(column.lookup)
+                    target.codes.extend(column.codes)
+                    continue
+
+                # Only the distinct values are re-encoded. Rows are translated code to code.
+                translation = [target.code_for(value) for value in column.values]
+                target.codes.extend(map(translation.__getitem__, column.codes))
+
+            for field, column in snapshot._flags.items():
+                merged._flags[field].extend(column)
+
+            for field, column in snapshot._numbers.items():
+                merged._numbers[field].extend(column)
+
+        return merged
+
+    def count_by(
+        self,
+        field: str
+    ) -> Dict[Any, int]:
+        """
+        Counts the listeners for each value of a field.
+
+        :param field: The name of the field, e.g. ``"country"`` or ``"mount_name"``.
+
+        :returns: A dictionary that maps each value to its number of listeners, largest first.
+
+        Usage:
+
+        .. code-block:: python
+
+            listeners_per_mount = snapshot.count_by("mount_name")
+        """
+        return self._count(field)
+
+    def sum_by(
+        self,
+        field: str,
+        value_field: str = "connected_time"
+    ) -> Dict[Any, int]:
+        """
+        Adds up a number field for each value of another field.
+
+        :param field: The name of the field to group by.
+        :param value_field: (Optional) The number field to add up. Default: ``"connected_time"``.
+
+        :returns: A dictionary that maps each value of ``field`` to its total, largest first.
+
+        Usage:
+
+        .. code-block:: python
+
+            seconds_listened_per_country = snapshot.sum_by("country")
+        """
+        return self._sum(field, value_field)
+
+    def histogram(
+        self,
+        field: str = "connected_time",
+        bin_width: Optional[int] = None,
+        bins: Optional[List[int]] = None
+    ) -> Dict[int, int]:
+        """
+        Counts the listeners whose value of a number field falls into each bin.
+
+        Provide either ``bin_width`` for bins of equal size or ``bins`` for custom bins.
+
+        :param field: (Optional) The name of the number field. Default: ``"connected_time"``.
+        :param bin_width: (Optional) The size of every bin. Default: ``None``.
+        :param bins: (Optional) The sorted lower edges of the bins. Values below the first edge
+            aren't counted. Default: ``None``.
+
+        :returns: A dictionary that maps the lower edge of each bin to its number of listeners,
+            in ascending order. Empty bins are left out when ``bin_width`` is used.
+
+        Usage:
+
+        .. code-block:: python
+
+            # Listeners connected for under 5 minutes, up to an hour and longer.
+            sessions = snapshot.histogram("connected_time", bins=[0, 300, 3600])
+
+            # New connections in each hour.
+            peak_hours = snapshot.histogram("connected_on", bin_width=3600)
+        """
+        if field not in self._numbers:
+            message = f"field param must be one of: {', '.join(self._NUMBER_FIELDS)}."
+            raise ClientException(message)
+
+        if (bin_width is None) == (bins is None):
+            raise ClientException("Provide either the 'bin_width' param or the 'bins' param.")
+
+        values = self._numbers[field]
+
+        if bin_width is not None:
+            if bin_width <= 0:
+                raise ClientException("bin_width param must be positive.")
+
+            counts = Counter(map(floordiv, values, repeat(bin_width)))
+
+            return {bucket * bin_width: counts[bucket] for bucket in sorted(counts)}
+
+        edges = sorted(bins)
+        ordered = sorted(values)
+
+        histogram = {}
+        for i, edge in enumerate(edges):
+            start = bisect_left(ordered, edge)
+            end = bisect_left(ordered, edges[i + 1]) if i + 1 < len(edges) else len(ordered)
+            histogram[edge] = end - start
+
+        return histogram
+
+    def filter(
+        self,
+        **conditions: Any
+    ) -> "ListenerSnapshot":
+        """
+        Selects the listeners whose fields have the given values.
+
+        :param conditions: The values to match, e.g. ``country="US"``.
+
+        :returns: A new :class:`ListenerSnapshot` object with the matching listeners.
+
+        Usage:
+
+        .. code-block:: python
+
+            mobile_listeners = snapshot.filter(is_mobile=True, mount_name="/radio.mp3")
+        """
+        mask = None
+
+        for field, value in conditions.items():
+            self._validate_field(field)
+
+            if field in self._text:
+                column = self._text[field]
+                code = column.lookup.get(value, -1)
+                matches = [c == code for c in column.codes]
+            else:
+                column = self._flags[field] if field in self._flags else self._numbers[field]
+                value = int(value)
+                matches = [v == value for v in column]
+
+            mask = matches if mask is None else [a and b for a, b in zip(mask, matches)]
+
+        if mask is None:
+            return ListenerSnapshot.merge(self)
+
+        selected = ListenerSnapshot()
+
+        for field, column in self._text.items():
+            target = selected._text[field]
+            target.values = list(column.values)
+            target.lookup = dict(column.lookup)
+            target.codes = array("i", compress(column.codes, mask))
+
+        for field, column in self._flags.items():
+            selected._flags[field] = array("b", compress(column, mask))
+
+        for field, column in self._numbers.items():
+            selected._numbers[field] = array("q", compress(column, mask))
+
+        return selected
@@ -0,0 +1,229 @@
+"""Class for following listener sessions across successive listener polls."""
+
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..enums import SessionEvents
+from ..util.general_util import generate_repr_string
+from ..models.listener import Listener
+
+class SessionEvent:
+    """Represents the start or the end of a listening session."""
+    def __init__(
+        self,
+        type: SessionEvents,
+        hash: str,
+        mount_name: str,
+        started_at: int,
+        ended_at: Optional[int],
+        duration: int
+    ):
+        """
+        Initializes a :class:`SessionEvent` object.
+
+        .. note::
+
+            This class should not be initialized directly. Instead, obtain instances
+            via: :meth:`ListenerSessionTracker.ingest`.
+        """
+        self.type = type
+        self.hash = hash
+        self.mount_name = mount_name
+        self.started_at = started_at
+        self.ended_at = ended_at
+        self.duration = duration
+
+    def __repr__(self):
+        return generate_repr_string(self)
+
+class _Session:
+    __slots__ = ("hash", "mount_name", "started_at", "last_seen", "duration")
+
+    def __init__(self, hash, mount_name, started_at, last_seen, duration):
+        self.hash = hash
+        self.mount_name = mount_name
+        self.started_at = started_at
+        self.last_seen = last_seen
+        self.duration = duration
+
+def _session_fields(listener):
+    if isinstance(listener, Listener):
+        return listener.hash, listener.mount_name, listener.connected_on, listener.connected_time
+
+    return (
+        listener['hash'], listener.get('mount_name'), listener.get('connected_on'),
+        listener.get('connected_time')
+    )
+
+class ListenerSessionTracker:
+    """
+    Turns successive polls of a station's listeners into listening sessions.
+
+    Each poll is compared with the previous one by listener ``hash``, mount and connection time,
+    so listeners that share a hash are followed separately. Listeners that appear start a
+    session and listeners that disappear end one. Only the sessions that are still running are
+    kept; finished sessions are folded into running totals.
+
+    Usage:
+
+    .. code-block:: python
+
+        import time
+
+        from AzuracastPy.analytics import ListenerSessionTracker
+        from AzuracastPy.enums import SessionEvents
+
+        tracker = ListenerSessionTracker()
+
+        while True:
+            for event in tracker.ingest(station.listeners()):
+                if event.type is SessionEvents.END:
+                    print(f"{event.hash} listened for {event.duration} seconds")
+
+            print(tracker.total_listening_hours)
+            time.sleep(60)
+    """
+    def __init__(self):
+        """Initializes a :class:`ListenerSessionTracker` instance."""
+        self._active: Dict[Tuple, _Session] = {}
+
+        self.sessions_started = 0
+        self.sessions_ended = 0
+        self._ended_seconds = 0
+        self._last_churn_rate = 0.0
+
+    def __repr__(self):
+        return f"ListenerSessionTracker(active={len(self._active)}, "\
+               f"sessions_ended={self.sessions_ended})"
+
+    @property
+    def active_sessions(self) -> int:
+        """The number of sessions that are still running."""
+        return len(self._active)
+
+    @property
+    def total_listening_hours(self) -> float:
+        """The total listening time of every session so far, including running ones, in hours."""
+        running = sum(session.duration for session in self._active.values())
+
+        return (self._ended_seconds + running) / 3600
+
+    @property
+    def average_session_length(self) -> float:
+        """The average length of the sessions that ended, in seconds."""
+        if not self.sessions_ended:
+            return 0.0
+
+        return self._ended_seconds / self.sessions_ended
+
+    @property
+    def churn_rate(self) -> float:
+        """
+        The share, from ``0`` to ``1``, of the sessions running before the last poll that ended
+        by the last poll.
+        """
+        return self._last_churn_rate
+
+    def ingest(
+        self,
+        listeners: Iterable[Any],
+        timestamp: Optional[int] = None
+    ) -> List[SessionEvent]:
+        """
+        Compares a poll of listeners with the previous one.
+
+        :param listeners: The :class:`~.models.listener.Listener` objects returned by
+            :meth:`~.models.Station.listeners`, or the listener dictionaries returned by the API.
+        :param timestamp: (Optional) The UNIX timestamp of the poll. Leave as ``None`` to use the
+            current time. Default: ``None``.
+
+        :returns: A list of :class:`SessionEvent` objects, for every session that ended and then
+            every session that started since the previous poll.
+
+        Usage:
+
+        .. code-block:: python
+
+            events = tracker.ingest(station.listeners())
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+
+        previous = self._active
+        running_before = len(previous)
+        current: Dict[Tuple, _Session] = {}
+        started = []
+        ended = []
+
+        for listener in listeners:
+            hash, mount_name, connected_on, connected_time = _session_fields(listener)
+
+            # Several listeners can share a hash, e.g. behind the same NAT or with several
+            # players open, so a session is identified by its connection as well. The count
+            # keeps apart listeners that connected to the same mount in the same second.
+            key = (hash, mount_name, connected_on, 0)
+            while key in current:
+                key = key[:3] + (key[3] + 1,)
+
+            duration = connected_time if connected_time is not None else 0
+            session = previous.pop(key, None)
+
+            if session is None:
+                started_at = connected_on if connected_on is not None else timestamp
+                session = _Session(hash, mount_name, started_at, timestamp, duration)
+                started.append(session)
+            else:
+                session.last_seen = timestamp
+                session.duration = max(session.duration, duration)
+
+            current[key] = session
+
+        # A listener that reconnected between polls has a new connection time, so its old
+        # session ends here and its new one started above.
+        for session in previous.values():
+            ended.append(self._end(session))
+
+        self._last_churn_rate = len(ended) / running_before if running_before else 0.0
+        self._active = current
+
+        self.sessions_started += len(started)
+
+        return ended + [
+            SessionEvent(
+                SessionEvents.START, session.hash, session.mount_name, session.started_at,
+                None, session.duration
+            )
+            for session in started
+        ]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Summarizes the sessions so far.
+
+        :returns: A dictionary with the ``active_sessions``, ``sessions_started``,
+            ``sessions_ended``, ``total_listening_hours``, ``average_session_length`` and
+            ``churn_rate``.
+
+        Usage:
+
+        .. code-block:: python
+
+            print(tracker.stats())
+        """
+        return {
+            "active_sessions": self.active_sessions,
+            "sessions_started": self.sessions_started,
+            "sessions_ended": self.sessions_ended,
+            "total_listening_hours": self.total_listening_hours,
+            "average_session_length": self.average_session_length,
+            "churn_rate": self.churn_rate
+        }
+
+    def _end(self, session) -> SessionEvent:
+        self.sessions_ended += 1
+        self._ended_seconds += session.duration
+
+        return SessionEvent(
+            SessionEvents.END, session.hash, session.mount_name, session.started_at,
+            session.last_seen, session.duration
+        )
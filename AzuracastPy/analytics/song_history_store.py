@@ -0,0 +1,274 @@
+"""Class for a column-oriented store of the song history of one or more stations."""
+
+import heapq
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..models.song_history import SongHistory
+from .columns import ColumnStore
+
+def _history_row(entry, station_id) -> Tuple:
+    if isinstance(entry, SongHistory):
+        song = entry.song
+
+        return (
+            station_id, song.id, song.text, song.artist, song.title, song.album, entry.playlist,
+            entry.streamer, entry.is_request, entry.sh_id, entry.played_at, entry.duration,
+            entry.listeners_start, entry.listeners_end, entry.delta_total
+        )
+
+    song = entry.get('song') or {}
+
+    return (
+        station_id, song.get('id'), song.get('text'), song.get('artist'), song.get('title'),
+        song.get('album'), entry.get('playlist'), entry.get('streamer'), entry.get('is_request'),
+        entry.get('sh_id'), entry.get('played_at'), entry.get('duration'),
+        entry.get('listeners_start'), entry.get('listeners_end'), entry.get('delta_total')
+    )
+
+class SongHistoryStore(ColumnStore):
+    """
+    The song history of one or more stations, accumulated over many pulls and stored column by
+    column.
+
+    Entries are identified by their song history ID (``sh_id``), so pulls that overlap can be
+    added without counting a play twice. Each field is kept in a compact typed array, with text
+    fields stored once per distinct value, so charts over many stations run over flat arrays
+    instead of thousands of :class:`~.models.song_history.SongHistory` objects.
+
+    The fields are ``station_id``, ``song_id``, ``text``, ``artist``, ``title``, ``album``,
+    ``playlist``, ``streamer``, ``is_request``, ``sh_id``, ``played_at``, ``duration``,
+    ``listeners_start``, ``listeners_end``, ``delta_total`` and ``listener_gain``, the
+    difference between ``listeners_end`` and ``listeners_start``.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.analytics import SongHistoryStore
+
+        store = SongHistoryStore()
+
+        for station in client.stations():
+            store.add_station(station)
+
+        top_artists = store.top("artist", 10)
+        biggest_gains = store.top("text", 10, value_field="listener_gain")
+        request_share = store.request_ratio()
+    """
+    # Text fields, stored as integer codes into a list of the distinct values.
+    _TEXT_FIELDS = (
+        "station_id", "song_id", "text", "artist", "title", "album", "playlist", "streamer"
+    )
+
+    # Yes/no fields, stored as 0 or 1.
+    _FLAG_FIELDS = ("is_request",)
+
+    # Number fields, stored as 64-bit integers. The last one is worked out from the others.
+    _NUMBER_FIELDS = (
+        "sh_id", "played_at", "duration", "listeners_start", "listeners_end", "delta_total",
+        "listener_gain"
+    )
+
+    _ROW_NAME = "song history"
+
+    def __init__(self):
+        """Initializes an empty :class:`SongHistoryStore` instance."""
+        super().__init__()
+        self._sh_ids = set()
+
+    def __len__(self) -> int:
+        return len(self._numbers["sh_id"])
+
+    def __repr__(self):
+        return f"SongHistoryStore(entries={len(self)})"
+
+    def add(
+        self,
+        history: Iterable[Union[SongHistory, Dict[str, Any]]],
+        station_id: Optional[Any] = None
+    ) -> int:
+        """
+        Adds song history entries to the store. Entries that were already added are skipped.
+
+        :param history: :class:`~.models.song_history.SongHistory` objects, e.g. from
+            :meth:`~.models.Station.history` or the ``song_history`` of a
+            :class:`~.models.now_playing.NowPlaying` object, or the song history dictionaries
+            returned by the API.
+        :param station_id: (Optional) The ID of the station the entries belong to.
+            Default: ``None``.
+
+        :returns: The number of entries that were added.
+
+        Usage:
+
+        .. code-block:: python
+
+            store.add(now_playing.song_history, now_playing.station.id)
+        """
+        rows = []
+
+        for entry in history:
+            row = _history_row(entry, station_id)
+            sh_id = row[9]
+
+            if sh_id is not None:
+                if sh_id in self._sh_ids:
+                    continue
+
+                self._sh_ids.add(sh_id)
+
+            rows.append(row)
+
+        if rows:
+            self._extend(zip(*rows))
+
+        return len(rows)
+
+    def add_station(
+        self,
+        station
+    ) -> int:
+        """
+        Retrieves the song history of a station and adds it to the store.
+
+        The API response is stored directly, without creating a
+        :class:`~.models.song_history.SongHistory` object for every entry.
+
+        :param station: The :class:`~.models.Station` whose history is retrieved.
+
+        :returns: The number of entries that were added.
+
+        Usage:
+
+        .. code-block:: python
+
+            store.add_station(station)
+        """
+        response = station._request_multiple_instances_of("station_history")
+
+        return self.add(response, station.id)
+
+    def plays_by(
+        self,
+        field: str
+    ) -> Dict[Any, int]:
+        """
+        Counts the plays for each value of a field.
+
+        :param field: The name of the field, e.g. ``"artist"``, ``"playlist"`` or ``"streamer"``.
+
+        :returns: A dictionary that maps each value to its number of plays, largest first.
+
+        Usage:
+
+        .. code-block:: python
+
+            plays_per_playlist = store.plays_by("playlist")
+        """
+        return self._count(field)
+
+    def sum_by(
+        self,
+        field: str,
+        value_field: str = "listener_gain"
+    ) -> Dict[Any, int]:
+        """
+        Adds up a number field for each value of another field.
+
+        :param field: The name of the field to group by, e.g. ``"song_id"`` or ``"text"``.
+        :param value_field: (Optional) The number field to add up. Default: ``"listener_gain"``.
+
+        :returns: A dictionary that maps each value of ``field`` to its total, largest first.
+
+        Usage:
+
+        .. code-block:: python
+
+            listener_gain_per_track = store.sum_by("text")
+            seconds_played_per_artist = store.sum_by("artist", "duration")
+        """
+        return self._sum(field, value_field)
+
+    def request_ratio(
+        self,
+        field: Optional[str] = None
+    ) -> Union[float, Dict[Any, float]]:
+        """
+        Works out the share of plays that were song requests.
+
+        :param field: (Optional) The name of a field to work out the share for each of its
+            values. Leave as ``None`` for the share over every entry. Default: ``None``.
+
+        :returns: A number from ``0`` to ``1``, or a dictionary that maps each value of ``field``
+            to one, in the order of :meth:`plays_by`.
+
+        Usage:
+
+        .. code-block:: python
+
+            overall = store.request_ratio()
+            per_station = store.request_ratio("station_id")
+        """
+        requests = self._flags["is_request"]
+
+        if field is None:
+            return sum(requests) / len(requests) if requests else 0.0
+
+        keys, decode = self._keys(field)
+        plays = Counter(keys)
+        requested = Counter(key for key, is_request in zip(keys, requests) if is_request)
+
+        return {
+            key if decode is None else decode(key): requested[key] / count
+            for key, count in plays.most_common()
+        }
+
+    def top(
+        self,
+        field: str,
+        n: int = 10,
+        value_field: Optional[str] = None
+    ) -> List[Tuple[Any, int]]:
+        """
+        Selects the values of a field with the most plays, or the largest total of a number
+        field.
+
+        Only the top ``n`` totals are ordered, so this is faster than sorting every total when
+        there are many distinct values.
+
+        :param field: The name of the field to group by, e.g. ``"artist"``.
+        :param n: (Optional) The number of values to select. Default: ``10``.
+        :param value_field: (Optional) The number field to add up. Leave as ``None`` to count
+            plays. Default: ``None``.
+
+        :returns: A list of ``(value, total)`` tuples, largest first.
+
+        Usage:
+
+        .. code-block:: python
+
+            for artist, plays in store.top("artist", 5):
+                print(f"{artist}: {plays} plays")
+        """
+        if value_field is None:
+            keys, decode = self._keys(field)
+            totals = Counter(keys)
+        else:
+            totals, decode = self._totals(field, value_field)
+
+        selected = heapq.nlargest(n, totals.items(), key=lambda pair: pair[1])
+
+        if decode is None:
+            return selected
+
+        return [(decode(key), total) for key, total in selected]
+
+    def _extend(self, columns):
+        columns = list(columns)
+        super()._extend(columns)
+
+        self._numbers["listener_gain"].extend(
+            int(end or 0) - int(start or 0)
+            for start, end in zip(columns[-3], columns[-2])
+        )
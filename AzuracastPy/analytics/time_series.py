@@ -0,0 +1,323 @@
+"""Class for recording listener counts over time in fixed-size buffers."""
+
+import csv
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple, Union
+
+from ..enums import Resolutions
+from ..exceptions import ClientException
+from ..util.general_util import generate_enum_error_text
+from ..models.now_playing import NowPlaying
+
+_COUNTS = ("total", "unique", "current")
+
+_RAW_COLUMNS = ("time",) + _COUNTS
+_AGGREGATE_COLUMNS = ("time",) + tuple(
+    f"{count}_{statistic}" for count in _COUNTS for statistic in ("min", "max", "avg")
+)
+
+_BUCKET_SECONDS = {
+    Resolutions.MINUTE: 60,
+    Resolutions.HOUR: 3600
+}
+
+class _RingBuffer:
+    # Preallocated columns that are overwritten oldest-first once they're full.
+    def __init__(self, columns, capacity):
+        self.columns = columns
+        self.capacity = capacity
+        self._arrays = [array("d", bytes(8 * capacity)) for _ in columns]
+        self._next = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, row):
+        for column, value in zip(self._arrays, row):
+            column[self._next] = value
+
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def to_arrays(self) -> Dict[str, array]:
+        start = (self._next - self._size) % self.capacity
+
+        if start + self._size <= self.capacity:
+            return {
+                name: column[start:start + self._size]
+                for name, column in zip(self.columns, self._arrays)
+            }
+
+        return {
+            name: column[start:] + column[:self._next]
+            for name, column in zip(self.columns, self._arrays)
+        }
+
+class _Downsampler:
+    # Folds samples into fixed-width time buckets and keeps the finished buckets.
+    def __init__(self, width, capacity):
+        self.width = width
+        self.buffer = _RingBuffer(_AGGREGATE_COLUMNS, capacity)
+        self._bucket = None
+        self._minimums = None
+        self._maximums = None
+        self._sums = None
+        self._samples = 0
+
+    def add(self, timestamp, counts):
+        bucket = timestamp - timestamp % self.width
+
+        if bucket != self._bucket:
+            if self._bucket is not None:
+                self.buffer.append(self._current_row())
+
+            self._bucket = bucket
+            self._minimums = list(counts)
+            self._maximums = list(counts)
+            self._sums = list(counts)
+            self._samples = 1
+            return
+
+        for i, count in enumerate(counts):
+            if count < self._minimums[i]:
+                self._minimums[i] = count
+            if count > self._maximums[i]:
+                self._maximums[i] = count
+            self._sums[i] += count
+
+        self._samples += 1
+
+    def to_arrays(self) -> Dict[str, array]:
+        arrays = self.buffer.to_arrays()
+
+        # The bucket that is still being filled is included, so recent data shows up.
+        if self._bucket is not None:
+            for name, value in zip(_AGGREGATE_COLUMNS, self._current_row()):
+                arrays[name].append(value)
+
+            if len(arrays["time"]) > self.buffer.capacity:
+                arrays = {name: column[1:] for name, column in arrays.items()}
+
+        return arrays
+
+    def _current_row(self):
+        row = [self._bucket]
+
+        for i in range(len(_COUNTS)):
+            row.extend((self._minimums[i], self._maximums[i], self._sums[i] / self._samples))
+
+        return row
+
+class _Series:
+    def __init__(self, raw_capacity, minute_capacity, hour_capacity):
+        self.raw = _RingBuffer(_RAW_COLUMNS, raw_capacity)
+        self.downsamplers = {
+            Resolutions.MINUTE: _Downsampler(_BUCKET_SECONDS[Resolutions.MINUTE], minute_capacity),
+            Resolutions.HOUR: _Downsampler(_BUCKET_SECONDS[Resolutions.HOUR], hour_capacity)
+        }
+
+    def add(self, timestamp, counts):
+        self.raw.append((timestamp,) + counts)
+
+        for downsampler in self.downsamplers.values():
+            downsampler.add(timestamp, counts)
+
+    def to_arrays(self, resolution) -> Dict[str, array]:
+        if resolution is Resolutions.RAW:
+            return self.raw.to_arrays()
+
+        return self.downsamplers[resolution].to_arrays()
+
+class ListenerTimeSeries:
+    """
+    Records the listener counts of stations and their mounts over time.
+
+    Every station and mount gets its own series, kept at three resolutions: every recorded
+    sample, one-minute buckets and one-hour buckets. Buckets store the minimum, maximum and
+    average of the ``total``, ``unique`` and ``current`` listener counts. Each resolution is a
+    fixed-size buffer that overwrites its oldest values, so the memory used by a series never
+    grows.
+
+    Usage:
+
+    .. code-block:: python
+
+        import time
+
+        from AzuracastPy.analytics import ListenerTimeSeries
+        from AzuracastPy.enums import Resolutions
+
+        series = ListenerTimeSeries()
+
+        for _ in range(60):
+            series.record(client.now_playing())
+            time.sleep(15)
+
+        series.to_csv("station_1.csv", station_id=1, resolution=Resolutions.MINUTE)
+    """
+    def __init__(
+        self,
+        raw_capacity: int = 720,
+        minute_capacity: int = 1440,
+        hour_capacity: int = 720
+    ):
+        """
+        Initializes a :class:`ListenerTimeSeries` instance.
+
+        :param raw_capacity: (Optional) The number of samples kept for each series.
+            Default: ``720``.
+        :param minute_capacity: (Optional) The number of one-minute buckets kept for each series.
+            The default keeps one day. Default: ``1440``.
+        :param hour_capacity: (Optional) The number of one-hour buckets kept for each series.
+            The default keeps thirty days. Default: ``720``.
+        """
+        if min(raw_capacity, minute_capacity, hour_capacity) < 1:
+            raise ClientException("Every capacity must be at least 1.")
+
+        self._capacities = (raw_capacity, minute_capacity, hour_capacity)
+        self._series: Dict[Tuple[int, Optional[int]], _Series] = {}
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __repr__(self):
+        return f"ListenerTimeSeries(series={len(self._series)})"
+
+    def keys(self) -> List[Tuple[int, Optional[int]]]:
+        """
+        Lists the recorded series.
+
+        :returns: A list of ``(station_id, mount_id)`` tuples. The ``mount_id`` is ``None`` for
+            the series of a whole station.
+
+        Usage:
+
+        .. code-block:: python
+
+            for station_id, mount_id in series.keys():
+                print(station_id, mount_id)
+        """
+        return list(self._series)
+
+    def record(
+        self,
+        now_playing: Union[NowPlaying, List[NowPlaying]],
+        timestamp: Optional[float] = None
+    ):
+        """
+        Adds the listener counts of one or more stations, and each of their mounts, to the
+        series.
+
+        :param now_playing: A :class:`~.models.now_playing.NowPlaying` object, or a list of them
+            as returned by :meth:`~.AzuracastClient.now_playing`.
+        :param timestamp: (Optional) The UNIX timestamp of the counts. Leave as ``None`` to use
+            the current time. Default: ``None``.
+
+        Usage:
+
+        .. code-block:: python
+
+            series.record(client.now_playing())
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        if isinstance(now_playing, NowPlaying):
+            now_playing = [now_playing]
+
+        for np in now_playing:
+            station_id = np.station.id
+
+            self._add((station_id, None), timestamp, np.listeners)
+
+            for mount in np.station.mounts:
+                self._add((station_id, mount.id), timestamp, mount.listeners)
+
+    def series(
+        self,
+        station_id: int,
+        mount_id: Optional[int] = None,
+        resolution: Resolutions = Resolutions.RAW
+    ) -> Dict[str, array]:
+        """
+        Retrieves a series as columns of numbers, oldest first.
+
+        :param station_id: The ID of the station.
+        :param mount_id: (Optional) The ID of one of the station's mounts. Leave as ``None`` for
+            the listener counts of the whole station. Default: ``None``.
+        :param resolution: (Optional) The resolution of the series. Default: ``Resolutions.RAW``.
+
+        :returns: A dictionary that maps column names to :class:`array.array` objects of equal
+            length. Raw series have ``time``, ``total``, ``unique`` and ``current`` columns.
+            Minute and hour series have a ``time`` column with the start of each bucket and a
+            ``{count}_min``, ``{count}_max`` and ``{count}_avg`` column for each count.
+
+        Usage:
+
+        .. code-block:: python
+
+            from AzuracastPy.enums import Resolutions
+
+            hourly = series.series(1, resolution=Resolutions.HOUR)
+            peak = max(hourly["current_max"])
+        """
+        if not isinstance(resolution, Resolutions):
+            raise ClientException(generate_enum_error_text("resolution", Resolutions))
+
+        series = self._series.get((station_id, mount_id))
+
+        if series is None:
+            columns = _RAW_COLUMNS if resolution is Resolutions.RAW else _AGGREGATE_COLUMNS
+            return {name: array("d") for name in columns}
+
+        return series.to_arrays(resolution)
+
+    def to_csv(
+        self,
+        file,
+        station_id: int,
+        mount_id: Optional[int] = None,
+        resolution: Resolutions = Resolutions.RAW
+    ):
+        """
+        Writes a series to a CSV file, with a header row.
+
+        :param file: The path of the file to write, or an open text file.
+        :param station_id: The ID of the station.
+        :param mount_id: (Optional) The ID of one of the station's mounts. Leave as ``None`` for
+            the listener counts of the whole station. Default: ``None``.
+        :param resolution: (Optional) The resolution of the series. Default: ``Resolutions.RAW``.
+
+        Usage:
+
+        .. code-block:: python
+
+            series.to_csv("listeners.csv", station_id=1)
+        """
+        columns = self.series(station_id, mount_id, resolution)
+
+        if isinstance(file, str):
+            with open(file, "w", newline="", encoding="utf-8") as opened_file:
+                _write_csv(opened_file, columns)
+        else:
+            _write_csv(file, columns)
+
+    def _add(self, key, timestamp, listeners):
+        series = self._series.get(key)
+
+        if series is None:
+            series = self._series[key] = _Series(*self._capacities)
+
+        series.add(
+            timestamp,
+            (listeners.total or 0, listeners.unique or 0, listeners.current or 0)
+        )
+
+def _write_csv(file, columns):
+    writer = csv.writer(file)
+    writer.writerow(columns)
+
+    for row in zip(*columns.values()):
+        writer.writerow(int(value) if value.is_integer() else value for value in row)
@@ -2,14 +2,16 @@
 
 import configparser
 import os
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict
+
+import requests
 
 from .models import Station, NowPlaying
 from .models.administration.admin import Admin
 
 from .request_handler import RequestHandler
 from .constants import API_ENDPOINTS
-from .exceptions import ClientException
+from .exceptions import AzuracastException, ClientException
 
 class AzuracastClient:
     """
@@ -92,6 +94,9 @@ class AzuracastClient:
             x_api_key=x_api_key
         )
 
+        # Station shortcodes by ID, learned from now-playing responses.
+        self._shortcodes: Dict[int, str] = {}
+
     def _build_now_playing_url(
         self,
         station_id: Optional[int] = None
@@ -125,13 +130,19 @@ class AzuracastClient:
 
     def now_playing(
         self,
-        station_id: Optional[int] = None
+        station_id: Optional[int] = None,
+        static: bool = False
     ) -> Union[List[NowPlaying], NowPlaying]:
         """
         Retrieves now playing information for a specific station or all stations.
 
         :param station_id: (Optional) The ID of the station to retrieve data for.
             If None, retrieves data for all stations. Default: ``None``.
+        :param static: (Optional) Determines whether a single station's data is read from the
+            static now-playing file that AzuraCast keeps for each station. The file is served
+            without running the API, which is much cheaper for the server. The API is used
+            instead the first time a station is requested, to learn its shortcode, and whenever
+            the file can't be read. Default: ``False``.
 
         :returns: A list of :class:`NowPlaying` objects, or a single :class:`NowPlaying` object,
             depending on whether or not a ``station_id`` was provided.
@@ -147,20 +158,56 @@ class AzuracastClient:
         .. code-block:: python
 
             all_now_playing = client.now_playing()
+
+        To read the now-playing details of a station from its static file:
+
+        .. code-block:: python
+
+            station_now_playing = client.now_playing(1, static=True)
         """
         url = self._build_now_playing_url(station_id)
 
+        if station_id and static and station_id in self._shortcodes:
+            now_playing = self._get_static_now_playing(self._shortcodes[station_id])
+
+            if now_playing is not None:
+                return now_playing
+
         response = self._request_handler.get(url)
 
         if station_id:
             # The entire now_playing list is returned when an invalid station ID is passed.
             # API's rules, not mine.
             if isinstance(response, list):
-                return [NowPlaying(**np) for np in response]
+                return self._remember_shortcodes([NowPlaying(**np) for np in response])
 
-            return NowPlaying(**response)
+            return self._remember_shortcodes([NowPlaying(**response)])[0]
+
+        return self._remember_shortcodes([NowPlaying(**np) for np in response])
+
+    def _get_static_now_playing(
+        self,
+        shortcode: str
+    ) -> Optional[NowPlaying]:
+        url = API_ENDPOINTS["static_now_playing"].format(
+            radio_url=self._request_handler.radio_url,
+            shortcode=shortcode
+        )
+
+        try:
+            return NowPlaying(**self._request_handler.get(url))
+        except (AzuracastException, requests.RequestException, TypeError, ValueError, KeyError):
+            # Missing, stale or half-written files are left to the API.
+            return None
+
+    def _remember_shortcodes(
+        self,
+        now_playing: List[NowPlaying]
+    ) -> List[NowPlaying]:
+        for np in now_playing:
+            self._shortcodes[np.station_id] = np.station_shortcode
 
-        return [NowPlaying(**np) for np in response]
+        return now_playing
 
     def stations(self) -> List[Station]:
         """
@@ -4,6 +4,8 @@
 API_ENDPOINTS = {
     "all_now_playing":            "{radio_url}/api/nowplaying",
     "station_now_playing":        "{radio_url}/api/nowplaying/{station_id}",
+    "now_playing_sse":            "{radio_url}/api/live/nowplaying/sse",
+    "static_now_playing":         "{radio_url}/api/nowplaying_static/{shortcode}.json",
     "station_fallback":           "{radio_url}/api/station/{station_id}/fallback",
     "stations":                   "{radio_url}/api/stations",
     "station":                    "{radio_url}/api/station/{station_id}",
@@ -7,6 +7,31 @@ class ServiceActions(Enum):
     STOP = "stop"
     START = "start"
 
+class StationResources(Enum):
+    FILES = "files"
+    MOUNT_POINTS = "mount_points"
+    PLAYLISTS = "playlists"
+    PODCASTS = "podcasts"
+    REMOTE_RELAYS = "remote_relays"
+    SFTP_USERS = "sftp_users"
+    HLS_STREAMS = "hls_streams"
+    STREAMERS = "streamers"
+    WEBHOOKS = "webhooks"
+
+class DuplicateActions(Enum):
+    SKIP = "skip"
+    MOVE = "move"
+    UPLOAD = "upload"
+
+class Resolutions(Enum):
+    RAW = "raw"
+    MINUTE = "minute"
+    HOUR = "hour"
+
+class SessionEvents(Enum):
+    START = "start"
+    END = "end"
+
 class GlobalPermissions(Enum):
     ADMINISTER_ALL = "administer all"
     VIEW_ADMINISTRATION = "view administration"
@@ -0,0 +1,6 @@
+from .mirror import LibraryMirror
+from .search_index import SearchIndex
+from .upload_manifest import UploadManifest
+from .upload_job import UploadJob
+from .episode_publish_job import EpisodePublishJob
+from .podcast_feed_writer import PodcastFeedWriter
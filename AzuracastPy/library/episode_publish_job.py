@@ -0,0 +1,287 @@
+"""Class for resumable bulk publishing of podcast episodes."""
+
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlencode
+
+from ..constants import API_ENDPOINTS
+from ..exceptions import ClientException
+from ..util.general_util import get_page_rows
+from ..models.podcast_episode import PodcastEpisode
+from .journaled_job import JournaledJob, RETRYABLE_ERRORS
+
+_EPISODES_PER_PAGE = 100
+
+def _entry_key(entry: Dict[str, Any]) -> str:
+    return entry.get('key') or entry.get('media') or entry['title']
+
+class EpisodePublishJob(JournaledJob):
+    """
+    A bulk publish of podcast episodes, with their audio and art, that can be stopped and resumed.
+
+    Each episode is created and then has its media and art uploaded. Several episodes are
+    published at the same time, and every file is streamed from disk, so memory use stays the
+    same however large the files are.
+
+    Every finished step is appended to a journal file. When a job is started again with the same
+    journal, the episodes it created are checked against the podcast and each episode picks up
+    from the step it stopped at. Uploads are retried, but creating an episode isn't: when it
+    fails, the podcast is searched for an episode with the same title before it's created again.
+
+    Each episode in the manifest is a dictionary with a ``title`` and a ``description``, and
+    optionally ``explicit``, the system paths of its ``media`` and ``art`` files, and a ``key``
+    that identifies it in the journal. The ``key`` defaults to the ``media`` path, or the
+    ``title`` for episodes without media.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.library import EpisodePublishJob
+
+        episodes = [
+            {
+                "title": f"Episode {number}",
+                "description": f"The {number}th episode.",
+                "media": f"/home/me/season-1/episode-{number}.mp3",
+                "art": f"/home/me/season-1/episode-{number}.jpg"
+            }
+            for number in range(1, 51)
+        ]
+
+        job = EpisodePublishJob(podcast, episodes, "season-1.journal", workers=4)
+        result = job.run()
+
+        for key, error in job.failures.items():
+            print(key, error)
+    """
+    _OWNER = "podcast"
+    _KEY_FIELD = "key"
+
+    def __init__(
+        self,
+        podcast,
+        episodes: Iterable[Dict[str, Any]],
+        journal: str,
+        workers: Optional[int] = None,
+        retries: Optional[int] = None,
+        retry_delay: Optional[float] = None
+    ):
+        """
+        Initializes an :class:`EpisodePublishJob` instance.
+
+        :param podcast: The :class:`~.models.Podcast` the episodes will be published to.
+        :param episodes: The manifest of episodes to publish.
+        :param journal: Path to the journal file that records the job's progress.
+            The file is created if it doesn't exist.
+        :param workers: (Optional) The number of episodes published at the same time.
+            Leave as ``None`` to use the value the job was started with, or ``4`` for a new job.
+            Default: ``None``.
+        :param retries: (Optional) The number of times a failed step is retried.
+            Leave as ``None`` to use the value the job was started with, or ``3`` for a new job.
+            Default: ``None``.
+        :param retry_delay: (Optional) The number of seconds to wait before the first retry.
+            The wait doubles with every retry. Leave as ``None`` to use the value the job was
+            started with, or ``1.0`` for a new job. Default: ``None``.
+        """
+        self._podcast = podcast
+        self._episodes = self._validate_episodes(episodes)
+        self._by_key = {_entry_key(entry): entry for entry in self._episodes}
+        self._progress: Dict[str, Dict[str, Any]] = {}
+        # Episodes whose creation failed, which the station may have created anyway.
+        self._uncertain: Set[str] = set()
+        self._claimed_lock = threading.Lock()
+
+        super().__init__(podcast.id, journal, workers, retries, retry_delay)
+
+    def __repr__(self):
+        return f"EpisodePublishJob(journal={self._journal_path!r}, "\
+               f"episodes={len(self._episodes)}, published={len(self.published)})"
+
+    @property
+    def published(self) -> Dict[str, str]:
+        """The IDs of the episodes that were fully published, mapped by their key."""
+        return {
+            key: progress['id'] for key, progress in list(self._progress.items())
+            if self._is_published(key)
+        }
+
+    def run(self) -> Dict[str, int]:
+        """
+        Publishes every episode that hasn't been published yet.
+
+        Episodes recorded in the journal are verified against the podcast first, so episodes
+        that were deleted since are published again. Episodes that still fail after all retries
+        are listed in :attr:`failures` and resumed the next time the job runs.
+
+        :returns: A dictionary with the number of ``"published"``, ``"skipped"`` (already
+            published) and ``"failed"`` episodes.
+
+        Usage:
+
+        .. code-block:: python
+
+            result = job.run()
+        """
+        self._start()
+        self._verify_created_episodes()
+
+        pending = [entry for entry in self._episodes if not self._is_published(_entry_key(entry))]
+
+        skipped = len(self._episodes) - len(pending)
+        published = self._run_all(self._publish, pending)
+
+        return {
+            "published": published,
+            "skipped": skipped,
+            "failed": len(self.failures)
+        }
+
+    def _publish(self, entry) -> bool:
+        key = _entry_key(entry)
+        progress = self._progress.setdefault(key, {})
+
+        try:
+            if 'id' in progress:
+                episode = self._attempt(lambda: self._podcast.episode(progress['id']))
+            else:
+                episode = self._create(key, entry)
+
+            for step, upload in (("media", episode.upload_media), ("art", episode.upload_art)):
+                if entry.get(step) and not progress.get(step):
+                    self._attempt(lambda: upload(entry[step]))
+                    self._record_step(key, step)
+        except (ClientException, ValueError, *RETRYABLE_ERRORS) as error:
+            return self._record_failure(key, error)
+
+        return True
+
+    def _create(self, key, entry):
+        # Creating an episode isn't idempotent, so it's never retried: a request that timed out
+        # may have created the episode anyway. The podcast is searched for it instead, and the
+        # episode is created again on the next run if it isn't there.
+        try:
+            episode = self._podcast.episode.create(
+                entry['title'], entry['description'], entry.get('explicit', False)
+            )
+        except RETRYABLE_ERRORS:
+            self._uncertain.add(key)
+            self._write_journal_entry({"event": "create_failed", "key": key})
+
+            existing = self._claim_by_title(key, entry['title'], self._attempt(self._list_episodes))
+
+            if existing is None:
+                raise
+
+            episode = PodcastEpisode(**existing, _podcast=self._podcast)
+
+        self._uncertain.discard(key)
+        self._record_step(key, "created", id=episode.id)
+
+        return episode
+
+    def _claim_by_title(self, key, title, listing) -> Optional[Dict[str, Any]]:
+        # Matches the entry with an episode of the title that no other entry was matched with.
+        with self._claimed_lock:
+            claimed = {progress.get('id') for progress in self._progress.values()}
+
+            for episode in listing:
+                if episode['title'] == title and episode['id'] not in claimed:
+                    self._progress.setdefault(key, {})['id'] = episode['id']
+                    return episode
+
+        return None
+
+    def _record_step(self, key, step, **fields):
+        self._write_journal_entry({"event": step, "key": key, **fields})
+
+        progress = self._progress.setdefault(key, {})
+        progress.update(fields)
+        progress[step] = True
+
+    def _is_published(self, key) -> bool:
+        progress = self._progress.get(key)
+
+        if not progress or 'id' not in progress or key not in self._by_key:
+            return False
+
+        entry = self._by_key[key]
+
+        return all(progress.get(step) for step in ("media", "art") if entry.get(step))
+
+    def _verify_created_episodes(self):
+        has_created = any('id' in progress for progress in self._progress.values())
+        uncertain = [key for key in self._uncertain if key in self._by_key]
+
+        if not has_created and not uncertain:
+            return
+
+        # Checked against one listing of the podcast's episodes.
+        listing = self._list_episodes()
+        on_podcast = {episode['id'] for episode in listing}
+
+        for key, progress in list(self._progress.items()):
+            if progress.get('id') not in on_podcast:
+                del self._progress[key]
+
+        # Episodes whose creation failed on an earlier run are picked up if the station created
+        # them after all.
+        for key in uncertain:
+            existing = self._claim_by_title(key, self._by_key[key]['title'], listing)
+
+            if existing is not None:
+                self._record_step(key, "created", id=existing['id'])
+                self._uncertain.discard(key)
+
+    def _list_episodes(self) -> List[Dict[str, Any]]:
+        url = API_ENDPOINTS["podcast_episodes"].format(
+            radio_url=self._podcast._station._request_handler.radio_url,
+            station_id=self._podcast._station.id,
+            podcast_id=self._podcast.id
+        )
+
+        episodes = []
+        page = 1
+
+        while True:
+            response = self._podcast._station._request_handler.get(
+                f"{url}?{urlencode({'page': page, 'per_page': _EPISODES_PER_PAGE})}"
+            )
+            rows, has_more = get_page_rows(response, page, _EPISODES_PER_PAGE)
+            episodes.extend(rows)
+
+            if not has_more:
+                return episodes
+
+            page += 1
+
+    def _validate_episodes(self, episodes) -> List[Dict[str, Any]]:
+        episodes = list(episodes)
+        keys = set()
+
+        for entry in episodes:
+            if not entry.get('title') or not entry.get('description'):
+                raise ClientException("Each episode must have a title and a description.")
+
+            for step in ("media", "art"):
+                if entry.get(step) and not os.path.isfile(entry[step]):
+                    raise ClientException(f"File does not exist: {entry[step]}")
+
+            key = _entry_key(entry)
+
+            if key in keys:
+                raise ClientException(f"More than one episode has the key '{key}'.")
+
+            keys.add(key)
+
+        return episodes
+
+    def _replay(self, entry):
+        if entry['event'] == "created":
+            self._progress[entry['key']] = {"id": entry['id']}
+            self._uncertain.discard(entry['key'])
+        elif entry['event'] == "create_failed":
+            self._uncertain.add(entry['key'])
+        elif entry['event'] in ("media", "art") and entry['key'] in self._progress:
+            self._progress[entry['key']][entry['event']] = True
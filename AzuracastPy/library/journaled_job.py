@@ -0,0 +1,202 @@
+"""Base class for bulk jobs that record their progress in a journal so they can be resumed."""
+
+import json
+import os
+from abc import ABC, abstractmethod
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import requests
+
+from ..exceptions import (
+    AzuracastAPIException,
+    UnexpectedErrorException,
+    ClientException
+)
+
+# Errors that usually go away on their own, e.g. dropped connections or a restarting station.
+RETRYABLE_ERRORS = (
+    requests.RequestException,
+    AzuracastAPIException,
+    UnexpectedErrorException
+)
+
+_DEFAULT_WORKERS = 4
+_DEFAULT_RETRIES = 3
+_DEFAULT_RETRY_DELAY = 1.0
+
+class JournaledJob(ABC):
+    """
+    The journal, retries and worker pool shared by :class:`~.library.UploadJob` and
+    :class:`~.library.EpisodePublishJob`.
+
+    The journal is a file of JSON lines. A job starts by appending a ``"started"`` entry with its
+    settings and the ID of the object it works on, and then appends an entry for every step it
+    finishes. Subclasses set ``_OWNER`` and ``_KEY_FIELD``, and read their own entries back in
+    :meth:`_replay`.
+
+    .. note::
+
+        This class should not be initialized directly.
+    """
+    # The kind of object the job works on, e.g. "station", and the journal field of its items.
+    _OWNER = None
+    _KEY_FIELD = None
+
+    def __init__(
+        self,
+        owner_id: Any,
+        journal: str,
+        workers: Optional[int],
+        retries: Optional[int],
+        retry_delay: Optional[float]
+    ):
+        self._owner_id = str(owner_id)
+        self._journal_path = journal
+        self._journal_lock = threading.Lock()
+
+        settings = self._read_journal() or {}
+        owner_field = f"{self._OWNER}_id"
+
+        if settings and settings[owner_field] != self._owner_id:
+            message = f"The journal at '{journal}' belongs to the {self._OWNER} with an id of "\
+                      f"'{settings[owner_field]}', not '{owner_id}'."
+            raise ClientException(message)
+
+        # Settings that aren't passed in are carried over from the run that wrote the journal.
+        self.workers = workers if workers is not None else \
+            settings.get('workers', _DEFAULT_WORKERS)
+        self.retries = retries if retries is not None else \
+            settings.get('retries', _DEFAULT_RETRIES)
+        self.retry_delay = retry_delay if retry_delay is not None else \
+            settings.get('retry_delay', _DEFAULT_RETRY_DELAY)
+
+        if self.workers < 1:
+            raise ClientException("workers param must be at least 1.")
+
+        if self.retries < 0:
+            raise ClientException("retries param cannot be negative.")
+
+        self.failures: Dict[str, str] = {}
+
+    @abstractmethod
+    def _replay(self, entry: Dict[str, Any]):
+        # Called with every entry of an existing journal, other than "started" ones.
+        ...
+
+    def _start(self):
+        self.failures = {}
+
+        self._write_journal_entry({
+            "event": "started",
+            f"{self._OWNER}_id": self._owner_id,
+            "workers": self.workers,
+            "retries": self.retries,
+            "retry_delay": self.retry_delay
+        })
+
+    def _run_all(
+        self,
+        function: Callable[..., bool],
+        items: Iterable[Any]
+    ) -> int:
+        # Calls 'function' on every item in the worker pool and counts the calls that succeeded.
+        # Only a few items are queued at a time, so stopping the job doesn't leave the rest of a
+        # large job queued behind.
+        succeeded = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            items = iter(items)
+            in_flight = set()
+
+            try:
+                while True:
+                    for item in items:
+                        in_flight.add(executor.submit(function, item))
+
+                        if len(in_flight) >= self.workers * 2:
+                            break
+
+                    if not in_flight:
+                        break
+
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    succeeded += sum(1 for future in done if future.result())
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+        return succeeded
+
+    def _attempt(
+        self,
+        step: Callable[[], Any],
+        recover: Optional[Callable[[], Any]] = None
+    ) -> Any:
+        # Calls 'step', retrying it on transient errors with an exponential backoff. Before every
+        # retry, 'recover' is called if given, and its result is returned instead when it isn't
+        # None. Steps that aren't idempotent use it to check whether a failed attempt went
+        # through after all.
+        attempt = 0
+
+        while True:
+            try:
+                if attempt and recover is not None:
+                    recovered = recover()
+
+                    if recovered is not None:
+                        return recovered
+
+                return step()
+            except RETRYABLE_ERRORS:
+                if attempt >= self.retries:
+                    raise
+
+                time.sleep(self.retry_delay * 2 ** attempt)
+                attempt += 1
+
+    def _record_failure(self, key: str, error: Exception) -> bool:
+        self.failures[key] = str(error)
+        self._write_journal_entry({"event": "failed", self._KEY_FIELD: key, "error": str(error)})
+
+        return False
+
+    def _read_journal(self) -> Optional[Dict[str, Any]]:
+        # Replays the journal and returns the settings of the last run, if there was one.
+        settings = None
+
+        if not os.path.isfile(self._journal_path):
+            return settings
+
+        with open(self._journal_path, encoding="utf-8") as journal:
+            lines = journal.readlines()
+
+        # A process that died mid-write leaves a partial last line. It's ignored, and a newline
+        # is added so the next entry doesn't get appended to it.
+        if lines and not lines[-1].endswith("\n"):
+            with open(self._journal_path, "a", encoding="utf-8") as journal:
+                journal.write("\n")
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+
+            if entry['event'] == "started":
+                settings = entry
+            else:
+                self._replay(entry)
+
+        return settings
+
+    def _write_journal_entry(self, entry: Dict[str, Any]):
+        line = json.dumps(entry) + "\n"
+
+        with self._journal_lock:
+            with open(self._journal_path, "a", encoding="utf-8") as journal:
+                journal.write(line)
+                journal.flush()
+                os.fsync(journal.fileno())
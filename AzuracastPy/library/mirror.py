@@ -0,0 +1,426 @@
+"""Class for a local SQLite mirror of a station's media library."""
+
+import json
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+from ..exceptions import ClientException
+from ..models.station_file import StationFile
+
+# Columns of the 'files' table that can be used in lookups.
+_SEARCHABLE_FIELDS = ("artist", "title", "album", "genre", "isrc", "lyrics", "path", "unique_id")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    unique_id TEXT,
+    song_id TEXT,
+    path TEXT,
+    artist TEXT,
+    title TEXT,
+    album TEXT,
+    genre TEXT,
+    isrc TEXT,
+    lyrics TEXT,
+    length REAL,
+    mtime INTEGER,
+    art_updated_at INTEGER,
+    signature TEXT NOT NULL,
+    raw TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS file_playlists (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    playlist_id INTEGER NOT NULL,
+    playlist_name TEXT,
+    weight INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS file_custom_fields (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT
+);
+
+CREATE INDEX IF NOT EXISTS files_unique_id ON files(unique_id);
+CREATE INDEX IF NOT EXISTS files_path ON files(path);
+CREATE INDEX IF NOT EXISTS files_artist ON files(artist);
+CREATE INDEX IF NOT EXISTS files_album ON files(album);
+CREATE INDEX IF NOT EXISTS files_genre ON files(genre);
+CREATE INDEX IF NOT EXISTS files_isrc ON files(isrc);
+CREATE INDEX IF NOT EXISTS file_playlists_file ON file_playlists(file_id);
+CREATE INDEX IF NOT EXISTS file_playlists_name ON file_playlists(playlist_name);
+CREATE INDEX IF NOT EXISTS file_custom_fields_file ON file_custom_fields(file_id);
+CREATE INDEX IF NOT EXISTS file_custom_fields_name ON file_custom_fields(name, value);
+"""
+
+def _file_signature(file: Dict[str, Any]) -> str:
+    # mtime changes whenever the file or its tags are rewritten and art_updated_at whenever the
+    # art changes. Playlist memberships, including the playlists' names, and custom fields are
+    # stored in tables of their own and don't always change mtime, so they're tracked as well.
+    playlists = sorted(
+        (playlist['id'], playlist.get('name'), playlist.get('weight'))
+        for playlist in file.get('playlists') or []
+    )
+    custom_fields = sorted((file.get('custom_fields') or {}).items())
+
+    return json.dumps([
+        file.get('unique_id'), file.get('mtime'), file.get('art_updated_at'), playlists,
+        custom_fields
+    ], default=str)
+
+class LibraryMirror:
+    """
+    A local SQLite copy of a station's uploaded media files.
+
+    The mirror is filled by :meth:`sync`, which only writes the files that were added, changed or
+    removed since the previous sync. Every lookup afterwards is answered from the local database.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.library import LibraryMirror
+
+        station = client.station(1)
+
+        with LibraryMirror(station, "library.sqlite3") as mirror:
+            mirror.sync()
+
+            files_without_isrc = mirror.files_missing("isrc")
+            orphaned_files = mirror.files_without_playlist()
+    """
+    def __init__(
+        self,
+        station,
+        database: str = ":memory:"
+    ):
+        """
+        Initializes a :class:`LibraryMirror` instance.
+
+        :param station: The :class:`~.models.Station` whose files will be mirrored.
+        :param database: (Optional) Path to the SQLite database file. The file is created if it
+            doesn't exist. Default: ``":memory:"``.
+        """
+        self._station = station
+        self._connection = sqlite3.connect(database)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+
+        stored_station_id = self._get_meta("station_id")
+
+        if stored_station_id is not None and stored_station_id != str(station.id):
+            message = f"The database at '{database}' mirrors the station with an id of "\
+                      f"'{stored_station_id}', not '{station.id}'."
+            raise ClientException(message)
+
+        self._set_meta("station_id", str(station.id))
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self):
+        """
+        Closes the connection to the database.
+
+        Usage:
+
+        .. code-block:: python
+
+            mirror.close()
+        """
+        self._connection.close()
+
+    @property
+    def last_synced_at(self) -> Optional[int]:
+        """The UNIX timestamp of the last completed sync, or ``None`` if it never synced."""
+        value = self._get_meta("last_synced_at")
+
+        return int(value) if value is not None else None
+
+    def sync(self) -> Dict[str, int]:
+        """
+        Brings the mirror up to date with the station's files.
+
+        Files are compared using their ``unique_id``, ``mtime``, ``art_updated_at`` and
+        playlists, so only new, changed and deleted files are written to the database.
+
+        :returns: A dictionary with the number of ``"added"``, ``"updated"``, ``"removed"`` and
+            ``"unchanged"`` files.
+
+        Usage:
+
+        .. code-block:: python
+
+            result = mirror.sync()
+        """
+        response = self._station._request_multiple_instances_of("station_files")
+
+        stored = dict(self._connection.execute("SELECT id, signature FROM files"))
+
+        added = []
+        updated = []
+        for file in response:
+            signature = _file_signature(file)
+            stored_signature = stored.pop(file['id'], None)
+
+            if stored_signature is None:
+                added.append((file, signature))
+            elif stored_signature != signature:
+                updated.append((file, signature))
+
+        removed = list(stored)
+
+        with self._connection:
+            if removed:
+                self._connection.executemany(
+                    "DELETE FROM files WHERE id = ?",
+                    [(id,) for id in removed]
+                )
+
+            if updated:
+                self._connection.executemany(
+                    "DELETE FROM files WHERE id = ?",
+                    [(file['id'],) for file, _ in updated]
+                )
+
+            self._insert_files(added + updated)
+            self._set_meta("last_synced_at", str(int(time.time())))
+
+        return {
+            "added": len(added),
+            "updated": len(updated),
+            "removed": len(removed),
+            "unchanged": len(response) - len(added) - len(updated)
+        }
+
+    def file(
+        self,
+        id: int
+    ) -> Optional[StationFile]:
+        """
+        Retrieves a specific file from the mirror.
+
+        :param id: The numerical ID of the file to be retrieved.
+
+        :returns: A :class:`.StationFile` object, or ``None`` if the file isn't in the mirror.
+
+        Usage:
+
+        .. code-block:: python
+
+            file = mirror.file(1)
+        """
+        files = self._select("SELECT raw FROM files WHERE id = ?", (id,))
+
+        return files[0] if files else None
+
+    def files(self) -> List[StationFile]:
+        """
+        Retrieves every file in the mirror.
+
+        :returns: A list of :class:`.StationFile` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            files = mirror.files()
+        """
+        return self._select("SELECT raw FROM files ORDER BY id")
+
+    def find(
+        self,
+        **fields: str
+    ) -> List[StationFile]:
+        """
+        Retrieves the files whose fields exactly match the given values.
+
+        :param fields: The values to match. Valid fields are ``artist``, ``title``, ``album``,
+            ``genre``, ``isrc``, ``lyrics``, ``path`` and ``unique_id``.
+
+        :returns: A list of :class:`.StationFile` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            files = mirror.find(artist="Cochise", album="THE INSPECTION")
+        """
+        if not fields:
+            raise ClientException("At least one field must be provided.")
+
+        for field in fields:
+            self._validate_field(field)
+
+        conditions = " AND ".join(f"{field} = ?" for field in fields)
+
+        return self._select(
+            f"SELECT raw FROM files WHERE {conditions} ORDER BY id",
+            tuple(fields.values())
+        )
+
+    def files_missing(
+        self,
+        field: str
+    ) -> List[StationFile]:
+        """
+        Retrieves the files that have no value for a field.
+
+        :param field: The field to check. Valid fields are ``artist``, ``title``, ``album``,
+            ``genre``, ``isrc``, ``lyrics``, ``path`` and ``unique_id``.
+
+        :returns: A list of :class:`.StationFile` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            files_without_isrc = mirror.files_missing("isrc")
+        """
+        self._validate_field(field)
+
+        return self._select(
+            f"SELECT raw FROM files WHERE {field} IS NULL OR {field} = '' ORDER BY id"
+        )
+
+    def files_in_playlist(
+        self,
+        name: str
+    ) -> List[StationFile]:
+        """
+        Retrieves the files that are in a playlist.
+
+        :param name: The name of the playlist.
+
+        :returns: A list of :class:`.StationFile` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            files = mirror.files_in_playlist("Morning show")
+        """
+        return self._select(
+            "SELECT raw FROM files WHERE id IN "
+            "(SELECT file_id FROM file_playlists WHERE playlist_name = ?) ORDER BY id",
+            (name,)
+        )
+
+    def files_without_playlist(self) -> List[StationFile]:
+        """
+        Retrieves the files that aren't in any playlist.
+
+        :returns: A list of :class:`.StationFile` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            orphaned_files = mirror.files_without_playlist()
+        """
+        return self._select(
+            "SELECT raw FROM files WHERE id NOT IN "
+            "(SELECT file_id FROM file_playlists) ORDER BY id"
+        )
+
+    def files_with_custom_field(
+        self,
+        name: str,
+        value: Optional[str] = None
+    ) -> List[StationFile]:
+        """
+        Retrieves the files that have a value set for a custom field.
+
+        :param name: The short name of the custom field.
+        :param value: (Optional) The exact value the custom field must have. Leave as ``None`` to
+            match any non-empty value. Default: ``None``.
+
+        :returns: A list of :class:`.StationFile` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            files = mirror.files_with_custom_field("label", "Self-released")
+        """
+        if value is None:
+            query = "SELECT file_id FROM file_custom_fields "\
+                    "WHERE name = ? AND value IS NOT NULL AND value != ''"
+            params = (name,)
+        else:
+            query = "SELECT file_id FROM file_custom_fields WHERE name = ? AND value = ?"
+            params = (name, value)
+
+        return self._select(f"SELECT raw FROM files WHERE id IN ({query}) ORDER BY id", params)
+
+    def _insert_files(self, files):
+        self._connection.executemany(
+            "INSERT INTO files (id, unique_id, song_id, path, artist, title, album, genre, isrc, "
+            "lyrics, length, mtime, art_updated_at, signature, raw) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    file['id'], file.get('unique_id'), file.get('song_id'), file.get('path'),
+                    file.get('artist'), file.get('title'), file.get('album'), file.get('genre'),
+                    file.get('isrc'), file.get('lyrics'), file.get('length'), file.get('mtime'),
+                    file.get('art_updated_at'), signature, json.dumps(file)
+                )
+                for file, signature in files
+            ]
+        )
+
+        self._connection.executemany(
+            "INSERT INTO file_playlists (file_id, playlist_id, playlist_name, weight) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (file['id'], playlist['id'], playlist.get('name'), playlist.get('weight'))
+                for file, _ in files
+                for playlist in file.get('playlists') or []
+            ]
+        )
+
+        self._connection.executemany(
+            "INSERT INTO file_custom_fields (file_id, name, value) VALUES (?, ?, ?)",
+            [
+                (file['id'], name, value)
+                for file, _ in files
+                for name, value in (file.get('custom_fields') or {}).items()
+            ]
+        )
+
+    def _select(self, query, params=()) -> List[StationFile]:
+        return [
+            StationFile(**json.loads(raw), _station=self._station)
+            for (raw,) in self._connection.execute(query, params)
+        ]
+
+    def _validate_field(self, field):
+        if field not in _SEARCHABLE_FIELDS:
+            message = f"'{field}' is not a searchable field. Valid fields: "\
+                      f"{', '.join(_SEARCHABLE_FIELDS)}."
+            raise ClientException(message)
+
+    def _get_meta(self, key):
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, value)
+        )
@@ -0,0 +1,320 @@
+"""Class for incrementally writing the RSS feed of a podcast."""
+
+import hashlib
+import json
+import mimetypes
+import os
+import sqlite3
+import time
+from email.utils import formatdate
+from typing import Any, Dict, Iterable, Optional, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from ..models.podcast_episode import PodcastEpisode
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    id TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    publish_at INTEGER NOT NULL,
+    xml TEXT NOT NULL,
+    generation INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS episodes_publish_at ON episodes(publish_at);
+"""
+
+_ITUNES_NAMESPACE = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+
+def _episode_fields(episode: Union[PodcastEpisode, Dict[str, Any]]) -> Dict[str, Any]:
+    # The data an episode's <item> is rendered from, from an object or an API dictionary.
+    if isinstance(episode, PodcastEpisode):
+        media, links = episode.media, episode.links
+        fields = {
+            "id": episode.id,
+            "title": episode.title,
+            "description": episode.description,
+            "explicit": episode.explicit,
+            "publish_at": episode.publish_at,
+            "has_media": episode.has_media,
+            "media_name": media.original_name if media else None,
+            "media_length": media.length if media else None,
+            "media_size": media.size if media else None,
+            "download": links.download if links else None,
+            "art": episode.art if episode.has_custom_art else None
+        }
+    else:
+        media, links = episode.get('media') or {}, episode.get('links') or {}
+        fields = {
+            "id": episode.get('id'),
+            "title": episode.get('title'),
+            "description": episode.get('description'),
+            "explicit": episode.get('explicit'),
+            "publish_at": episode.get('publish_at'),
+            "has_media": episode.get('has_media'),
+            "media_name": media.get('original_name'),
+            "media_length": media.get('length'),
+            "media_size": media.get('size'),
+            "download": links.get('download'),
+            "art": episode.get('art') if episode.get('has_custom_art') else None
+        }
+
+    try:
+        fields["publish_at"] = int(fields["publish_at"])
+    except (TypeError, ValueError):
+        fields["publish_at"] = 0
+
+    return fields
+
+def _render_episode(fields: Dict[str, Any], podcast_art: Optional[str]) -> str:
+    media_type = mimetypes.guess_type(fields["media_name"] or "")[0] or "audio/mpeg"
+    length = int(fields["media_length"] or 0)
+    # The enclosure's length is its size in bytes, not the episode's duration. The RSS best
+    # practices profile asks for 0 when the size can't be determined.
+    size = int(fields["media_size"] or 0)
+
+    lines = [
+        "    <item>",
+        f"      <title>{escape(fields['title'] or '')}</title>",
+        f"      <description>{escape(fields['description'] or '')}</description>",
+        f"      <guid isPermaLink=\"false\">{escape(str(fields['id']))}</guid>",
+        f"      <enclosure url={quoteattr(fields['download'] or '')} length=\"{size}\" "
+        f"type={quoteattr(media_type)}/>",
+        f"      <itunes:duration>{length // 3600:02d}:{length % 3600 // 60:02d}:"
+        f"{length % 60:02d}</itunes:duration>",
+        f"      <itunes:explicit>{'true' if fields['explicit'] else 'false'}</itunes:explicit>"
+    ]
+
+    if fields["publish_at"]:
+        lines.append(f"      <pubDate>{formatdate(fields['publish_at'], usegmt=True)}</pubDate>")
+
+    art = fields["art"] or podcast_art
+    if art:
+        lines.append(f"      <itunes:image href={quoteattr(art)}/>")
+
+    lines.append("    </item>")
+
+    return "\n".join(lines) + "\n"
+
+def _render_categories(categories) -> str:
+    # Categories are stored as "Category" or "Category|Subcategory", e.g. "Arts|Books".
+    grouped: Dict[str, list] = {}
+    for category in categories or []:
+        parent, _, child = category.partition("|")
+        children = grouped.setdefault(parent, [])
+
+        if child:
+            children.append(child)
+
+    lines = []
+    for parent, children in grouped.items():
+        if not children:
+            lines.append(f"    <itunes:category text={quoteattr(parent)}/>")
+            continue
+
+        lines.append(f"    <itunes:category text={quoteattr(parent)}>")
+        lines.extend(f"      <itunes:category text={quoteattr(child)}/>" for child in children)
+        lines.append("    </itunes:category>")
+
+    return "".join(line + "\n" for line in lines)
+
+class PodcastFeedWriter:
+    """
+    Writes the RSS feed, with iTunes tags, of a podcast to a local file.
+
+    The rendered ``<item>`` of every episode is kept in a SQLite state file next to the feed,
+    along with a digest of the data it was rendered from. When the feed is updated, only the
+    episodes that were added or changed are rendered again, and episodes that are gone are
+    dropped. The feed is written out from the state file one episode at a time, so memory use
+    stays the same for feeds with thousands of episodes.
+
+    Like AzuraCast's own feed, only episodes with media whose publish time has passed are
+    included.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.library import PodcastFeedWriter
+
+        with PodcastFeedWriter(podcast, "feeds/my-podcast.xml") as writer:
+            result = writer.update()
+
+        print(result)
+    """
+    def __init__(
+        self,
+        podcast,
+        path: str,
+        state: Optional[str] = None
+    ):
+        """
+        Initializes a :class:`PodcastFeedWriter` instance.
+
+        :param podcast: The :class:`~.models.Podcast` whose feed is written.
+        :param path: Path to the feed file. It's replaced every time the feed is updated.
+        :param state: (Optional) Path to the SQLite state file of the feed. The file is created
+            if it doesn't exist. Leave as ``None`` to use ``path`` with ``.state`` added.
+            Default: ``None``.
+        """
+        self._podcast = podcast
+        self._path = path
+
+        self._connection = sqlite3.connect(state or f"{path}.state")
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM episodes").fetchone()[0]
+
+    def __repr__(self):
+        return f"PodcastFeedWriter(path={self._path!r}, episodes={len(self)})"
+
+    def close(self):
+        """
+        Closes the connection to the state file.
+
+        Usage:
+
+        .. code-block:: python
+
+            writer.close()
+        """
+        self._connection.close()
+
+    def update(
+        self,
+        episodes: Optional[Iterable[Union[PodcastEpisode, Dict[str, Any]]]] = None
+    ) -> Dict[str, int]:
+        """
+        Brings the feed up to date with the podcast's episodes and writes it out.
+
+        :param episodes: (Optional) Every episode of the podcast, as
+            :class:`~.models.PodcastEpisode` objects or the episode dictionaries returned by
+            the API. Episodes that aren't listed are removed from the feed. Leave as ``None``
+            to fetch the episodes a page at a time with :meth:`~.models.Station.iter_episodes`.
+            Default: ``None``.
+
+        :returns: A dictionary with the number of episodes that were ``"rendered"`` (added or
+            changed), ``"unchanged"`` and ``"removed"``.
+
+        Usage:
+
+        .. code-block:: python
+
+            result = writer.update()
+
+            # With episodes fetched for every podcast of the station at once:
+            episodes = [e for e in station.iter_episodes() if e._podcast.id == podcast.id]
+            result = writer.update(episodes)
+        """
+        if episodes is None:
+            episodes = self._podcast._station.iter_episodes(podcasts=[self._podcast])
+
+        podcast_art = self._podcast.art
+        now = time.time()
+
+        generation = self._connection.execute(
+            "SELECT COALESCE(MAX(generation), 0) + 1 FROM episodes"
+        ).fetchone()[0]
+
+        rendered = unchanged = 0
+
+        with self._connection:
+            for episode in episodes:
+                fields = _episode_fields(episode)
+
+                if not fields["has_media"] or fields["publish_at"] > now:
+                    continue
+
+                digest = hashlib.blake2b(
+                    json.dumps([fields, podcast_art], sort_keys=True, default=str).encode(),
+                    digest_size=16
+                ).hexdigest()
+
+                row = self._connection.execute(
+                    "SELECT digest FROM episodes WHERE id = ?", (fields["id"],)
+                ).fetchone()
+
+                if row is not None and row[0] == digest:
+                    self._connection.execute(
+                        "UPDATE episodes SET generation = ? WHERE id = ?",
+                        (generation, fields["id"])
+                    )
+                    unchanged += 1
+                    continue
+
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO episodes (id, digest, publish_at, xml, generation) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        fields["id"], digest, fields["publish_at"],
+                        _render_episode(fields, podcast_art), generation
+                    )
+                )
+                rendered += 1
+
+            removed = self._connection.execute(
+                "DELETE FROM episodes WHERE generation != ?", (generation,)
+            ).rowcount
+
+        self.write()
+
+        return {"rendered": rendered, "unchanged": unchanged, "removed": removed}
+
+    def write(self):
+        """
+        Writes the feed file from the episodes already in the state file, without fetching
+        anything.
+
+        The feed is written to a temporary file first, so readers never see half a feed.
+
+        Usage:
+
+        .. code-block:: python
+
+            writer.write()
+        """
+        temporary = f"{self._path}.tmp"
+
+        with open(temporary, "w", encoding="utf-8") as feed:
+            feed.write(self._render_header())
+
+            for (xml,) in self._connection.execute(
+                "SELECT xml FROM episodes ORDER BY publish_at DESC, id"
+            ):
+                feed.write(xml)
+
+            feed.write("  </channel>\n</rss>\n")
+
+        os.replace(temporary, self._path)
+
+    def _render_header(self) -> str:
+        podcast = self._podcast
+
+        lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            f'<rss version="2.0" xmlns:itunes="{_ITUNES_NAMESPACE}">',
+            "  <channel>",
+            f"    <title>{escape(podcast.title or '')}</title>",
+            f"    <link>{escape(podcast.link or '')}</link>",
+            f"    <description>{escape(podcast.description or '')}</description>",
+            f"    <language>{escape(podcast.language or '')}</language>",
+            f"    <lastBuildDate>{formatdate(usegmt=True)}</lastBuildDate>",
+            f"    <itunes:author>{escape(podcast.author or '')}</itunes:author>",
+            "    <itunes:owner>",
+            f"      <itunes:name>{escape(podcast.author or '')}</itunes:name>",
+            f"      <itunes:email>{escape(podcast.email or '')}</itunes:email>",
+            "    </itunes:owner>"
+        ]
+
+        if podcast.art:
+            lines.append(f"    <itunes:image href={quoteattr(podcast.art)}/>")
+
+        return "\n".join(lines) + "\n" + _render_categories(podcast.categories)
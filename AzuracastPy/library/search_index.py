@@ -0,0 +1,372 @@
+"""Class for an in-memory search index over songs and media files."""
+
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from ..exceptions import ClientException
+from ..models.song import Song
+from ..models.station_file import StationFile
+from ..models.requestable_song import RequestableSong
+
+# Fields that are indexed, and how much a match on each of them counts towards the score.
+FIELD_WEIGHTS = {
+    "title": 1.0,
+    "artist": 1.0,
+    "isrc": 1.0,
+    "album": 0.6,
+    "path": 0.5,
+    "genre": 0.4
+}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# How many indexed words a single query word may expand to through prefix matching.
+_MAX_PREFIX_EXPANSIONS = 100
+
+# Query words shorter than this are only matched exactly or as a prefix.
+_MIN_FUZZY_LENGTH = 3
+
+def _normalize(text: str) -> str:
+    # Strips accents so "Beyoncé" and "beyonce" end up as the same token.
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+def _tokenize(text) -> List[str]:
+    if not text:
+        return []
+
+    return _TOKEN_PATTERN.findall(_normalize(str(text)))
+
+def _trigrams(token: str) -> Set[str]:
+    # Padding the start makes the first letters count, which helps prefix-style typing.
+    padded = f"$${token}"
+
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _get_key_and_fields(item) -> Tuple[Tuple[str, Any], Dict[str, Any]]:
+    if isinstance(item, RequestableSong):
+        song = item.song
+        key = ("request", item.request_id)
+        path = None
+    elif isinstance(item, StationFile):
+        song = item
+        key = ("file", item.id)
+        path = item.path
+    elif isinstance(item, Song):
+        song = item
+        key = ("song", item.id)
+        path = None
+    else:
+        message = "Only StationFile, RequestableSong and Song objects can be indexed."
+        raise ClientException(message)
+
+    fields = {
+        "title": song.title,
+        "artist": song.artist,
+        "isrc": song.isrc,
+        "album": song.album,
+        "path": path,
+        "genre": song.genre
+    }
+
+    return key, fields
+
+class SearchIndex:
+    """
+    An in-memory index for finding songs by their artist, title, album, genre, ISRC or path.
+
+    Matching is forgiving: query words match complete words, word prefixes (for search-as-you-type)
+    and misspelled words (through trigram similarity). Items can be added and removed at any time
+    without rebuilding the index.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.library import SearchIndex
+
+        index = SearchIndex()
+        index.add_all(station.requestable_songs())
+
+        results = index.search("cochise megamn")
+
+        if results:
+            station.request_song(results[0].request_id)
+    """
+    def __init__(
+        self,
+        similarity_threshold: float = 0.5
+    ):
+        """
+        Initializes a :class:`SearchIndex` instance.
+
+        :param similarity_threshold: (Optional) How similar, from ``0`` to ``1``, a misspelled
+            word must be to an indexed word to match it. Default: ``0.5``.
+        """
+        if not 0 < similarity_threshold <= 1:
+            raise ClientException("similarity_threshold param must be between 0 and 1.")
+
+        self._similarity_threshold = similarity_threshold
+
+        self._items: Dict[Any, Any] = {}
+        self._document_terms: Dict[Any, Set[str]] = {}
+        # term -> {key: best field weight of that term in the item}
+        self._postings: Dict[str, Dict[Any, float]] = defaultdict(dict)
+        # trigram -> terms containing it
+        self._trigram_terms: Dict[str, Set[str]] = defaultdict(set)
+        self._term_trigrams: Dict[str, Set[str]] = {}
+
+        # Sorted copy of the vocabulary for prefix lookups, rebuilt lazily after changes.
+        self._vocabulary: List[str] = []
+        self._vocabulary_is_stale = False
+        self._expansions: Dict[str, List[Tuple[str, float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item) -> bool:
+        return _get_key_and_fields(item)[0] in self._items
+
+    def add(
+        self,
+        item
+    ):
+        """
+        Adds an item to the index. An item that was already indexed is replaced.
+
+        :param item: A :class:`.StationFile`, :class:`.RequestableSong` or :class:`.Song` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            index.add(station.file(1))
+        """
+        key, fields = _get_key_and_fields(item)
+
+        if key in self._items:
+            self._remove_key(key)
+
+        terms = {}
+        for field, value in fields.items():
+            weight = FIELD_WEIGHTS[field]
+
+            for term in _tokenize(value):
+                if weight > terms.get(term, 0):
+                    terms[term] = weight
+
+        for term, weight in terms.items():
+            self._postings[term][key] = weight
+
+            if term not in self._term_trigrams:
+                trigrams = _trigrams(term)
+                self._term_trigrams[term] = trigrams
+
+                for trigram in trigrams:
+                    self._trigram_terms[trigram].add(term)
+
+                self._vocabulary_is_stale = True
+
+        self._items[key] = item
+        self._document_terms[key] = set(terms)
+
+    def add_all(
+        self,
+        items: Iterable[Any]
+    ):
+        """
+        Adds several items to the index.
+
+        :param items: :class:`.StationFile`, :class:`.RequestableSong` or :class:`.Song` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            index.add_all(station.files())
+        """
+        for item in items:
+            self.add(item)
+
+    def remove(
+        self,
+        item
+    ):
+        """
+        Removes an item from the index. Nothing happens if the item isn't indexed.
+
+        :param item: The :class:`.StationFile`, :class:`.RequestableSong` or :class:`.Song`
+            object to be removed.
+
+        Usage:
+
+        .. code-block:: python
+
+            index.remove(file)
+        """
+        key, _ = _get_key_and_fields(item)
+
+        if key in self._items:
+            self._remove_key(key)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10
+    ) -> List[Any]:
+        """
+        Finds the indexed items that best match a query.
+
+        Every word of the query must match a word of the item, either exactly, as a prefix or
+        approximately.
+
+        :param query: The text to search for.
+        :param limit: (Optional) The maximum number of items to return. Default: ``10``.
+
+        :returns: A list of the matching items, best match first.
+
+        Usage:
+
+        .. code-block:: python
+
+            results = index.search("never gonna")
+        """
+        return [item for item, _ in self.search_with_scores(query, limit)]
+
+    def search_with_scores(
+        self,
+        query: str,
+        limit: int = 10
+    ) -> List[Tuple[Any, float]]:
+        """
+        Finds the indexed items that best match a query, along with their scores.
+
+        :param query: The text to search for.
+        :param limit: (Optional) The maximum number of items to return. Default: ``10``.
+
+        :returns: A list of ``(item, score)`` tuples, best match first.
+
+        Usage:
+
+        .. code-block:: python
+
+            for item, score in index.search_with_scores("never gonna"):
+                print(score, item)
+        """
+        query_terms = set(_tokenize(query))
+
+        if not query_terms:
+            return []
+
+        scores = None
+        for query_term in query_terms:
+            term_scores = {}
+
+            for term, similarity in self._expand(query_term):
+                for key, weight in self._postings[term].items():
+                    score = similarity * weight
+
+                    if score > term_scores.get(key, 0):
+                        term_scores[key] = score
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    key: score + term_scores[key]
+                    for key, score in scores.items()
+                    if key in term_scores
+                }
+
+            if not scores:
+                return []
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda pair: pair[1])
+
+        return [(self._items[key], score) for key, score in best]
+
+    def _expand(self, query_term) -> List[Tuple[str, float]]:
+        # Returns the indexed terms a query word matches, with how well they match it.
+        if self._vocabulary_is_stale:
+            self._vocabulary = sorted(self._term_trigrams)
+            self._vocabulary_is_stale = False
+            self._expansions.clear()
+
+        expansion = self._expansions.get(query_term)
+
+        if expansion is None:
+            expansion = self._find_matching_terms(query_term)
+
+            if len(self._expansions) >= 1024:
+                self._expansions.clear()
+
+            self._expansions[query_term] = expansion
+
+        return expansion
+
+    def _find_matching_terms(self, query_term) -> List[Tuple[str, float]]:
+        matches = {}
+
+        if query_term in self._term_trigrams:
+            matches[query_term] = 1.0
+
+        start = bisect_left(self._vocabulary, query_term)
+        for term in self._vocabulary[start:start + _MAX_PREFIX_EXPANSIONS + 1]:
+            if not term.startswith(query_term):
+                break
+
+            matches.setdefault(term, 0.9)
+
+        # Misspellings are only looked for when the word isn't a real indexed word.
+        if query_term in matches or len(query_term) < _MIN_FUZZY_LENGTH:
+            return list(matches.items())
+
+        query_trigrams = _trigrams(query_term)
+        size = len(query_trigrams)
+        threshold = self._similarity_threshold
+
+        # A term needs at least this many shared trigrams to reach the threshold, so it must
+        # contain at least one of the 'size - min_overlap + 1' rarest query trigrams.
+        min_overlap = max(1, math.ceil(threshold * size / (2 - threshold)))
+        rarest = sorted(query_trigrams, key=lambda t: len(self._trigram_terms.get(t, ())))
+
+        candidates = set()
+        for trigram in rarest[:size - min_overlap + 1]:
+            candidates.update(self._trigram_terms.get(trigram, ()))
+
+        for term in candidates:
+            if term in matches:
+                continue
+
+            term_trigrams = self._term_trigrams[term]
+            similarity = 2 * len(query_trigrams & term_trigrams) / (size + len(term_trigrams))
+
+            if similarity >= threshold:
+                matches[term] = similarity * 0.8
+
+        return list(matches.items())
+
+    def _remove_key(self, key):
+        for term in self._document_terms.pop(key):
+            postings = self._postings[term]
+            del postings[key]
+
+            if not postings:
+                del self._postings[term]
+
+                for trigram in self._term_trigrams.pop(term):
+                    terms = self._trigram_terms[trigram]
+                    terms.discard(term)
+
+                    if not terms:
+                        del self._trigram_terms[trigram]
+
+                self._vocabulary_is_stale = True
+
+        del self._items[key]
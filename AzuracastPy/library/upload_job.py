@@ -0,0 +1,178 @@
+"""Class for resumable bulk uploads of media files to a station."""
+
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from ..exceptions import ClientException
+from ..models.station_file import StationFile
+from .journaled_job import JournaledJob, RETRYABLE_ERRORS
+
+class UploadJob(JournaledJob):
+    """
+    A bulk upload of local media files to a station that can be stopped and resumed.
+
+    Every finished upload is appended to a journal file as soon as it completes. When a job is
+    started again with the same journal, the uploads recorded in it are checked against the
+    station and only the files that are missing are uploaded.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.library import UploadJob
+
+        files = {
+            "music/song1.mp3": "/home/me/music/song1.mp3",
+            "music/song2.mp3": "/home/me/music/song2.mp3"
+        }
+
+        job = UploadJob(station, files, "migration.journal", workers=8)
+        result = job.run()
+
+        for path, error in job.failures.items():
+            print(path, error)
+    """
+    _OWNER = "station"
+    _KEY_FIELD = "path"
+
+    def __init__(
+        self,
+        station,
+        files: Union[Dict[str, str], Iterable[Tuple[str, str]]],
+        journal: str,
+        workers: Optional[int] = None,
+        retries: Optional[int] = None,
+        retry_delay: Optional[float] = None
+    ):
+        """
+        Initializes an :class:`UploadJob` instance.
+
+        :param station: The :class:`~.models.Station` the files will be uploaded to.
+        :param files: The files to upload, either as a dictionary or as ``(path, file)`` tuples,
+            where ``path`` is the/relative/path/to/file.mp3 on the station and ``file`` is the
+            system path of the file.
+        :param journal: Path to the journal file that records the job's progress.
+            The file is created if it doesn't exist.
+        :param workers: (Optional) The number of files uploaded at the same time.
+            Leave as ``None`` to use the value the job was started with, or ``4`` for a new job.
+            Default: ``None``.
+        :param retries: (Optional) The number of times a failed upload is retried.
+            Leave as ``None`` to use the value the job was started with, or ``3`` for a new job.
+            Default: ``None``.
+        :param retry_delay: (Optional) The number of seconds to wait before the first retry.
+            The wait doubles with every retry. Leave as ``None`` to use the value the job was
+            started with, or ``1.0`` for a new job. Default: ``None``.
+        """
+        self._station = station
+        self._files = dict(files)
+        self._completed: Dict[str, Dict[str, Any]] = {}
+
+        super().__init__(station.id, journal, workers, retries, retry_delay)
+
+    def __repr__(self):
+        return f"UploadJob(journal={self._journal_path!r}, files={len(self._files)}, "\
+               f"completed={len(self._completed)})"
+
+    @property
+    def completed(self) -> Dict[str, Dict[str, Any]]:
+        """
+        The uploads recorded in the journal, mapped by their path on the station.
+
+        Each upload is a dictionary with the ``path``, ``file``, ``id`` and ``unique_id`` of the
+        uploaded file, and the ``station_path`` the station stored it under.
+        """
+        return dict(self._completed)
+
+    def run(self) -> Dict[str, int]:
+        """
+        Uploads every file that hasn't been uploaded yet.
+
+        Uploads recorded in the journal are verified against the station first, so files that
+        were deleted since are uploaded again. Uploads that still fail after all retries are
+        listed in :attr:`failures` and attempted again the next time the job runs.
+
+        :returns: A dictionary with the number of ``"uploaded"``, ``"skipped"`` (already
+            uploaded) and ``"failed"`` files.
+
+        Usage:
+
+        .. code-block:: python
+
+            result = job.run()
+        """
+        self._start()
+        self._verify_completed_uploads()
+
+        pending = [
+            (path, file) for path, file in self._files.items()
+            if path not in self._completed
+        ]
+
+        skipped = len(self._files) - len(pending)
+        uploaded = self._run_all(self._upload, pending)
+
+        return {
+            "uploaded": uploaded,
+            "skipped": skipped,
+            "failed": len(self.failures)
+        }
+
+    def _upload(self, item) -> bool:
+        path, file = item
+
+        try:
+            station_file = self._attempt(
+                lambda: self._station.file.upload(path, file),
+                recover=lambda: self._find_on_station(path)
+            )
+        except (ClientException, ValueError, *RETRYABLE_ERRORS) as error:
+            return self._record_failure(path, error)
+
+        upload = {
+            "path": path,
+            "file": file,
+            "id": station_file.id,
+            "unique_id": station_file.unique_id,
+            "station_path": station_file.path
+        }
+
+        self._write_journal_entry({"event": "completed", **upload})
+        self._completed[path] = upload
+
+        return True
+
+    def _find_on_station(self, path) -> Optional[StationFile]:
+        # Uploading isn't idempotent: a request that timed out may have stored the file anyway.
+        # The station is searched for it before the upload is retried, so it isn't stored twice.
+        response = self._station._request_multiple_instances_of("station_files")
+
+        for file in response:
+            if file['path'].lstrip("/") == path.lstrip("/"):
+                return StationFile(**file, _station=self._station)
+
+        return None
+
+    def _verify_completed_uploads(self):
+        if not self._completed:
+            return
+
+        # One listing of the station's files, instead of a request for every upload.
+        response = self._station._request_multiple_instances_of("station_files")
+        on_station = {file['id']: file['path'] for file in response}
+
+        # The station may store a file under a normalized path, so uploads are compared with
+        # the path the station returned. Journals written without it are compared by ID only.
+        for path, upload in list(self._completed.items()):
+            station_path = on_station.get(upload['id'])
+
+            if station_path is None or upload.get('station_path') not in (None, station_path):
+                del self._completed[path]
+
+    def _replay(self, entry):
+        if entry['event'] == "completed":
+            self._completed[entry['path']] = {
+                "path": entry['path'],
+                "file": entry['file'],
+                "id": entry['id'],
+                "unique_id": entry['unique_id'],
+                "station_path": entry.get('station_path')
+            }
@@ -0,0 +1,321 @@
+"""Class for a persistent record of uploaded media files and their content fingerprints."""
+
+import os
+import sqlite3
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..util.media_util import fingerprint_file
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    fingerprint TEXT NOT NULL,
+    station_id TEXT NOT NULL,
+    file_id INTEGER NOT NULL,
+    unique_id TEXT,
+    path TEXT,
+    PRIMARY KEY (fingerprint, station_id)
+);
+
+CREATE TABLE IF NOT EXISTS local_files (
+    source TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS uploads_station ON uploads(station_id);
+"""
+
+def _row_to_dict(row) -> Dict[str, Any]:
+    return {
+        "fingerprint": row[0],
+        "station_id": row[1],
+        "id": row[2],
+        "unique_id": row[3],
+        "path": row[4]
+    }
+
+class UploadManifest:
+    """
+    A persistent record of which file contents have been uploaded to which stations.
+
+    Pass an instance to :meth:`~.models.helpers.FileHelper.upload` to stop files that are
+    already on a station from being uploaded again.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.library import UploadManifest
+
+        with UploadManifest("uploads.sqlite3") as manifest:
+            file = station.file.upload(
+                path="song/on/station.mp3",
+                file="file/path/on/local/system.mp3",
+                manifest=manifest
+            )
+    """
+    def __init__(
+        self,
+        database: str = ":memory:"
+    ):
+        """
+        Initializes an :class:`UploadManifest` instance.
+
+        :param database: (Optional) Path to the SQLite database file that stores the manifest.
+            The file is created if it doesn't exist. Default: ``":memory:"``.
+        """
+        self._connection = sqlite3.connect(database)
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM uploads").fetchone()[0]
+
+    def close(self):
+        """
+        Closes the connection to the database.
+
+        Usage:
+
+        .. code-block:: python
+
+            manifest.close()
+        """
+        self._connection.close()
+
+    def fingerprint(
+        self,
+        file: str
+    ) -> str:
+        """
+        Computes the content fingerprint of a local file.
+
+        Fingerprints are remembered, and only recomputed when the file's size or modification
+        time changes.
+
+        :param file: The system path of the file.
+
+        :returns: The fingerprint, as a hexadecimal string.
+
+        Usage:
+
+        .. code-block:: python
+
+            fingerprint = manifest.fingerprint("file/path/on/local/system.mp3")
+        """
+        if not os.path.isfile(file):
+            raise ValueError(f"File does not exist: {file}")
+
+        fingerprint = self._cached_fingerprint(file)
+
+        if fingerprint is None:
+            fingerprint = fingerprint_file(file)
+            self._remember_fingerprint(file, fingerprint)
+
+        return fingerprint
+
+    def _cached_fingerprint(self, file: str) -> Optional[str]:
+        # The remembered fingerprint of a file, if the file hasn't changed since.
+        source = os.path.abspath(file)
+
+        if not os.path.isfile(source):
+            return None
+
+        stat = os.stat(source)
+
+        row = self._connection.execute(
+            "SELECT size, mtime_ns, fingerprint FROM local_files WHERE source = ?",
+            (source,)
+        ).fetchone()
+
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+
+        return None
+
+    def _remember_fingerprint(self, file: str, fingerprint: str):
+        source = os.path.abspath(file)
+        stat = os.stat(source)
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO local_files (source, size, mtime_ns, fingerprint) "
+                "VALUES (?, ?, ?, ?)",
+                (source, stat.st_size, stat.st_mtime_ns, fingerprint)
+            )
+
+    def lookup(
+        self,
+        fingerprint: str,
+        station_id
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Finds the upload of some content to a station.
+
+        :param fingerprint: The content fingerprint.
+        :param station_id: The ID of the station.
+
+        :returns: A dictionary with the ``fingerprint``, ``station_id``, ``id``, ``unique_id``
+            and ``path`` of the uploaded file, or ``None`` if the content was never uploaded to
+            the station.
+
+        Usage:
+
+        .. code-block:: python
+
+            upload = manifest.lookup(fingerprint, station.id)
+        """
+        row = self._connection.execute(
+            "SELECT fingerprint, station_id, file_id, unique_id, path FROM uploads "
+            "WHERE fingerprint = ? AND station_id = ?",
+            (fingerprint, str(station_id))
+        ).fetchone()
+
+        return _row_to_dict(row) if row else None
+
+    def locations(
+        self,
+        fingerprint: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Finds every station that some content was uploaded to.
+
+        :param fingerprint: The content fingerprint.
+
+        :returns: A list of dictionaries, in the format returned by :meth:`lookup`.
+
+        Usage:
+
+        .. code-block:: python
+
+            uploads = manifest.locations(manifest.fingerprint("song.mp3"))
+        """
+        rows = self._connection.execute(
+            "SELECT fingerprint, station_id, file_id, unique_id, path FROM uploads "
+            "WHERE fingerprint = ? ORDER BY station_id",
+            (fingerprint,)
+        )
+
+        return [_row_to_dict(row) for row in rows]
+
+    def record(
+        self,
+        fingerprint: str,
+        station_file
+    ):
+        """
+        Records that some content is stored on a station as a file.
+
+        :param fingerprint: The content fingerprint.
+        :param station_file: The :class:`.StationFile` holding the content.
+
+        Usage:
+
+        .. code-block:: python
+
+            manifest.record(fingerprint, station.file(1))
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO uploads "
+                "(fingerprint, station_id, file_id, unique_id, path) VALUES (?, ?, ?, ?, ?)",
+                (
+                    fingerprint, str(station_file._station.id), station_file.id,
+                    station_file.unique_id, station_file.path
+                )
+            )
+
+    def forget(
+        self,
+        fingerprint: str,
+        station_id
+    ):
+        """
+        Removes the record of some content being on a station.
+
+        :param fingerprint: The content fingerprint.
+        :param station_id: The ID of the station.
+
+        Usage:
+
+        .. code-block:: python
+
+            manifest.forget(fingerprint, station.id)
+        """
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM uploads WHERE fingerprint = ? AND station_id = ?",
+                (fingerprint, str(station_id))
+            )
+
+    def find_duplicates(
+        self,
+        files: Iterable[str]
+    ) -> Dict[str, List[str]]:
+        """
+        Finds local files that have the same content.
+
+        :param files: The system paths of the files to compare.
+
+        :returns: A dictionary mapping each duplicated fingerprint to the paths that share it.
+
+        Usage:
+
+        .. code-block:: python
+
+            import glob
+
+            duplicates = manifest.find_duplicates(glob.glob("music/**/*.mp3", recursive=True))
+        """
+        # Files can only share content if they share a size, so most files are never read.
+        by_size = defaultdict(list)
+        for file in files:
+            by_size[os.path.getsize(file)].append(file)
+
+        by_fingerprint = defaultdict(list)
+        for same_size in by_size.values():
+            if len(same_size) < 2:
+                continue
+
+            for file in same_size:
+                by_fingerprint[self.fingerprint(file)].append(file)
+
+        return {
+            fingerprint: paths
+            for fingerprint, paths in by_fingerprint.items()
+            if len(paths) > 1
+        }
+
+    def find_cross_station_duplicates(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Finds content that was uploaded to more than one station.
+
+        :returns: A dictionary mapping each shared fingerprint to its uploads, in the format
+            returned by :meth:`lookup`.
+
+        Usage:
+
+        .. code-block:: python
+
+            shared = manifest.find_cross_station_duplicates()
+        """
+        rows = self._connection.execute(
+            "SELECT fingerprint, station_id, file_id, unique_id, path FROM uploads "
+            "WHERE fingerprint IN "
+            "(SELECT fingerprint FROM uploads GROUP BY fingerprint HAVING COUNT(*) > 1) "
+            "ORDER BY fingerprint, station_id"
+        )
+
+        duplicates = defaultdict(list)
+        for row in rows:
+            duplicates[row[0]].append(_row_to_dict(row))
+
+        return dict(duplicates)
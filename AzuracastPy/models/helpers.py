@@ -1,8 +1,8 @@
 """Helper functions for station resources."""
 
-from typing import Optional, Union, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Union, Dict, Any, List
 
-from ..util.media_util import generate_file_upload_structure
+from ..util.media_util import new_fingerprint_digest, stream_file_upload_structure
 from ..util.general_util import get_day_number, generate_enum_error_text
 from ..exceptions import ClientException
 from ..constants import API_ENDPOINTS, WEBHOOK_CONFIG_TEMPLATES
@@ -17,7 +17,8 @@ from ..enums import (
     PlaylistOrders,
     PlaylistRemoteTypes,
     Languages,
-    PodcastCategories
+    PodcastCategories,
+    DuplicateActions
 )
 
 from .mount_point import MountPoint
@@ -31,6 +32,10 @@ from .remote_relay import RemoteRelay
 from .webhook import Webhook
 from .queue_item import QueueItem
 
+if TYPE_CHECKING:
+    from ..library.upload_manifest import UploadManifest
+    from ..scheduling import ScheduleConflictDetector
+
 def _request_single_instance_of_station_resource(
     station,
     resource_name,
@@ -229,15 +234,27 @@ class FileHelper:
     def upload(
         self,
         path: str,
-        file: str
+        file: str,
+        manifest: Optional["UploadManifest"] = None,
+        on_duplicate: DuplicateActions = DuplicateActions.SKIP
     ) -> StationFile:
         """
         Uploads a media file to the station.
 
         :param path: the/relative/path/to/file.mp3.
         :param file: The system path of the file to be uploaded.
-
-        :returns: A :class:`.StationFile` object for the newly uploaded file.
+        :param manifest: (Optional) An :class:`~.library.UploadManifest` that records what has
+            been uploaded. When provided, the file's content is fingerprinted, and content that is
+            already on the station is handled according to ``on_duplicate``. The file is only
+            read before the upload when it has to be checked for duplicates and its fingerprint
+            isn't remembered yet. Default: ``None``.
+        :param on_duplicate: (Optional) What to do when the content is already on the station.
+            ``DuplicateActions.SKIP`` returns the existing file, ``DuplicateActions.MOVE`` moves
+            the existing file to ``path`` and ``DuplicateActions.UPLOAD`` uploads it anyway.
+            Only used when a ``manifest`` is provided. Default: ``DuplicateActions.SKIP``.
+
+        :returns: A :class:`.StationFile` object for the newly uploaded file, or for the existing
+            file when the upload was skipped.
 
         Usage:
 
@@ -247,17 +264,82 @@ class FileHelper:
                 path="song/on/station.mp3",
                 file="file/path/on/local/system.mp3"
             )
+
+        To skip content that was uploaded before:
+
+        .. code-block:: python
+
+            from AzuracastPy.library import UploadManifest
+
+            manifest = UploadManifest("uploads.sqlite3")
+
+            file = station.file.upload(
+                path="song/on/station.mp3",
+                file="file/path/on/local/system.mp3",
+                manifest=manifest
+            )
         """
+        if not isinstance(on_duplicate, DuplicateActions):
+            raise ClientException(generate_enum_error_text("on_duplicate", DuplicateActions))
+
+        fingerprint = None
+
+        if manifest is not None and on_duplicate is not DuplicateActions.UPLOAD:
+            fingerprint = manifest.fingerprint(file)
+            existing_file = self._find_uploaded_file(manifest, fingerprint)
+
+            if existing_file is not None:
+                if on_duplicate is DuplicateActions.MOVE and existing_file.path != path:
+                    existing_file.edit(path=path)
+                    manifest.record(fingerprint, existing_file)
+
+                return existing_file
+
         url = API_ENDPOINTS["station_files"].format(
             radio_url=self._station._request_handler.radio_url,
             station_id=self._station.id
         )
 
-        upload_body = generate_file_upload_structure(path, file)
+        # The file is base64-encoded as it's sent. When it still needs a fingerprint, it's
+        # hashed in the same read.
+        digest = None
+        if manifest is not None and fingerprint is None:
+            fingerprint = manifest._cached_fingerprint(file)
 
-        response = self._station._request_handler.post(url, upload_body)
+            if fingerprint is None:
+                digest = new_fingerprint_digest()
 
-        return StationFile(**response, _station=self._station)
+        upload_body = stream_file_upload_structure(path, file, digest=digest)
+
+        response = self._station._request_handler.post_stream(url, upload_body)
+
+        station_file = StationFile(**response, _station=self._station)
+
+        if manifest is not None:
+            if digest is not None:
+                fingerprint = digest.hexdigest()
+                manifest._remember_fingerprint(file, fingerprint)
+
+            manifest.record(fingerprint, station_file)
+
+        return station_file
+
+    def _find_uploaded_file(
+        self,
+        manifest,
+        fingerprint: str
+    ) -> Optional[StationFile]:
+        upload = manifest.lookup(fingerprint, self._station.id)
+
+        if upload is None:
+            return None
+
+        # The file might have been deleted on the station since it was recorded.
+        try:
+            return self.__call__(upload['id'])
+        except ClientException:
+            manifest.forget(fingerprint, self._station.id)
+            return None
 
 class PlaylistHelper:
     """Provides a set of functions to interact with playlists."""
@@ -421,7 +503,8 @@ class PlaylistHelper:
         remote_url: Optional[str] = None,
         remote_type: PlaylistRemoteTypes = PlaylistRemoteTypes.STREAM,
         remote_buffer: int = 0,
-        schedule: Optional[List[Dict[str, Any]]] = None
+        schedule: Optional[List[Dict[str, Any]]] = None,
+        conflict_detector: Optional["ScheduleConflictDetector"] = None
     ) -> Playlist:
         """
         Adds a new playlist to the station.
@@ -461,6 +544,10 @@ class PlaylistHelper:
             ``PlaylistSources.SONGS``. Default: ``0``.
         :param schedule: The structure representing the schedule list of the playlist. This can be
             generated using the :meth:`.generate_schedule_items` function. Default: ``None``.
+        :param conflict_detector: (Optional) A :class:`~.scheduling.ScheduleConflictDetector` to
+            check the ``schedule`` with. A :class:`~.exceptions.ClientException` is raised before
+            anything is sent when it overlaps the schedule of another playlist or streamer. The
+            new playlist is added to the detector. Default: ``None``.
 
         :returns: A :class:`.Playlist` object for the newly created playlist.
 
@@ -500,6 +587,9 @@ class PlaylistHelper:
 
         remote_type = remote_type.value
 
+        if conflict_detector is not None:
+            conflict_detector.check(schedule or [])
+
         url = API_ENDPOINTS["station_playlists"].format(
             radio_url=self._station._request_handler.radio_url,
             station_id=self._station.id
@@ -528,8 +618,12 @@ class PlaylistHelper:
 
         # This is probably inefficient, but the schedule_items attribute of the new Playlist won't
         # be returned otherwise. I'll find a better way soon.
-        playlist_id = response['id']
-        return self.__call__(playlist_id)
+        playlist = self.__call__(response['id'])
+
+        if conflict_detector is not None:
+            conflict_detector.add(playlist)
+
+        return playlist
 
 class PodcastHelper:
     """Provides a set of functions to interact with podcasts."""
@@ -1141,7 +1235,8 @@ class StreamerHelper:
         comments: Optional[str] = None,
         is_active: bool = True,
         enforce_schedule: bool = False,
-        schedule: Optional[List[Dict[str, Any]]] = None
+        schedule: Optional[List[Dict[str, Any]]] = None,
+        conflict_detector: Optional["ScheduleConflictDetector"] = None
     ) -> Streamer:
         """
         Adds a streamer to the station.
@@ -1158,6 +1253,10 @@ class StreamerHelper:
             during their scheduled broadcast times. Default: ``False``.
         :param schedule: The structure representing the schedule list of the streamer. This can be
             generated using the :meth:`.generate_schedule_items` function. Default: ``None``.
+        :param conflict_detector: (Optional) A :class:`~.scheduling.ScheduleConflictDetector` to
+            check the ``schedule`` with. A :class:`~.exceptions.ClientException` is raised before
+            anything is sent when it overlaps the schedule of another playlist or streamer. The
+            new streamer is added to the detector. Default: ``None``.
 
         :returns: A :class:`.Streamer` object for the newly created streamer.
 
@@ -1171,6 +1270,9 @@ class StreamerHelper:
             comments="Never gonna give you up."
         )
         """
+        if conflict_detector is not None:
+            conflict_detector.check(schedule or [])
+
         url = API_ENDPOINTS["station_streamers"].format(
             radio_url=self._station._request_handler.radio_url,
             station_id=self._station.id
@@ -1190,8 +1292,12 @@ class StreamerHelper:
 
         # This is probably inefficient, but the schedule_items attribute of the new Streamer won't
         # be returned otherwise. I'll find a better way soon.
-        streamer_id = response['id']
-        return self.__call__(streamer_id)
+        streamer = self.__call__(response['id'])
+
+        if conflict_detector is not None:
+            conflict_detector.add(streamer)
+
+        return streamer
 
 class RemoteRelayHelper:
     """Provides a set of functions to interact with remote relays."""
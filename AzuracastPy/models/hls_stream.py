@@ -1,12 +1,16 @@
 """Class for a station HLS Stream"""
 
-from typing import Optional
+from typing import Optional, Set
 
 from ..enums import Formats, Bitrates
 from ..exceptions import ClientException
 from ..util.general_util import generate_repr_string, generate_enum_error_text
 
-from .util.station_resource_operations import edit_station_resource, delete_station_resource
+from .util.station_resource_operations import (
+    edit_station_resource,
+    delete_station_resource,
+    refresh_station_resource
+)
 
 class Links:
     """Represents the links associated with a HLS Stream."""
@@ -115,6 +119,25 @@ class HLSStream:
         """
         return delete_station_resource(self, "hls_stream")
 
+    def refresh(self) -> Set[str]:
+        """
+        Re-fetches the HLS stream from the station.
+
+        Updates all changed attributes of the current :class:`HLSStream` object.
+
+        :returns: The set of attribute names whose values changed on the server.
+
+        Usage:
+
+        .. code-block:: python
+
+            changed = hls_stream.refresh()
+
+            if "bitrate" in changed:
+                print(f"{hls_stream.name} now streams at {hls_stream.bitrate} kbps.")
+        """
+        return refresh_station_resource(self, "hls_stream")
+
     def _build_update_body(
         self,
         name,
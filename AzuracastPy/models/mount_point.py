@@ -1,12 +1,16 @@
 """Class for a station mount point."""
 
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Set
 
 from ..util.general_util import generate_repr_string, generate_enum_error_text
 from ..enums import Formats, Bitrates
 from ..exceptions import ClientException
 
-from .util.station_resource_operations import edit_station_resource, delete_station_resource
+from .util.station_resource_operations import (
+    edit_station_resource,
+    delete_station_resource,
+    refresh_station_resource
+)
 
 class Links:
     """Represents the links associated with a mount point."""
@@ -184,6 +188,25 @@ class MountPoint:
         """
         return delete_station_resource(self, "station_mount_point")
 
+    def refresh(self) -> Set[str]:
+        """
+        Re-fetches the mount point from the station.
+
+        Updates all changed attributes of the current :class:`MountPoint` object.
+
+        :returns: The set of attribute names whose values changed on the server.
+
+        Usage:
+
+        .. code-block:: python
+
+            changed = mount_point.refresh()
+
+            if "is_default" in changed and mount_point.is_default:
+                print(f"{mount_point.name} is now the default mount.")
+        """
+        return refresh_station_resource(self, "station_mount_point")
+
     def _build_update_body(
         self,
         mount_point_url,
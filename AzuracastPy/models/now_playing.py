@@ -1,11 +1,12 @@
 """Class for a station's nowplaying data."""
 
-from typing import List
+from functools import cached_property
+from typing import List, Optional
 
 from ..util.general_util import generate_repr_string
 
 from .listeners import Listeners
-from .song import Song
+from .song import SONG_POOL, Song
 from .station import Station
 from .song_history import SongHistory
 
@@ -61,7 +62,7 @@ class CurrentSong:
         self.playlist = playlist
         self.streamer = streamer
         self.is_request = is_request
-        self.song = Song(**song)
+        self.song = SONG_POOL.get(song)
         self.elapsed = elapsed
         self.remaining = remaining
 
@@ -69,7 +70,15 @@ class CurrentSong:
         return generate_repr_string(self)
 
 class PlayingNext:
-    """Represents the data of the next song to be played on a station."""
+    """
+    Represents the data of the next song to be played on a station.
+
+    .. note::
+
+        ``song`` is a shared :class:`~.models.song.Song` object, like the song of every
+        other model. It used to be the raw song dictionary returned by the API, so code that
+        read it with ``playing_next.song["title"]`` must use ``playing_next.song.title``.
+    """
     def __init__(
         self,
         cued_at: int,
@@ -92,7 +101,7 @@ class PlayingNext:
         self.duration = duration
         self.playlist = playlist
         self.is_request = is_request
-        self.song = song
+        self.song = SONG_POOL.get(song)
 
     def __repr__(self):
         return generate_repr_string(self)
@@ -118,14 +127,59 @@ class NowPlaying:
             This class should not be initialized directly. Instead, obtain an instance
             via: :meth:`~.AzuracastClient.now_playing`.
         """
-        self.station = Station(**station)
-        self.listeners = Listeners(**listeners)
-        self.live = Live(**live)
-        self.now_playing = CurrentSong(**now_playing)
-        self.playing_next = PlayingNext(**playing_next)
-        self.song_history = [SongHistory(**sh) for sh in song_history] if song_history else []
+        # The station's ID and shortcode identify the data without building the Station.
+        self.station_id = station['id']
+        self.station_shortcode = station['shortcode']
+
+        # The nested objects are only built when they're first used, since most callers read one
+        # or two of them.
+        self._station_data = station
+        self._listeners_data = listeners
+        self._live_data = live
+        self._now_playing_data = now_playing
+        self._playing_next_data = playing_next
+        self._song_history_data = song_history
         self.is_online = is_online
         self.cache = cache
 
+    @cached_property
+    def station(self) -> Station:
+        """The :class:`~.models.Station` the data belongs to."""
+        return Station(**self._station_data)
+
+    @cached_property
+    def listeners(self) -> Listeners:
+        """The :class:`~.models.listeners.Listeners` counts of the station."""
+        return Listeners(**self._listeners_data)
+
+    @cached_property
+    def live(self) -> Live:
+        """The :class:`Live` status of the station."""
+        return Live(**self._live_data)
+
+    @cached_property
+    def now_playing(self) -> Optional[CurrentSong]:
+        """The :class:`CurrentSong` of the station, or ``None`` while the station is offline."""
+        return CurrentSong(**self._now_playing_data) if self._now_playing_data else None
+
+    @cached_property
+    def playing_next(self) -> Optional[PlayingNext]:
+        """The :class:`PlayingNext` song of the station, or ``None`` while it's offline."""
+        return PlayingNext(**self._playing_next_data) if self._playing_next_data else None
+
+    @cached_property
+    def song_history(self) -> List[SongHistory]:
+        """The :class:`~.models.song_history.SongHistory` of the recently played songs."""
+        if not self._song_history_data:
+            return []
+
+        return [SongHistory(**sh) for sh in self._song_history_data]
+
     def __repr__(self):
+        # The nested objects are built first, so they show up.
+        _ = (
+            self.station, self.listeners, self.live, self.now_playing, self.playing_next,
+            self.song_history
+        )
+
         return generate_repr_string(self)
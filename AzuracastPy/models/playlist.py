@@ -1,14 +1,21 @@
 """Class for a station playlist."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 from ..constants import API_ENDPOINTS
 from ..exceptions import ClientException
 from ..enums import PlaylistTypes, PlaylistSources, PlaylistOrders, PlaylistRemoteTypes
 from ..util.general_util import generate_repr_string, generate_enum_error_text
 
-from .util.station_resource_operations import edit_station_resource, delete_station_resource
+from .util.station_resource_operations import (
+    edit_station_resource,
+    delete_station_resource,
+    refresh_station_resource
+)
+
+if TYPE_CHECKING:
+    from ..scheduling import ScheduleConflictDetector
 
 class Export:
     def __init__(
@@ -147,12 +154,17 @@ class ScheduleHelper:
 
     def add(
         self,
-        *args: Dict[str, Any]
+        *args: Dict[str, Any],
+        conflict_detector: Optional["ScheduleConflictDetector"] = None
     ):
         """
         Adds one or more new schedule items to the playlist of the station.
 
         :param args: The new schedule item(s) to be added to the playlist.
+        :param conflict_detector: (Optional) A
+            :class:`~.scheduling.ScheduleConflictDetector` to check the new items with. A
+            :class:`~.exceptions.ClientException` is raised before anything is sent when they
+            overlap the schedule of another playlist or streamer. Default: ``None``.
 
         Usage:
 
@@ -168,6 +180,9 @@ class ScheduleHelper:
 
             playlist.schedule.add(item)
         """
+        if conflict_detector is not None:
+            conflict_detector.check(args, owner=self._playlist)
+
         schedule_items = [_get_schedule_item_json(item) for item in self._playlist.schedule_items]
 
         for arg in args:
@@ -190,6 +205,9 @@ class ScheduleHelper:
             # Inefficient, but can't think of a better way.
             self._playlist.schedule_items = self._playlist._station.playlist(self._playlist.id).schedule_items
 
+            if conflict_detector is not None:
+                conflict_detector.add(self._playlist)
+
         return response
 
     def remove(
@@ -456,6 +474,25 @@ class Playlist:
         """
         return delete_station_resource(self, "station_playlist")
 
+    def refresh(self) -> Set[str]:
+        """
+        Re-fetches the playlist from the station.
+
+        Updates all changed attributes of the current :class:`Playlist` object.
+
+        :returns: The set of attribute names whose values changed on the server.
+
+        Usage:
+
+        .. code-block:: python
+
+            changed = playlist.refresh()
+
+            if "is_enabled" in changed:
+                print(f"{playlist.name} enabled: {playlist.is_enabled}")
+        """
+        return refresh_station_resource(self, "station_playlist")
+
     def _build_update_body(
         self,
         name,
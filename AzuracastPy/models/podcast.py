@@ -1,6 +1,6 @@
 """Class for a station podcast."""
 
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from ..constants import API_ENDPOINTS
 from ..enums import Languages, PodcastCategories
@@ -8,7 +8,11 @@ from ..exceptions import ClientException
 from ..util.general_util import generate_repr_string, generate_enum_error_text
 from ..util.media_util import get_resource_art
 
-from .util.station_resource_operations import edit_station_resource, delete_station_resource
+from .util.station_resource_operations import (
+    edit_station_resource,
+    delete_station_resource,
+    refresh_station_resource
+)
 
 from .podcast_episode import PodcastEpisode
 
@@ -90,7 +94,6 @@ class PodcastEpisodeHelper:
 
         return PodcastEpisode(**response, _podcast=self._podcast)
 
-    # TODO: Media and art require file uploads
     # TODO: Schedule episode release
     def create(
         self,
@@ -163,6 +166,57 @@ class PodcastEpisodeHelper:
 
         return [PodcastEpisode(**pe, _podcast=self._podcast) for pe in response]
 
+    def publish(
+        self,
+        episodes: Iterable[Dict[str, Any]],
+        journal: str,
+        workers: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Publishes many episodes at once, with their media and art, using an
+        :class:`~.library.EpisodePublishJob`.
+
+        Files are streamed from disk, and the progress is recorded in a journal, so running the
+        same call again after it was stopped only finishes the episodes that aren't published.
+
+        :param episodes: The episodes to publish, each a dictionary with a ``title``, a
+            ``description``, and optionally ``explicit`` and the system paths of its ``media``
+            and ``art`` files.
+        :param journal: Path to the journal file that records the progress.
+        :param workers: (Optional) The number of episodes published at the same time.
+            Leave as ``None`` to use the value the job was started with, or ``4`` for a new job.
+            Default: ``None``.
+
+        :returns: A dictionary with the number of ``"published"``, ``"skipped"`` (already
+            published) and ``"failed"`` episodes.
+
+        Usage:
+
+        .. code-block:: python
+
+            result = podcast.episode.publish(
+                [
+                    {
+                        "title": "Episode 1",
+                        "description": "The first episode.",
+                        "media": "season-1/episode-1.mp3",
+                        "art": "season-1/episode-1.jpg"
+                    },
+                    {
+                        "title": "Episode 2",
+                        "description": "The second episode.",
+                        "media": "season-1/episode-2.mp3"
+                    }
+                ],
+                journal="season-1.journal",
+                workers=4
+            )
+        """
+        # Imported here, since the library package builds on the models.
+        from ..library.episode_publish_job import EpisodePublishJob
+
+        return EpisodePublishJob(self._podcast, episodes, journal, workers=workers).run()
+
 class PodcastCategoryHelper:
     """Provides functions for working with the categories of a podcast."""
     def __init__(
@@ -471,6 +525,25 @@ class Podcast:
         """
         return delete_station_resource(self, "station_podcast")
 
+    def refresh(self) -> Set[str]:
+        """
+        Re-fetches the podcast from the station.
+
+        Updates all changed attributes of the current :class:`Podcast` object.
+
+        :returns: The set of attribute names whose values changed on the server.
+
+        Usage:
+
+        .. code-block:: python
+
+            changed = podcast.refresh()
+
+            if "title" in changed:
+                print(podcast.title)
+        """
+        return refresh_station_resource(self, "station_podcast")
+
     def _build_update_body(
         self,
         title,
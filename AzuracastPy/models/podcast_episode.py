@@ -1,9 +1,10 @@
 """"Class for a podcast episode."""
 
+import os
 from typing import Optional
 
 from ..constants import API_ENDPOINTS
-from ..util.media_util import get_resource_art
+from ..util.media_util import get_resource_art, stream_file_upload_structure
 from ..util.general_util import generate_repr_string
 
 class Links:
@@ -41,7 +42,8 @@ class Media:
         original_name: str,
         length: int,
         length_text: str,
-        path: str
+        path: str,
+        size: Optional[int] = None
     ):
         """
         Initializes a :class:`Media` object for an episode.
@@ -56,6 +58,7 @@ class Media:
         self.length = length
         self.length_text = length_text
         self.path = path
+        self.size = size
 
     def __repr__(self):
         return generate_repr_string(self)
@@ -171,6 +174,62 @@ class PodcastEpisode:
 
         return response
 
+    def upload_media(
+        self,
+        file: str
+    ):
+        """
+        Uploads the audio file of the episode, replacing the current one.
+
+        The file is read and sent a chunk at a time, so large files are never held in memory.
+
+        :param file: The system path of the audio file.
+
+        Usage:
+
+        .. code-block:: python
+
+            podcast_episode.upload_media("episodes/episode-1.mp3")
+        """
+        response = self._upload("podcast_episode_media", file)
+
+        self.has_media = True
+
+        return response
+
+    def upload_art(
+        self,
+        file: str
+    ):
+        """
+        Uploads the cover art of the episode, replacing the current one.
+
+        :param file: The system path of the image file.
+
+        Usage:
+
+        .. code-block:: python
+
+            podcast_episode.upload_art("episodes/episode-1.jpg")
+        """
+        response = self._upload("podcast_episode_art", file)
+
+        self.has_custom_art = True
+
+        return response
+
+    def _upload(self, resource_type, file):
+        url = API_ENDPOINTS[resource_type].format(
+            radio_url=self._podcast._station._request_handler.radio_url,
+            station_id=self._podcast._station.id,
+            podcast_id=self._podcast.id,
+            episode_id=self.id
+        )
+
+        body = stream_file_upload_structure(os.path.basename(file), file)
+
+        return self._podcast._station._request_handler.post_stream(url, body)
+
     def _build_update_body(
         self,
         title,
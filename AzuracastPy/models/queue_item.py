@@ -1,12 +1,20 @@
 """Class for an item in a station queue."""
 
-from .song import Song
+from .song import SONG_POOL, Song
 
-from typing import List
+from typing import List, Optional
 
-from ..constants import API_ENDPOINTS
 from ..util.general_util import generate_repr_string
 
+from .util.station_resource_operations import delete_station_resource
+
+def _id_from_link(link: Optional[str]) -> Optional[int]:
+    # Older versions of the API only return the ID of a queue item as part of its link.
+    try:
+        return int(link.rstrip("/").rsplit("/", 1)[-1])
+    except (AttributeError, ValueError):
+        return None
+
 class Links:
     """Represents the links associated with an item in a queue."""
     def __init__(
@@ -41,7 +49,8 @@ class QueueItem:
         autodj_custom_uri: str,
         log: List[str],
         links: Links,
-        _station
+        _station,
+        id: Optional[int] = None
     ):
         """
         Initializes a :class:`QueueItem` object.
@@ -56,53 +65,41 @@ class QueueItem:
         self.duration = duration
         self.playlist = playlist
         self.is_request = is_request
-        self.song = Song(**song)
+        self.song = SONG_POOL.get(song)
         self.sent_to_autodj = sent_to_autodj
         self.is_played = is_played
         self.autodj_custom_uri = autodj_custom_uri
         self.log = log
         self.links = Links(**links)
+        self.id = id if id is not None else _id_from_link(self.links.self)
         self._station = _station
 
     def __repr__(self):
         return generate_repr_string(self)
 
-    # # Doesn't work lol
-    # def delete(self):
-    #     queue = self._station.queue()
-
-    #     # Linear search. Yay.
-    #     id = 0
-    #     for item in queue:
-    #         if item == self:
-    #             break
-
-    #         id = id + 1
-
-    #     id = id + 1 # Returning id back to normal format.
-    #     url = API_ENDPOINTS["station_queue_item"].format(
-    #         radio_url=self._station._request_handler.radio_url,
-    #         station_id=self._station.id,
-    #         id=id
-    #     )
-
-    #     response = self._station._request_handler.delete(url)
-
-    #     if response['success'] is True:
-    #         self._clear_properties()
-
-    #     return response
-
-    # def _clear_properties(self):
-    #     self.cued_at = None
-    #     self.played_at = None
-    #     self.duration = None
-    #     self.playlist = None
-    #     self.is_request = None
-    #     self.song = None
-    #     self.sent_to_autodj = None
-    #     self.is_played = None
-    #     self.autodj_custom_uri = None
-    #     self.log = None
-    #     self.links = None
-    #     self._station = None
+    def delete(self):
+        """
+        Removes the item from the station's queue.
+
+        Usage:
+
+        .. code-block:: python
+
+            queue_item.delete()
+        """
+        return delete_station_resource(self, "station_queue_item")
+
+    def _clear_properties(self):
+        self.cued_at = None
+        self.played_at = None
+        self.duration = None
+        self.playlist = None
+        self.is_request = None
+        self.song = None
+        self.sent_to_autodj = None
+        self.is_played = None
+        self.autodj_custom_uri = None
+        self.log = None
+        self.links = None
+        self.id = None
+        self._station = None
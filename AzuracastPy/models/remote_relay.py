@@ -1,11 +1,15 @@
 """Class for a station remote relay."""
 
-from typing import Optional
+from typing import Optional, Set
 
 from ..util.general_util import generate_repr_string, generate_enum_error_text
 from ..enums import RemoteTypes, Bitrates, Formats
 from ..exceptions import ClientException
-from ..models.util.station_resource_operations import delete_station_resource, edit_station_resource
+from ..models.util.station_resource_operations import (
+    delete_station_resource,
+    edit_station_resource,
+    refresh_station_resource
+)
 
 class Links:
     """Represents the links associated with a remote relay."""
@@ -182,6 +186,25 @@ class RemoteRelay:
         """
         return delete_station_resource(self, "station_remote_relay_item")
 
+    def refresh(self) -> Set[str]:
+        """
+        Re-fetches the remote relay from the station.
+
+        Updates all changed attributes of the current :class:`RemoteRelay` object.
+
+        :returns: The set of attribute names whose values changed on the server.
+
+        Usage:
+
+        .. code-block:: python
+
+            changed = remote_relay.refresh()
+
+            if "url" in changed:
+                print(f"{remote_relay.display_name} now relays to {remote_relay.url}")
+        """
+        return refresh_station_resource(self, "station_remote_relay_item")
+
     def _build_update_body(
         self,
         station_listening_url,
@@ -2,7 +2,7 @@
 
 from ..util.general_util import generate_repr_string
 
-from .song import Song
+from .song import SONG_POOL, Song
 
 class RequestableSong:
     """Represents a song that can be requested on the station."""
@@ -22,7 +22,7 @@ class RequestableSong:
         """
         self.request_id = request_id
         self.request_url = request_url
-        self.song = Song(**song)
+        self.song = SONG_POOL.get(song)
 
     def __repr__(self):
         return generate_repr_string(self)
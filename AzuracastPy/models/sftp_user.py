@@ -1,12 +1,16 @@
 """Class for an SFTP user of a station."""
 
-from typing import Optional, List
+from typing import Optional, List, Set
 
 from ..constants import API_ENDPOINTS
 from ..exceptions import ClientException
 from ..util.general_util import generate_repr_string
 
-from .util.station_resource_operations import edit_station_resource, delete_station_resource
+from .util.station_resource_operations import (
+    edit_station_resource,
+    delete_station_resource,
+    refresh_station_resource
+)
 
 class Links:
     """Represents the links associated with an SFTP user."""
@@ -270,6 +274,25 @@ class SFTPUser:
         """
         return delete_station_resource(self, "station_sftp_user")
 
+    def refresh(self) -> Set[str]:
+        """
+        Re-fetches the SFTP user from the station.
+
+        Updates all changed attributes of the current :class:`SFTPUser` object.
+
+        :returns: The set of attribute names whose values changed on the server.
+
+        Usage:
+
+        .. code-block:: python
+
+            changed = sftp_user.refresh()
+
+            if "public_keys" in changed:
+                print(f"The keys of {sftp_user.username} changed.")
+        """
+        return refresh_station_resource(self, "station_sftp_user")
+
     def _build_update_body(
         self,
         username,
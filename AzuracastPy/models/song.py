@@ -1,11 +1,25 @@
 """Class for a song on a station."""
 
-from typing import Dict
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
 
 from ..util.general_util import generate_repr_string
 
 class Song:
-    """Represents a song object."""
+    """
+    Represents a song object.
+
+    Songs are shared between every object that refers to the same track, so they can't be
+    modified.
+
+    .. note::
+
+        Setting or deleting an attribute of a song raises an :class:`AttributeError`. Code that
+        used to change a song in place should build its own copy instead, e.g. with
+        ``dict(vars(song))``.
+    """
     def __init__(
         self,
         id: str,
@@ -32,16 +46,126 @@ class Song:
             :class:`~.models.now_playing.CurrentSong`,
             :class:`~.models.now_playing.PlayingNext`.
         """
-        self.id = id
-        self.text = text
-        self.artist = artist
-        self.title = title
-        self.album = album
-        self.genre = genre
-        self.isrc = isrc
-        self.lyrics = lyrics
-        self.art = art
-        self.custom_fields = custom_fields
+        # Attributes are written to the instance dictionary directly, since __setattr__ refuses.
+        vars(self).update(
+            id=id,
+            text=text,
+            artist=artist,
+            title=title,
+            album=album,
+            genre=genre,
+            isrc=isrc,
+            lyrics=lyrics,
+            art=art,
+            custom_fields=custom_fields
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Song objects are shared and can't be modified.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Song objects are shared and can't be modified.")
 
     def __repr__(self) -> str:
         return generate_repr_string(self)
+
+class SongPool:
+    """
+    A pool of shared :class:`Song` objects, one for each track.
+
+    Every model that contains a song gets it from :data:`SONG_POOL`, so a track that shows up
+    again and again in now-playing data, history and queues is stored once. The pool holds the
+    most recently used songs, up to ``maxsize`` of them, so its memory use levels off in
+    long-running programs.
+
+    A song is only reused while the API keeps returning the same data for it. When any of its
+    fields change, e.g. after its metadata is edited, a new :class:`Song` object replaces it.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.models.song import SONG_POOL
+
+        # Keep more songs for a radio with a large library.
+        SONG_POOL.maxsize = 20000
+
+        print(len(SONG_POOL))
+    """
+    def __init__(
+        self,
+        maxsize: int = 4096
+    ):
+        """
+        Initializes a :class:`SongPool` instance.
+
+        :param maxsize: (Optional) The number of songs to keep. ``0`` turns pooling off.
+            Default: ``4096``.
+        """
+        self.maxsize = maxsize
+
+        # Song ID -> (API data the song was made from, song), least recently used first.
+        self._songs: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._songs)
+
+    def __repr__(self):
+        return f"SongPool(songs={len(self._songs)}, maxsize={self.maxsize})"
+
+    def get(
+        self,
+        song: Dict[str, Any]
+    ) -> Song:
+        """
+        Retrieves the shared :class:`Song` object for the song data returned by the API.
+
+        :param song: The song dictionary returned by the API.
+
+        :returns: A :class:`Song` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            song = SONG_POOL.get(response["song"])
+        """
+        song_id = song.get('id')
+
+        if song_id is None or self.maxsize <= 0:
+            return Song(**song)
+
+        with self._lock:
+            entry = self._songs.get(song_id)
+
+            if entry is not None and entry[0] == song:
+                self._songs.move_to_end(song_id)
+                return entry[1]
+
+            shared = Song(**song)
+            # A copy, so changes the caller makes to its dictionary can't go unnoticed. Custom
+            # fields are nested, so the copy is deep.
+            self._songs[song_id] = (copy.deepcopy(song), shared)
+            self._songs.move_to_end(song_id)
+
+            while len(self._songs) > self.maxsize:
+                self._songs.popitem(last=False)
+
+            return shared
+
+    def clear(self):
+        """
+        Removes every song from the pool.
+
+        Usage:
+
+        .. code-block:: python
+
+            SONG_POOL.clear()
+        """
+        with self._lock:
+            self._songs.clear()
+
+# The pool shared by every model.
+SONG_POOL = SongPool()
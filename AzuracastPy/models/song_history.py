@@ -2,7 +2,7 @@
 
 from ..util.general_util import generate_repr_string
 
-from .song import Song
+from .song import SONG_POOL, Song
 
 class SongHistory:
     """Represents a single item from the song history of a station."""
@@ -34,7 +34,7 @@ class SongHistory:
         self.playlist = playlist
         self.streamer = streamer
         self.is_request = is_request
-        self.song = Song(**song)
+        self.song = SONG_POOL.get(song)
         self.listeners_start = listeners_start
         self.listeners_end = listeners_end
         self.delta_total = delta_total
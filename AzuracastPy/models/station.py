@@ -1,12 +1,16 @@
 """Class for a station on the radio."""
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+from urllib.parse import urlencode
 
 from ..request_handler import RequestHandler
-from ..util.general_util import generate_repr_string, generate_enum_error_text
+from ..util.general_util import generate_repr_string, generate_enum_error_text, get_page_rows
 from ..constants import API_ENDPOINTS
 from ..exceptions import ClientException
-from ..enums import ServiceActions
+from ..enums import ServiceActions, StationResources
 
 from .mount import Mount
 from .remote import Remote
@@ -19,6 +23,7 @@ from .station_file import StationFile
 from .mount_point import MountPoint
 from .playlist import Playlist
 from .podcast import Podcast
+from .podcast_episode import PodcastEpisode
 from .remote_relay import RemoteRelay
 from .sftp_user import SFTPUser
 from .streamer import Streamer
@@ -38,6 +43,32 @@ from .helpers import (
     QueueHelper
 )
 
+from .util.station_resource_operations import update_station_resource_from
+
+# Maps each refreshable resource kind to its list endpoint and model class.
+_REFRESHABLE_RESOURCES = {
+    StationResources.FILES: ("station_files", StationFile),
+    StationResources.MOUNT_POINTS: ("station_mount_points", MountPoint),
+    StationResources.PLAYLISTS: ("station_playlists", Playlist),
+    StationResources.PODCASTS: ("station_podcasts", Podcast),
+    StationResources.REMOTE_RELAYS: ("station_remote_relays", RemoteRelay),
+    StationResources.SFTP_USERS: ("station_sftp_users", SFTPUser),
+    StationResources.HLS_STREAMS: ("hls_streams", HLSStream),
+    StationResources.STREAMERS: ("station_streamers", Streamer),
+    StationResources.WEBHOOKS: ("station_webhooks", Webhook)
+}
+
+def _published_since(episode: Dict[str, Any], since: float) -> bool:
+    # Episodes without a publish time were published when they were created. When the creation
+    # time isn't known either, the episode is kept rather than silently left out.
+    for field in ('publish_at', 'created_at'):
+        try:
+            return float(episode.get(field)) >= since
+        except (TypeError, ValueError):
+            continue
+
+    return True
+
 class Station:
     """Represents a station on a radio."""
     def __init__(
@@ -83,8 +114,8 @@ class Station:
         self.playlist_pls_url = playlist_pls_url
         self.playlist_m3u_url = playlist_m3u_url
         self.is_public = is_public
-        self.mounts = [Mount(**m) for m in mounts] if mounts else []
-        self.remotes = [Remote(**r) for r in remotes] if remotes else []
+        self._mounts = mounts
+        self._remotes = remotes
         self.hls_enabled = hls_enabled
         self.hls_is_default = hls_is_default
         self.timezone = timezone
@@ -92,7 +123,21 @@ class Station:
         self.hls_listeners = hls_listeners
         self._request_handler = _request_handler
 
-        self.mount_point = MountPointHelper(_station=self)
+    # Nested objects and helpers are only built when they're first used, since most stations
+    # (e.g. those in now-playing data) never need them.
+
+    @cached_property
+    def mounts(self) -> List[Mount]:
+        """The :class:`.Mount` objects of the station's mount points."""
+        return [Mount(**m) for m in self._mounts] if self._mounts else []
+
+    @cached_property
+    def remotes(self) -> List[Remote]:
+        """The :class:`.Remote` objects of the station's remote relays."""
+        return [Remote(**r) for r in self._remotes] if self._remotes else []
+
+    @cached_property
+    def mount_point(self) -> MountPointHelper:
         """
         An instance of :class:`.MountPointHelper`.
 
@@ -116,8 +161,10 @@ class Station:
                 autodj_format=Formats.OPUS
             )
         """
+        return MountPointHelper(_station=self)
 
-        self.file = FileHelper(_station=self)
+    @cached_property
+    def file(self) -> FileHelper:
         """
         An instance of :class:`.FileHelper`.
 
@@ -138,8 +185,10 @@ class Station:
                 file="file/path/on/local/system.mp3"
             )
         """
+        return FileHelper(_station=self)
 
-        self.playlist = PlaylistHelper(_station=self)
+    @cached_property
+    def playlist(self) -> PlaylistHelper:
         """
         An instance of :class:`.PlaylistHelper`.
 
@@ -163,8 +212,10 @@ class Station:
                 play_per_value=5
             )
         """
+        return PlaylistHelper(_station=self)
 
-        self.podcast = PodcastHelper(_station=self)
+    @cached_property
+    def podcast(self) -> PodcastHelper:
         """
         An instance of :class:`.PodcastHelper`.
 
@@ -192,8 +243,10 @@ class Station:
                 ]
             )
         """
+        return PodcastHelper(_station=self)
 
-        self.streamer = StreamerHelper(_station=self)
+    @cached_property
+    def streamer(self) -> StreamerHelper:
         """
         An instance of :class:`.StreamerHelper`.
 
@@ -221,8 +274,10 @@ class Station:
                 ]
             )
         """
+        return StreamerHelper(_station=self)
 
-        self.webhook = WebhookHelper(_station=self)
+    @cached_property
+    def webhook(self) -> WebhookHelper:
         """
         An instance of :class:`.WebhookHelper`.
 
@@ -256,8 +311,10 @@ class Station:
                 ]
             )
         """
+        return WebhookHelper(_station=self)
 
-        self.remote_relay = RemoteRelayHelper(_station=self)
+    @cached_property
+    def remote_relay(self) -> RemoteRelayHelper:
         """
         An instance of :class:`.RemoteRelayHelper`.
 
@@ -281,8 +338,10 @@ class Station:
                 autodj_format=Formats.MP3
             )
         """
+        return RemoteRelayHelper(_station=self)
 
-        self.sftp_user = SFTPUserHelper(_station=self)
+    @cached_property
+    def sftp_user(self) -> SFTPUserHelper:
         """
         An instance of :class:`.SFTPUserHelper`.
 
@@ -304,8 +363,10 @@ class Station:
                 public_keys=['key1', 'key2']
             )
         """
+        return SFTPUserHelper(_station=self)
 
-        self.hls_stream = HLSStreamHelper(_station=self)
+    @cached_property
+    def hls_stream(self) -> HLSStreamHelper:
         """
         An instance of :class:`.HLSStreamHelper`.
 
@@ -329,8 +390,10 @@ class Station:
                 bitrate=Bitrates.BITRATE_32
             )
         """
+        return HLSStreamHelper(_station=self)
 
-        self.queue = QueueHelper(_station=self)
+    @cached_property
+    def queue(self) -> QueueHelper:
         """
         An instance of :class:`.QueueHelper`.
 
@@ -348,8 +411,12 @@ class Station:
 
             queue = station.queue()
         """
+        return QueueHelper(_station=self)
 
     def __repr__(self):
+        # The nested objects are built first, so they show up.
+        _ = self.mounts, self.remotes
+
         return generate_repr_string(self)
 
     def _perform_service_action(
@@ -619,6 +686,94 @@ class Station:
 
         return [Podcast(**p, _station=self) for p in response]
 
+    def iter_episodes(
+        self,
+        workers: int = 4,
+        since: Optional[Union[int, datetime]] = None,
+        per_page: int = 100,
+        podcasts: Optional[List[Podcast]] = None
+    ) -> Iterator[PodcastEpisode]:
+        """
+        Lazily lists the episodes of every podcast on the station, fetching the podcasts' episodes
+        at the same time.
+
+        Episodes are fetched a page at a time and yielded as each page arrives, so they come in no
+        particular order. Episodes published before ``since`` are skipped before any
+        :class:`PodcastEpisode` object is made for them.
+
+        :param workers: (Optional) The number of pages fetched at the same time. Default: ``4``.
+        :param since: (Optional) Only list episodes published at or after this time, as a UNIX
+            timestamp or a :class:`~datetime.datetime`. Episodes without a publish time are
+            compared by the time they were created, and listed when that isn't known either.
+            Leave as ``None`` to list every episode. Default: ``None``.
+        :param per_page: (Optional) The number of episodes fetched with each request.
+            Default: ``100``.
+        :param podcasts: (Optional) The :class:`.Podcast` objects whose episodes are listed.
+            Leave as ``None`` to list the episodes of every podcast on the station.
+            Default: ``None``.
+
+        :returns: An iterator of :class:`PodcastEpisode` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            from datetime import datetime, timedelta
+
+            for episode in station.iter_episodes(
+                workers=16, since=datetime.now() - timedelta(days=30)
+            ):
+                print(episode.title)
+        """
+        if type(workers) is not int or workers < 1:
+            raise ClientException("workers param must be a positive integer.")
+
+        if type(per_page) is not int or per_page < 1:
+            raise ClientException("per_page param must be a positive integer.")
+
+        if isinstance(since, datetime):
+            since = since.timestamp()
+
+        if podcasts is None:
+            podcasts = self.podcasts()
+
+        def fetch(podcast, page):
+            url = API_ENDPOINTS["podcast_episodes"].format(
+                radio_url=self._request_handler.radio_url,
+                station_id=self.id,
+                podcast_id=podcast.id
+            )
+
+            response = self._request_handler.get(
+                f"{url}?{urlencode({'page': page, 'per_page': per_page})}"
+            )
+
+            rows, has_more = get_page_rows(response, page, per_page)
+
+            if since is not None:
+                rows = [row for row in rows if _published_since(row, since)]
+
+            return podcast, page, rows, has_more
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            running = {executor.submit(fetch, podcast, 1) for podcast in podcasts}
+
+            try:
+                while running:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        podcast, page, rows, has_more = future.result()
+
+                        if has_more:
+                            running.add(executor.submit(fetch, podcast, page + 1))
+
+                        for row in rows:
+                            yield PodcastEpisode(**row, _podcast=podcast)
+            finally:
+                for future in running:
+                    future.cancel()
+
     def remote_relays(self) -> List[RemoteRelay]:
         """
         Retrieves the station's remote relays.
@@ -698,3 +853,63 @@ class Station:
         response = self._request_multiple_instances_of("station_webhooks")
 
         return [Webhook(**wh, _station=self) for wh in response]
+
+    def refresh_all(
+        self,
+        kind: StationResources,
+        objects: List[Any]
+    ) -> Dict[Any, Optional[Set[str]]]:
+        """
+        Re-fetches every resource of a kind with a single request and updates the given objects.
+
+        Only the objects whose data changed on the server are touched. Objects that no longer
+        exist on the station have all their attributes set to ``None``, like after a ``delete()``.
+
+        :param kind: The kind of resource being refreshed. Must be from the
+            :class:`StationResources` enum.
+        :param objects: The previously retrieved objects of that kind.
+
+        :returns: A dictionary mapping the ID of each changed object to the set of attribute
+            names that changed, or to ``None`` if the object no longer exists on the station.
+            Unchanged objects are left out.
+
+        Usage:
+
+        .. code-block:: python
+
+            from AzuracastPy.enums import StationResources
+
+            playlists = station.playlists()
+
+            changes = station.refresh_all(StationResources.PLAYLISTS, playlists)
+        """
+        if not isinstance(kind, StationResources):
+            raise ClientException(generate_enum_error_text("kind", StationResources))
+
+        resource_name, resource_class = _REFRESHABLE_RESOURCES[kind]
+
+        for obj in objects:
+            if not isinstance(obj, resource_class):
+                message = f"Each object must be a '{resource_class.__name__}' instance."
+                raise ClientException(message)
+
+        response = self._request_multiple_instances_of(resource_name)
+
+        latest = {item['id']: item for item in response}
+
+        changes = {}
+        for obj in objects:
+            id = obj.id
+            item = latest.get(id)
+
+            if item is None:
+                obj._clear_properties()
+                changes[id] = None
+                continue
+
+            changed = update_station_resource_from(obj, resource_class(**item, _station=self))
+
+            if changed:
+                changes[id] = changed
+
+        return changes
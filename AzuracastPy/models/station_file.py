@@ -1,13 +1,17 @@
 """Class for a media file on a station."""
 
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from ..exceptions import ClientException
 from ..constants import API_ENDPOINTS
 from ..util.general_util import generate_repr_string
 from ..util.media_util import get_media_file_art
 
-from .util.station_resource_operations import edit_station_resource, delete_station_resource
+from .util.station_resource_operations import (
+    edit_station_resource,
+    delete_station_resource,
+    refresh_station_resource
+)
 
 class Links:
     """Represents the links for a file on a station."""
@@ -361,6 +365,17 @@ class StationFile:
                 playlists=["playlist1", "playlist2"]
             )
         """
+        playlists_json = None
+
+        if playlists is not None:
+            playlists_json = self._build_playlists_json(playlists)
+
+        return edit_station_resource(
+            self, "station_file", title, artist, path, genre, album, lyrics, isrc,
+            playlists_json, amplify, fade_overlap, fade_in, fade_out, cue_in, cue_out
+        )
+
+    def _build_playlists_json(self, playlists):
         valid_playlists = [(playlist.id, playlist.name, playlist.weight) for playlist in self._station.playlists()]
 
         playlists_json = []
@@ -387,10 +402,7 @@ class StationFile:
                         }
                     )
 
-        return edit_station_resource(
-            self, "station_file", title, artist, path, genre, album, lyrics, isrc,
-            playlists_json, amplify, fade_overlap, fade_in, fade_out, cue_in, cue_out
-        )
+        return playlists_json
 
     def delete(self):
         """
@@ -406,6 +418,25 @@ class StationFile:
         """
         return delete_station_resource(self, "station_file")
 
+    def refresh(self) -> Set[str]:
+        """
+        Re-fetches the file from the station.
+
+        Updates all changed attributes of the current :class:`StationFile` object.
+
+        :returns: The set of attribute names whose values changed on the server.
+
+        Usage:
+
+        .. code-block:: python
+
+            changed = file.refresh()
+
+            if "path" in changed:
+                print(f"The file was moved to {file.path}")
+        """
+        return refresh_station_resource(self, "station_file")
+
     def _build_update_body(
         self,
         title,
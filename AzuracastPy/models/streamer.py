@@ -1,6 +1,6 @@
 """Class for a station streamer."""
 
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Set
 
 from datetime import datetime
 
@@ -9,7 +9,14 @@ from ..exceptions import ClientException
 from ..util.general_util import generate_repr_string
 from ..util.media_util import get_resource_art
 
-from .util.station_resource_operations import edit_station_resource, delete_station_resource
+from .util.station_resource_operations import (
+    edit_station_resource,
+    delete_station_resource,
+    refresh_station_resource
+)
+
+if TYPE_CHECKING:
+    from ..scheduling import ScheduleConflictDetector
 
 class Links:
     """Represents the links associated with a streamer."""
@@ -98,12 +105,17 @@ class ScheduleHelper:
 
     def add(
         self,
-        *args: Dict[str, Any]
+        *args: Dict[str, Any],
+        conflict_detector: Optional["ScheduleConflictDetector"] = None
     ):
         """
         Adds one or more new schedule items to the streamer of the station.
 
         :param args: The new schedule item(s) to be added to the station.
+        :param conflict_detector: (Optional) A
+            :class:`~.scheduling.ScheduleConflictDetector` to check the new items with. A
+            :class:`~.exceptions.ClientException` is raised before anything is sent when they
+            overlap the schedule of another playlist or streamer. Default: ``None``.
 
         Usage:
 
@@ -119,7 +131,10 @@ class ScheduleHelper:
 
             streamer.schedule.add(item)
         """
-        schedule_items = [_get_schedule_item_json(item) for item in self._playlist.schedule_items]
+        if conflict_detector is not None:
+            conflict_detector.check(args, owner=self._streamer)
+
+        schedule_items = [_get_schedule_item_json(item) for item in self._streamer.schedule_items]
 
         for arg in args:
             schedule_items.append(arg)
@@ -141,6 +156,9 @@ class ScheduleHelper:
             # Inefficient, but can't think of a better way.
             self._streamer.schedule_items = self._streamer._station.streamer(self._streamer.id).schedule_items
 
+            if conflict_detector is not None:
+                conflict_detector.add(self._streamer)
+
         return response
 
     def remove(
@@ -350,6 +368,25 @@ class Streamer:
         """
         return delete_station_resource(self, "station_streamer")
 
+    def refresh(self) -> Set[str]:
+        """
+        Re-fetches the streamer from the station.
+
+        Updates all changed attributes of the current :class:`Streamer` object.
+
+        :returns: The set of attribute names whose values changed on the server.
+
+        Usage:
+
+        .. code-block:: python
+
+            changed = streamer.refresh()
+
+            if "is_active" in changed:
+                print(f"{streamer.streamer_username} active: {streamer.is_active}")
+        """
+        return refresh_station_resource(self, "station_streamer")
+
     def _build_update_body(
         self,
         username,
@@ -1,3 +1,5 @@
+from typing import Set
+
 from AzuracastPy.constants import API_ENDPOINTS
 
 def edit_station_resource(self, resource_type: str, *args):
@@ -28,4 +30,42 @@ def delete_station_resource(self, resource_type: str):
     if response['success'] is True:
         self._clear_properties()
 
-    return response
\ No newline at end of file
+    return response
+
+def refresh_station_resource(self, resource_type: str) -> Set[str]:
+    url = API_ENDPOINTS[resource_type].format(
+        radio_url=self._station._request_handler.radio_url,
+        station_id=self._station.id,
+        id=self.id
+    )
+
+    response = self._station._request_handler.get(url)
+
+    return update_station_resource_from(self, self.__class__(**response, _station=self._station))
+
+def update_station_resource_from(self, latest) -> Set[str]:
+    # Only public attributes are compared. Helper attributes (e.g. 'playlist.schedule') have no
+    # public state, so they always compare equal and keep pointing at the current object.
+    changed = set()
+
+    for name, value in vars(latest).items():
+        if name.startswith('_'):
+            continue
+
+        if _comparable(getattr(self, name, None)) != _comparable(value):
+            setattr(self, name, value)
+            changed.add(name)
+
+    return changed
+
+def _comparable(value):
+    if isinstance(value, list):
+        return [_comparable(v) for v in value]
+
+    if isinstance(value, dict):
+        return {k: _comparable(v) for k, v in value.items()}
+
+    if hasattr(value, '__dict__'):
+        return {k: _comparable(v) for k, v in vars(value).items() if not k.startswith('_')}
+
+    return value
@@ -1,13 +1,17 @@
 """Class for a station webhook."""
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Set
 
 from ..enums import WebhookTriggers
 from ..constants import WEBHOOK_CONFIG_TEMPLATES, API_ENDPOINTS
 from ..exceptions import ClientException
 from ..util.general_util import generate_repr_string, generate_enum_error_text
 
-from .util.station_resource_operations import edit_station_resource, delete_station_resource
+from .util.station_resource_operations import (
+    edit_station_resource,
+    delete_station_resource,
+    refresh_station_resource
+)
 
 class Links:
     """Represents the links associated with a webhook."""
@@ -298,6 +302,25 @@ class Webhook:
         """
         return delete_station_resource(self, "station_webhook")
 
+    def refresh(self) -> Set[str]:
+        """
+        Re-fetches the webhook from the station.
+
+        Updates all changed attributes of the current :class:`Webhook` object.
+
+        :returns: The set of attribute names whose values changed on the server.
+
+        Usage:
+
+        .. code-block:: python
+
+            changed = webhook.refresh()
+
+            if "is_enabled" in changed:
+                print(f"{webhook.name} enabled: {webhook.is_enabled}")
+        """
+        return refresh_station_resource(self, "station_webhook")
+
     def _build_update_body(
         self,
         name,
@@ -0,0 +1,3 @@
+from .queue_view import QueueChange, QueueView
+from .request_manager import RequestManager, RequestOutcome
+from .request_catalog import RequestCatalog
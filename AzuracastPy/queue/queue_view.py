@@ -0,0 +1,324 @@
+"""Class for a cached, indexed view of a station's queue."""
+
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import requests
+
+from ..constants import API_ENDPOINTS
+from ..exceptions import AzuracastException, ClientException
+from ..models.queue_item import QueueItem, _id_from_link
+
+QueueChange = namedtuple("QueueChange", ("removed", "added", "reordered"))
+QueueChange.__doc__ = """
+What changed in a queue since it was last fetched: the :class:`~.models.QueueItem` objects that
+were ``removed`` and ``added``, and whether the items that stayed were ``reordered``.
+"""
+
+def _raw_id(raw: Dict[str, Any]) -> Optional[int]:
+    if raw.get('id') is not None:
+        return raw['id']
+
+    return _id_from_link((raw.get('links') or {}).get('self'))
+
+class QueueView:
+    """
+    A cached view of a station's queue, indexed by queue item ID and by time.
+
+    The queue is fetched at most once every ``ttl`` seconds, however often it's read. When it is
+    fetched again, only the items that are new get a :class:`~.models.QueueItem` object; the
+    items that are still queued with the same data keep theirs. The usual changes, songs leaving
+    the head of the queue as they play and new songs being added to its tail, are reported by
+    :meth:`refresh`.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.queue import QueueView
+
+        queue = QueueView(station, ttl=10)
+
+        requests = [item for item in queue if item.is_request]
+        result = queue.delete(requests, workers=8)
+
+        print(result, queue.failures)
+    """
+    def __init__(
+        self,
+        station,
+        ttl: float = 5
+    ):
+        """
+        Initializes a :class:`QueueView` instance.
+
+        :param station: The :class:`~.models.Station` whose queue is viewed.
+        :param ttl: (Optional) The number of seconds the fetched queue is used for before it's
+            fetched again. Default: ``5``.
+        """
+        if ttl < 0:
+            raise ClientException("ttl param cannot be negative.")
+
+        self._station = station
+        self.ttl = ttl
+
+        self._lock = threading.RLock()
+        self._fetched_at: Optional[float] = None
+        self._raw: List[Dict[str, Any]] = []
+        self._items: List[QueueItem] = []
+        self._by_id: Dict[int, QueueItem] = {}
+
+        # Items ordered by cue time and by play time, with the times alongside for bisecting.
+        self._by_cued_at: List[QueueItem] = []
+        self._cued_at: List[int] = []
+        self._by_played_at: List[QueueItem] = []
+        self._played_at: List[int] = []
+
+        self.failures: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.items())
+
+    def __iter__(self) -> Iterator[QueueItem]:
+        return iter(self.items())
+
+    def __repr__(self):
+        return f"QueueView(station_id={self._station.id}, items={len(self._items)})"
+
+    def items(self) -> List[QueueItem]:
+        """
+        Retrieves the items in the queue, in order, fetching the queue if the cached one is older
+        than ``ttl`` seconds.
+
+        :returns: A list of :class:`~.models.QueueItem` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            for item in queue.items():
+                print(item.song.text)
+        """
+        with self._lock:
+            if self._fetched_at is None or time.monotonic() - self._fetched_at >= self.ttl:
+                self.refresh()
+
+            return list(self._items)
+
+    def refresh(self) -> QueueChange:
+        """
+        Fetches the queue now, whatever the age of the cached one.
+
+        :returns: A :class:`QueueChange` tuple.
+
+        Usage:
+
+        .. code-block:: python
+
+            change = queue.refresh()
+
+            for item in change.added:
+                print(f"Queued: {item.song.text}")
+        """
+        url = API_ENDPOINTS["station_queue"].format(
+            radio_url=self._station._request_handler.radio_url,
+            station_id=self._station.id
+        )
+
+        response = self._station._request_handler.get(url)
+
+        with self._lock:
+            previous = {_raw_id(raw): (raw, item) for raw, item in zip(self._raw, self._items)}
+            kept_order = []
+            items = []
+            added = []
+
+            for raw in response:
+                id = _raw_id(raw)
+                cached = previous.pop(id, None) if id is not None else None
+
+                if cached is not None and cached[0] == raw:
+                    items.append(cached[1])
+                    kept_order.append(id)
+                    continue
+
+                item = QueueItem(**raw, _station=self._station)
+                items.append(item)
+                added.append(item)
+
+            kept = set(kept_order)
+            old_order = [id for id in map(_raw_id, self._raw) if id in kept]
+
+            self._raw = list(response)
+            self._set_items(items)
+            self._fetched_at = time.monotonic()
+
+            return QueueChange(
+                [item for _, item in previous.values()], added, kept_order != old_order
+            )
+
+    def get(
+        self,
+        id: int
+    ) -> QueueItem:
+        """
+        Retrieves a queue item by its ID.
+
+        :param id: The ID of the queue item.
+
+        :returns: A :class:`~.models.QueueItem` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            item = queue.get(1308)
+        """
+        self.items()
+
+        try:
+            return self._by_id[id]
+        except KeyError:
+            raise ClientException("Requested resource not found.")
+
+    def cued_between(
+        self,
+        start: int,
+        end: int
+    ) -> List[QueueItem]:
+        """
+        Retrieves the queue items cued within a stretch of time.
+
+        :param start: The start of the stretch, as a UNIX timestamp.
+        :param end: The end of the stretch, as a UNIX timestamp. Items cued at this time are
+            included.
+
+        :returns: A list of :class:`~.models.QueueItem` objects, by cue time.
+
+        Usage:
+
+        .. code-block:: python
+
+            recent = queue.cued_between(time.time() - 300, time.time())
+        """
+        self.items()
+
+        return self._by_cued_at[
+            bisect_left(self._cued_at, start):bisect_right(self._cued_at, end)
+        ]
+
+    def playing_at(
+        self,
+        timestamp: int
+    ) -> Optional[QueueItem]:
+        """
+        Retrieves the queue item expected to be playing at a point in time.
+
+        :param timestamp: The point in time, as a UNIX timestamp.
+
+        :returns: A :class:`~.models.QueueItem` object, or ``None`` if no item is expected to be
+            playing then.
+
+        Usage:
+
+        .. code-block:: python
+
+            item = queue.playing_at(time.time() + 600)
+        """
+        self.items()
+
+        i = bisect_right(self._played_at, timestamp) - 1
+
+        if i < 0:
+            return None
+
+        item = self._by_played_at[i]
+
+        if timestamp >= item.played_at + (item.duration or 0):
+            return None
+
+        return item
+
+    def delete(
+        self,
+        items: Iterable[Union[QueueItem, int]],
+        workers: int = 4
+    ) -> Dict[str, int]:
+        """
+        Removes several items from the queue at the same time, e.g. to clear a flood of song
+        requests.
+
+        Deleted items are removed from the cached queue without fetching it again. The items
+        that couldn't be deleted are listed in ``failures``, with their errors.
+
+        :param items: The :class:`~.models.QueueItem` objects or the IDs of the items to delete.
+        :param workers: (Optional) The number of items deleted at the same time. Default: ``4``.
+
+        :returns: A dictionary with the number of items that were ``deleted`` and ``failed``.
+
+        Usage:
+
+        .. code-block:: python
+
+            result = queue.delete(queue.cued_between(start, end), workers=8)
+        """
+        if workers < 1:
+            raise ClientException("workers param must be at least 1.")
+
+        ids = []
+        for item in items:
+            id = item.id if isinstance(item, QueueItem) else item
+
+            if type(id) is not int:
+                raise ClientException("Each item must be a QueueItem or an integer ID.")
+
+            ids.append(id)
+
+        self.failures = {}
+
+        def delete_one(id):
+            url = API_ENDPOINTS["station_queue_item"].format(
+                radio_url=self._station._request_handler.radio_url,
+                station_id=self._station.id,
+                id=id
+            )
+
+            try:
+                response = self._station._request_handler.delete(url)
+            except (AzuracastException, requests.RequestException) as error:
+                self.failures[id] = str(error)
+                return False
+
+            if response.get('success') is False:
+                self.failures[id] = response.get('message') or "The item wasn't deleted."
+                return False
+
+            return True
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(delete_one, ids))
+
+        deleted = {id for id, success in zip(ids, results) if success}
+
+        with self._lock:
+            kept = [
+                (raw, item) for raw, item in zip(self._raw, self._items) if item.id not in deleted
+            ]
+            self._raw = [raw for raw, _ in kept]
+            self._set_items([item for _, item in kept])
+
+        return {"deleted": len(deleted), "failed": len(self.failures)}
+
+    def _set_items(self, items):
+        self._items = items
+        self._by_id = {item.id: item for item in items if item.id is not None}
+
+        self._by_cued_at = sorted(items, key=lambda item: item.cued_at or 0)
+        self._cued_at = [item.cued_at or 0 for item in self._by_cued_at]
+
+        self._by_played_at = sorted(items, key=lambda item: item.played_at or 0)
+        self._played_at = [item.played_at or 0 for item in self._by_played_at]
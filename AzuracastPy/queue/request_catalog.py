@@ -0,0 +1,249 @@
+"""Class for paging through the requestable songs of a station."""
+
+import math
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from ..constants import API_ENDPOINTS
+from ..exceptions import ClientException
+from ..models.requestable_song import RequestableSong
+from ..models.song import Song
+
+class RequestCatalog:
+    """
+    The requestable songs of a station, fetched a page at a time.
+
+    Pages are fetched from the station only when they're read, and each one is cached for ``ttl``
+    seconds, so a request page can be shown as soon as its first page arrives instead of after
+    the whole catalog is downloaded. Searches are done by the station.
+
+    Every song that is read is also kept in an index from its request ID, which survives cache
+    expiry, so a request ID picked from an earlier page can always be looked up locally.
+
+    Older versions of AzuraCast return the whole catalog instead of a page. The catalog still
+    works with them, by splitting the response into pages locally.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.queue import RequestCatalog
+
+        catalog = RequestCatalog(station, per_page=25)
+
+        first_page = catalog.page(1)
+        print(f"{catalog.total} songs on {catalog.total_pages} pages")
+
+        results = catalog.page(1, search="cochise")
+
+        song = catalog.song(first_page[0].request_id)
+    """
+    def __init__(
+        self,
+        station,
+        per_page: int = 50,
+        ttl: float = 300
+    ):
+        """
+        Initializes a :class:`RequestCatalog` instance.
+
+        :param station: The :class:`~.models.Station` whose requestable songs are read.
+        :param per_page: (Optional) The number of songs on each page. Default: ``50``.
+        :param ttl: (Optional) The number of seconds a page is used for before it's fetched
+            again. Default: ``300``.
+        """
+        if type(per_page) is not int or per_page < 1:
+            raise ClientException("per_page param must be a positive integer.")
+
+        if ttl < 0:
+            raise ClientException("ttl param cannot be negative.")
+
+        self._station = station
+        self.per_page = per_page
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._pages: Dict[Tuple[Optional[str], int], Tuple[float, List[Any]]] = {}
+        self._totals: Dict[Optional[str], int] = {}
+        self._index: Dict[str, Song] = {}
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __iter__(self) -> Iterator[RequestableSong]:
+        return self.songs()
+
+    def __repr__(self):
+        return f"RequestCatalog(station_id={self._station.id}, indexed={len(self._index)})"
+
+    @property
+    def total(self) -> int:
+        """The number of requestable songs, fetching the first page if needed."""
+        if None not in self._totals:
+            self.page(1)
+
+        return self._totals[None]
+
+    @property
+    def total_pages(self) -> int:
+        """The number of pages of requestable songs, fetching the first page if needed."""
+        return math.ceil(self.total / self.per_page)
+
+    def page(
+        self,
+        number: int,
+        search: Optional[str] = None
+    ) -> List[RequestableSong]:
+        """
+        Retrieves a page of requestable songs.
+
+        :param number: The page number, starting from ``1``.
+        :param search: (Optional) A phrase to search the songs for. Leave as ``None`` to read the
+            whole catalog. Default: ``None``.
+
+        :returns: A list of :class:`~.models.requestable_song.RequestableSong` objects. It's
+            empty after the last page.
+
+        Usage:
+
+        .. code-block:: python
+
+            second_page = catalog.page(2)
+        """
+        if type(number) is not int or number < 1:
+            raise ClientException("number param must be a positive integer.")
+
+        search = search or None
+        key = (search, number)
+
+        with self._lock:
+            cached = self._pages.get(key)
+
+            if cached is None or time.monotonic() - cached[0] >= self.ttl:
+                cached = None
+
+        if cached is None:
+            cached = (time.monotonic(), self._fetch(search, number))
+
+        with self._lock:
+            fetched_at, rows = cached
+
+            # Pages cut from an unpaged response hold the raw rows until they're first read.
+            songs = [
+                row if isinstance(row, RequestableSong) else RequestableSong(**row)
+                for row in rows
+            ]
+            self._pages[key] = (fetched_at, songs)
+
+            for requestable_song in songs:
+                self._index[requestable_song.request_id] = requestable_song.song
+
+        return list(songs)
+
+    def songs(
+        self,
+        search: Optional[str] = None
+    ) -> Iterator[RequestableSong]:
+        """
+        Lazily lists every requestable song, fetching each page as it's reached.
+
+        :param search: (Optional) A phrase to search the songs for. Default: ``None``.
+
+        :returns: An iterator of :class:`~.models.requestable_song.RequestableSong` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            for requestable_song in catalog.songs(search="cochise"):
+                print(requestable_song.song.text)
+        """
+        number = 1
+
+        while True:
+            songs = self.page(number, search)
+            yield from songs
+
+            if len(songs) < self.per_page or number * self.per_page >= self._totals[search]:
+                return
+
+            number += 1
+
+    def song(
+        self,
+        request_id: str
+    ) -> Optional[Song]:
+        """
+        Looks up a song that was read from the catalog by its request ID, without making a
+        request.
+
+        :param request_id: The request ID of the song.
+
+        :returns: A :class:`~.models.song.Song` object, or ``None`` if no page read so far
+            contained the song.
+
+        Usage:
+
+        .. code-block:: python
+
+            song = catalog.song("36c1d6cda4e7d71b97b237bb")
+        """
+        return self._index.get(request_id)
+
+    def clear(self):
+        """
+        Removes every cached page, so pages are fetched again when they're next read. The index
+        of songs is kept.
+
+        Usage:
+
+        .. code-block:: python
+
+            catalog.clear()
+        """
+        with self._lock:
+            self._pages.clear()
+            self._totals.clear()
+
+    def _fetch(self, search, number) -> List[Dict[str, Any]]:
+        params = {"page": number, "per_page": self.per_page}
+        if search is not None:
+            params["searchPhrase"] = search
+
+        url = API_ENDPOINTS["requestable_songs"].format(
+            radio_url=self._station._request_handler.radio_url,
+            station_id=self._station.id
+        )
+
+        response = self._station._request_handler.get(f"{url}?{urlencode(params)}")
+
+        if isinstance(response, dict):
+            rows = response.get('rows') or []
+            self._totals[search] = response.get('total', len(rows))
+        else:
+            rows = self._split_locally(response, search, number)
+
+        return rows
+
+    def _split_locally(self, response: List[Dict[str, Any]], search, number):
+        # The station ignored the paging parameters, so every page is cut from this response.
+        if search is not None:
+            phrase = search.lower()
+            response = [
+                row for row in response
+                if phrase in ((row.get('song') or {}).get('text') or "").lower()
+            ]
+
+        self._totals[search] = len(response)
+
+        now = time.monotonic()
+        with self._lock:
+            for other in range(1, math.ceil(len(response) / self.per_page) + 1):
+                if other != number:
+                    self._pages[(search, other)] = (
+                        now, response[(other - 1) * self.per_page:other * self.per_page]
+                    )
+
+        return response[(number - 1) * self.per_page:number * self.per_page]
@@ -0,0 +1,264 @@
+"""Class for checking, de-duplicating and pacing song requests to a station."""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Dict, List, Optional
+
+import requests
+
+from ..exceptions import AzuracastException, ClientException
+from .queue_view import QueueView
+
+RequestOutcome = namedtuple("RequestOutcome", ("request_id", "status", "message"))
+RequestOutcome.__doc__ = """
+What happened to a song request. ``status`` is one of:
+
+- ``"pending"``: the request is waiting to be sent.
+- ``"requested"``: the station accepted the request.
+- ``"duplicate"``: the same song is already waiting to be sent.
+- ``"not_requestable"``: the song can't be requested on the station.
+- ``"already_queued"``: the song is in the station's queue.
+- ``"recently_requested"``: the song was requested within the request threshold.
+- ``"rejected"``: the station refused the request, or it couldn't be sent. ``message`` has the
+  reason.
+"""
+
+PENDING = "pending"
+REQUESTED = "requested"
+DUPLICATE = "duplicate"
+NOT_REQUESTABLE = "not_requestable"
+ALREADY_QUEUED = "already_queued"
+RECENTLY_REQUESTED = "recently_requested"
+REJECTED = "rejected"
+
+class RequestManager:
+    """
+    Sends song requests to a station at a steady pace, after checking them locally.
+
+    Requests that would be refused anyway never reach the station: songs that can't be requested,
+    songs already in the queue, songs requested within the request threshold, and requests for a
+    song that is already waiting to be sent. The requests that pass are sent one at a time, at
+    least ``min_interval`` seconds apart, so a burst of requests doesn't flood the station.
+
+    The requestable songs are fetched at most once every ``catalog_ttl`` seconds, and the queue
+    is read through a :class:`~.queue.QueueView`.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.queue import RequestManager
+
+        manager = RequestManager(station, min_interval=2)
+
+        for request_id in incoming_request_ids:
+            outcome = manager.request(request_id)
+
+            if outcome.status != "pending":
+                print(f"Not sent: {outcome.status}")
+
+        for outcome in manager.flush():
+            print(outcome.request_id, outcome.status, outcome.message)
+    """
+    def __init__(
+        self,
+        station,
+        min_interval: float = 1,
+        request_threshold: Optional[int] = None,
+        catalog_ttl: float = 300,
+        queue_view: Optional[QueueView] = None
+    ):
+        """
+        Initializes a :class:`RequestManager` instance.
+
+        :param station: The :class:`~.models.Station` the requests are sent to.
+        :param min_interval: (Optional) The minimum number of seconds between two requests sent
+            to the station. Default: ``1``.
+        :param request_threshold: (Optional) The number of minutes after a song is requested
+            during which it can't be requested again. Leave as ``None`` to use the station's
+            ``request_threshold`` when it's available, or ``15`` otherwise. Default: ``None``.
+        :param catalog_ttl: (Optional) The number of seconds the requestable songs are used for
+            before they're fetched again. Default: ``300``.
+        :param queue_view: (Optional) The :class:`~.queue.QueueView` of the station's queue, to
+            share it with other code. Leave as ``None`` to create one. Default: ``None``.
+        """
+        if min_interval < 0:
+            raise ClientException("min_interval param cannot be negative.")
+
+        if request_threshold is None:
+            request_threshold = getattr(station, "request_threshold", None)
+
+        self._station = station
+        self.min_interval = min_interval
+        self.request_threshold = request_threshold if request_threshold is not None else 15
+        self.catalog_ttl = catalog_ttl
+        self._queue = queue_view if queue_view is not None else QueueView(station)
+
+        self._lock = threading.Lock()
+        self._catalog: Dict[str, str] = {}
+        self._catalog_fetched_at: Optional[float] = None
+        self._pending: "OrderedDict[str, str]" = OrderedDict()
+        self._requested_at: Dict[str, float] = {}
+        self._last_sent_at: Optional[float] = None
+
+    def __repr__(self):
+        return f"RequestManager(station_id={self._station.id}, pending={len(self._pending)})"
+
+    @property
+    def pending(self) -> List[str]:
+        """The request IDs waiting to be sent, in order."""
+        return list(self._pending)
+
+    def request(
+        self,
+        request_id: str
+    ) -> RequestOutcome:
+        """
+        Checks a song request and adds it to the requests waiting to be sent.
+
+        :param request_id: The request ID of the song, as in
+            :attr:`~.models.requestable_song.RequestableSong.request_id`.
+
+        :returns: A :class:`RequestOutcome` tuple, with a status of ``"pending"`` if the request
+            will be sent.
+
+        Usage:
+
+        .. code-block:: python
+
+            outcome = manager.request("36c1d6cda4e7d71b97b237bb")
+        """
+        if not isinstance(request_id, str):
+            raise ClientException("request_id param must be a string.")
+
+        # The catalog and the queue are fetched without holding the lock, so sending requests
+        # isn't held up by the round trips.
+        catalog = self._get_catalog()
+
+        if request_id not in catalog:
+            return RequestOutcome(request_id, NOT_REQUESTABLE, None)
+
+        song_id = catalog[request_id]
+        queued = song_id is not None and any(
+            item.song.id == song_id for item in self._queue.items()
+        )
+
+        with self._lock:
+            if request_id in self._pending:
+                return RequestOutcome(request_id, DUPLICATE, None)
+
+            if song_id is not None and song_id in self._pending.values():
+                return RequestOutcome(request_id, DUPLICATE, None)
+
+            requested_at = self._requested_at.get(song_id)
+            if requested_at is not None and \
+                    time.monotonic() - requested_at < self.request_threshold * 60:
+                return RequestOutcome(request_id, RECENTLY_REQUESTED, None)
+
+            if queued:
+                return RequestOutcome(request_id, ALREADY_QUEUED, None)
+
+            self._pending[request_id] = song_id
+
+            return RequestOutcome(request_id, PENDING, None)
+
+    def flush(
+        self,
+        block: bool = True
+    ) -> List[RequestOutcome]:
+        """
+        Sends the requests waiting to be sent, at least ``min_interval`` seconds apart.
+
+        :param block: (Optional) Whether to wait between requests until every request is sent.
+            If ``False``, only the request that is due now, if any, is sent. Default: ``True``.
+
+        :returns: A list of :class:`RequestOutcome` tuples for the requests that were sent.
+
+        Usage:
+
+        .. code-block:: python
+
+            outcomes = manager.flush()
+
+            # In a bot's event loop:
+            outcomes = manager.flush(block=False)
+        """
+        outcomes = []
+
+        while self._pending:
+            wait = self._wait_time()
+
+            if wait > 0:
+                if not block:
+                    break
+
+                time.sleep(wait)
+
+            outcome = self._send_next()
+
+            # Another thread may have sent the last request in the meantime.
+            if outcome is None:
+                break
+
+            outcomes.append(outcome)
+
+            if not block:
+                break
+
+        return outcomes
+
+    def _wait_time(self) -> float:
+        if self._last_sent_at is None:
+            return 0
+
+        return max(0, self._last_sent_at + self.min_interval - time.monotonic())
+
+    def _send_next(self) -> Optional[RequestOutcome]:
+        with self._lock:
+            if not self._pending:
+                return None
+
+            request_id, song_id = self._pending.popitem(last=False)
+            self._last_sent_at = time.monotonic()
+
+        # Network errors are reported like refusals, so the outcomes of a flush are never lost.
+        try:
+            response = self._station.request_song(request_id)
+        except (AzuracastException, requests.RequestException) as error:
+            return RequestOutcome(request_id, REJECTED, str(error))
+
+        if isinstance(response, dict) and response.get('success') is False:
+            return RequestOutcome(request_id, REJECTED, response.get('message'))
+
+        with self._lock:
+            now = time.monotonic()
+
+            # Songs requested before the threshold can be requested again, so they're dropped
+            # and the dictionary doesn't grow with every song ever requested.
+            self._requested_at = {
+                requested: requested_at
+                for requested, requested_at in self._requested_at.items()
+                if now - requested_at < self.request_threshold * 60
+            }
+            self._requested_at[song_id] = now
+
+        message = response.get('message') if isinstance(response, dict) else None
+
+        return RequestOutcome(request_id, REQUESTED, message)
+
+    def _get_catalog(self) -> Dict[str, str]:
+        # Request ID -> song ID. Only the raw response is kept, without building song objects.
+        now = time.monotonic()
+
+        if self._catalog_fetched_at is None or now - self._catalog_fetched_at >= self.catalog_ttl:
+            response = self._station._request_multiple_instances_of("requestable_songs")
+            catalog = {
+                song['request_id']: (song.get('song') or {}).get('id') for song in response
+            }
+
+            with self._lock:
+                self._catalog = catalog
+                self._catalog_fetched_at = now
+
+        return self._catalog
@@ -0,0 +1,3 @@
+from .delta import NowPlayingDelta, diff_now_playing
+from .watcher import NowPlayingWatcher
+from .subscription import NowPlayingSubscription
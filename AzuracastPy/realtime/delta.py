@@ -0,0 +1,212 @@
+"""Class for the changes between two snapshots of a station's now-playing data."""
+
+from typing import Any, Dict, List, Optional, Union
+
+from ..exceptions import ClientException
+from ..util.general_util import generate_repr_string
+from ..models.now_playing import NowPlaying
+
+Snapshot = Union[NowPlaying, Dict[str, Any]]
+
+def _get(value, name):
+    # Snapshots are either raw API dictionaries or model objects, with the same field names.
+    if value is None:
+        return None
+
+    if isinstance(value, dict):
+        return value.get(name)
+
+    return getattr(value, name, None)
+
+def _to_plain(value):
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+
+    if hasattr(value, "__dict__"):
+        return {
+            key: _to_plain(item) for key, item in vars(value).items()
+            if not key.startswith("_")
+        }
+
+    return value
+
+class NowPlayingDelta:
+    """
+    Represents what changed between two consecutive now-playing snapshots of a station.
+
+    Each attribute is ``None`` (or empty) when that part of the snapshot didn't change, and
+    otherwise holds the new value, taken from the current snapshot. Values are model objects when
+    the snapshots were :class:`~.models.now_playing.NowPlaying` objects, and dictionaries when
+    they were raw API responses.
+
+    The current and next songs can change to nothing, e.g. when the station goes offline, so
+    ``song_changed`` and ``playing_next_changed`` tell whether they changed at all.
+
+    A delta is truthy when anything changed.
+    """
+    def __init__(
+        self,
+        song_changed: bool = False,
+        song=None,
+        history: Optional[List[Any]] = None,
+        playing_next_changed: bool = False,
+        playing_next=None,
+        live=None,
+        is_online: Optional[bool] = None,
+        listeners=None,
+        listener_delta: int = 0
+    ):
+        """
+        Initializes a :class:`NowPlayingDelta` object.
+
+        .. note::
+
+            This class should not be initialized directly. Instead, obtain an instance
+            via: :func:`diff_now_playing`.
+        """
+        self.song_changed = song_changed
+        self.song = song
+        self.history = history or []
+        self.playing_next_changed = playing_next_changed
+        self.playing_next = playing_next
+        self.live = live
+        self.is_online = is_online
+        self.listeners = listeners
+        self.listener_delta = listener_delta
+
+    def __repr__(self):
+        return generate_repr_string(self)
+
+    def __bool__(self):
+        return bool(
+            self.song_changed
+            or self.history
+            or self.playing_next_changed
+            or self.live is not None
+            or self.is_online is not None
+            or self.listeners is not None
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the delta into a dictionary of plain values, leaving out everything that didn't
+        change. The result can be passed straight to :func:`json.dumps`.
+
+        :returns: A dictionary with some of the ``song``, ``history``, ``playing_next``, ``live``,
+            ``is_online``, ``listeners`` and ``listener_delta`` keys. ``song`` and
+            ``playing_next`` are ``None`` when they changed to nothing.
+
+        Usage:
+
+        .. code-block:: python
+
+            message = json.dumps(delta.to_dict())
+        """
+        changes = {}
+
+        for name, value in vars(self).items():
+            if name in ("song_changed", "playing_next_changed"):
+                continue
+
+            if name == "song":
+                if self.song_changed:
+                    changes[name] = _to_plain(value)
+            elif name == "playing_next":
+                if self.playing_next_changed:
+                    changes[name] = _to_plain(value)
+            elif name == "listener_delta":
+                if self.listeners is not None:
+                    changes[name] = value
+            elif value is not None and value != []:
+                changes[name] = _to_plain(value)
+
+        return changes
+
+def diff_now_playing(
+    previous: Optional[Snapshot],
+    current: Snapshot
+) -> NowPlayingDelta:
+    """
+    Works out what changed between two now-playing snapshots of the same station.
+
+    Only the fields that identify a change are compared: the song history ID of the current
+    song, the ID and cue time of the next song, the live status and streamer, the listener
+    counts and the online status. Unchanged parts are never walked.
+
+    :param previous: The older snapshot, as a :class:`~.models.now_playing.NowPlaying` object
+        or a raw API dictionary. When ``None``, everything counts as changed.
+    :param current: The newer snapshot, in the same format as ``previous``.
+
+    :returns: A :class:`NowPlayingDelta` object.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.realtime import diff_now_playing
+
+        delta = diff_now_playing(previous, current)
+
+        if delta.song_changed and delta.song is not None:
+            print(f"Now playing: {delta.song.song.text}")
+    """
+    if previous is not None and type(previous) is not type(current):
+        raise ClientException("Both snapshots must be NowPlaying objects or both dictionaries.")
+
+    delta = NowPlayingDelta()
+
+    song = _get(current, "now_playing")
+    if previous is None or _get(_get(previous, "now_playing"), "sh_id") != _get(song, "sh_id"):
+        delta.song_changed = True
+        delta.song = song
+
+    history = _get(current, "song_history") or []
+    if previous is None:
+        delta.history = list(history)
+    else:
+        previous_history = _get(previous, "song_history") or []
+        latest_id = _get(previous_history[0], "sh_id") if previous_history else None
+
+        # History is newest first, so the new entries are the ones before the newest entry of
+        # the previous snapshot.
+        for entry in history:
+            if _get(entry, "sh_id") == latest_id:
+                break
+
+            delta.history.append(entry)
+
+    playing_next = _get(current, "playing_next")
+    previous_next = _get(previous, "playing_next")
+    if previous is None or (
+        _get(_get(previous_next, "song"), "id") != _get(_get(playing_next, "song"), "id")
+        or _get(previous_next, "cued_at") != _get(playing_next, "cued_at")
+    ):
+        delta.playing_next_changed = True
+        delta.playing_next = playing_next
+
+    live = _get(current, "live")
+    previous_live = _get(previous, "live")
+    if previous is None or (
+        _get(previous_live, "is_live") != _get(live, "is_live")
+        or _get(previous_live, "streamer_name") != _get(live, "streamer_name")
+    ):
+        delta.live = live
+
+    is_online = _get(current, "is_online")
+    if previous is None or _get(previous, "is_online") != is_online:
+        delta.is_online = is_online
+
+    listeners = _get(current, "listeners")
+    previous_listeners = _get(previous, "listeners")
+    if previous is None or any(
+        _get(previous_listeners, count) != _get(listeners, count)
+        for count in ("current", "unique", "total")
+    ):
+        delta.listeners = listeners
+        delta.listener_delta = (_get(listeners, "current") or 0)\
+            - (_get(previous_listeners, "current") or 0)
+
+    return delta
@@ -0,0 +1,292 @@
+"""Class for receiving now-playing updates pushed by the server."""
+
+import asyncio
+import json
+import random
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+import requests
+
+from ..constants import API_ENDPOINTS
+from ..exceptions import AzuracastAPIException, ClientException
+from ..models.now_playing import NowPlaying
+
+def _iter_sse_events(chunks) -> Iterator[Dict[str, str]]:
+    # Splits a server-sent-events stream into events, following the WHATWG parsing rules.
+    buffer = ""
+    data = []
+    fields = {}
+
+    for chunk in chunks:
+        buffer += chunk
+        lines = buffer.splitlines(keepends=True)
+
+        # The last line might still be incomplete, or be a '\r' whose '\n' is in the next chunk.
+        buffer = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+
+        for line in lines:
+            line = line.rstrip("\r\n")
+
+            if not line:
+                if data:
+                    fields["data"] = "\n".join(data)
+                    yield fields
+
+                data = []
+                fields = {}
+                continue
+
+            if line.startswith(":"):
+                continue
+
+            name, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+
+            if name == "data":
+                data.append(value)
+            else:
+                fields[name] = value
+
+class NowPlayingSubscription:
+    """
+    A live stream of now-playing updates for one or more stations.
+
+    The server pushes an update over a single long-lived connection whenever a station's
+    now-playing data changes, so nothing needs to be polled. Dropped connections are reopened
+    with a growing delay, and updates missed while disconnected are recovered when the server
+    still has them.
+
+    Iterating over the subscription yields a :class:`~.models.now_playing.NowPlaying` object
+    for each update. It can be iterated with both ``for`` and ``async for``.
+
+    .. note::
+
+        Requires AzuraCast's high-performance now-playing updates (server-sent events) to be
+        enabled in the radio's settings.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.realtime import NowPlayingSubscription
+
+        subscription = NowPlayingSubscription(client, ["station_one", "station_two"])
+
+        for now_playing in subscription:
+            print(now_playing.now_playing.song.text)
+
+    With ``asyncio``:
+
+    .. code-block:: python
+
+        async for now_playing in NowPlayingSubscription(client, "station_one"):
+            print(now_playing.now_playing.song.text)
+    """
+    def __init__(
+        self,
+        client,
+        shortcodes: Union[str, List[str]],
+        retry_delay: float = 1,
+        max_retry_delay: float = 60,
+        timeout: float = 60
+    ):
+        """
+        Initializes a :class:`NowPlayingSubscription` instance.
+
+        :param client: The :class:`~.AzuracastClient` whose server the updates come from.
+        :param shortcodes: The shortcode of the station to subscribe to, or a list of them.
+            A station's shortcode is available from :attr:`~.models.Station.shortcode`.
+        :param retry_delay: (Optional) The number of seconds to wait before the first attempt to
+            reconnect. The wait doubles with every failed attempt. Default: ``1``.
+        :param max_retry_delay: (Optional) The maximum number of seconds to wait between
+            attempts to reconnect. Default: ``60``.
+        :param timeout: (Optional) The number of seconds without any data from the server,
+            including keep-alive pings, after which the connection is reopened. Default: ``60``.
+        """
+        if isinstance(shortcodes, str):
+            shortcodes = [shortcodes]
+
+        if not shortcodes:
+            raise ClientException("At least one station shortcode must be provided.")
+
+        self._request_handler = client._request_handler
+        self._channels = [f"station:{shortcode}" for shortcode in shortcodes]
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.timeout = timeout
+
+        # Position of the last update received on each channel, used to recover missed updates.
+        self._positions: Dict[str, Dict[str, Any]] = {}
+
+        self._closed = threading.Event()
+        self._response: Optional[requests.Response] = None
+
+    def __repr__(self):
+        return f"NowPlayingSubscription(channels={self._channels})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self) -> Iterator[NowPlaying]:
+        self._closed.clear()
+        failures = 0
+
+        while not self._closed.is_set():
+            try:
+                for now_playing in self._stream():
+                    failures = 0
+                    yield now_playing
+            except requests.RequestException:
+                if self._closed.is_set():
+                    return
+            except (OSError, ValueError, AttributeError):
+                # Closing the connection from another thread can also interrupt the read with
+                # these, which aren't errors then.
+                if self._closed.is_set():
+                    return
+
+                raise
+
+            if self._closed.is_set():
+                return
+
+            # Random jitter keeps many clients from reconnecting at the same moment after the
+            # server restarts.
+            delay = min(self.retry_delay * 2 ** failures, self.max_retry_delay)
+            failures += 1
+            self._closed.wait(random.uniform(delay / 2, delay))
+
+    def __aiter__(self) -> AsyncIterator[NowPlaying]:
+        return self._aiterate()
+
+    def close(self):
+        """
+        Closes the connection and ends the iteration.
+
+        Usage:
+
+        .. code-block:: python
+
+            subscription.close()
+        """
+        self._closed.set()
+
+        response = self._response
+        if response is not None:
+            response.close()
+
+    async def _aiterate(self) -> AsyncIterator[NowPlaying]:
+        # The blocking iterator runs in a worker thread, one update at a time. Closing the
+        # subscription closes the connection, which wakes the thread up.
+        loop = asyncio.get_running_loop()
+        iterator = iter(self)
+        end = object()
+
+        try:
+            while True:
+                now_playing = await loop.run_in_executor(None, next, iterator, end)
+
+                if now_playing is end:
+                    return
+
+                yield now_playing
+        finally:
+            self.close()
+
+    def _stream(self) -> Iterator[NowPlaying]:
+        url = API_ENDPOINTS["now_playing_sse"].format(
+            radio_url=self._request_handler.radio_url
+        )
+
+        response = self._request_handler.get_stream(
+            url,
+            params={"cs": json.dumps({"subs": self._build_subscriptions()})},
+            timeout=self.timeout
+        )
+
+        self._response = response
+
+        with response:
+            if response.status_code in (401, 403, 404):
+                message = f"Unable to subscribe to now-playing updates ({response.status_code})."\
+                           " Make sure high-performance now-playing updates are enabled."
+                raise AzuracastAPIException(message)
+
+            response.raise_for_status()
+
+            # Event streams are always UTF-8, whatever the headers say.
+            response.encoding = "utf-8"
+            chunks = response.iter_content(chunk_size=None, decode_unicode=True)
+
+            for event in _iter_sse_events(chunks):
+                if "retry" in event and event["retry"].isdigit():
+                    self.retry_delay = int(event["retry"]) / 1000
+
+                try:
+                    message = json.loads(event["data"])
+                except ValueError:
+                    continue
+
+                yield from self._parse_message(message)
+
+                if self._closed.is_set():
+                    return
+
+    def _build_subscriptions(self) -> Dict[str, Dict[str, Any]]:
+        subscriptions = {}
+
+        for channel in self._channels:
+            subscription = {"recover": True}
+            subscription.update(self._positions.get(channel, {}))
+            subscriptions[channel] = subscription
+
+        return subscriptions
+
+    def _parse_message(self, message) -> Iterator[NowPlaying]:
+        if "connect" in message:
+            connect = message["connect"]
+
+            subscriptions = connect.get("subs") or {}
+
+            # The positions are reset first, so nothing after a reconnect is checked against the
+            # offsets of a stream that was replaced.
+            for channel, subscription in subscriptions.items():
+                if "epoch" in subscription:
+                    position = self._positions.setdefault(channel, {})
+
+                    if position.get("epoch") != subscription["epoch"]:
+                        position.clear()
+                        position["epoch"] = subscription["epoch"]
+
+            # Recovered updates come oldest first, before the latest cached update in 'data'.
+            for channel, subscription in subscriptions.items():
+                for publication in subscription.get("publications") or []:
+                    yield from self._parse_publication(channel, publication)
+
+            # Newer servers send the cached now-playing data of each channel in 'data'.
+            for publication in connect.get("data") or []:
+                yield from self._parse_publication(publication.get("channel"), publication)
+
+        elif "pub" in message:
+            yield from self._parse_publication(message.get("channel"), message["pub"])
+
+    def _parse_publication(self, channel, publication) -> Iterator[NowPlaying]:
+        offset = publication.get("offset")
+
+        if channel is not None and offset is not None:
+            position = self._positions.setdefault(channel, {})
+
+            # Recovered updates can overlap the ones that were already received.
+            if offset <= position.get("offset", -1):
+                return
+
+            position["offset"] = offset
+
+        now_playing = (publication.get("data") or {}).get("np")
+
+        if now_playing:
+            yield NowPlaying(**now_playing)
@@ -0,0 +1,398 @@
+"""Class for watching the now-playing data of stations for changes."""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from ..exceptions import AzuracastException, ClientException
+from ..models.now_playing import NowPlaying
+
+from .delta import diff_now_playing
+
+Callback = Callable[[NowPlaying, NowPlaying], None]
+
+_logger = logging.getLogger(__name__)
+
+class NowPlayingWatcher:
+    """
+    Polls the now-playing data of one or more stations and calls back when something changes.
+
+    Instead of polling on a fixed interval, each station is polled again shortly after its current
+    song is due to end. When several stations are due at the same time, they are fetched together
+    with a single request for the now-playing data of every station.
+
+    Every callback is called with the previous and the current
+    :class:`~.models.now_playing.NowPlaying` object of a station.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.realtime import NowPlayingWatcher
+
+        watcher = NowPlayingWatcher(client, station_ids=[1, 2])
+
+        @watcher.on_song_change
+        def announce(previous, current):
+            print(f"{current.station.name}: {current.now_playing.song.text}")
+
+        watcher.run()
+    """
+    def __init__(
+        self,
+        client,
+        station_ids: Optional[List[int]] = None,
+        min_interval: float = 5,
+        max_interval: float = 60,
+        jitter: float = 2,
+        listener_threshold: int = 1,
+        batch_threshold: int = 2,
+        resolve_interval: float = 300
+    ):
+        """
+        Initializes a :class:`NowPlayingWatcher` instance.
+
+        :param client: The :class:`~.AzuracastClient` used to fetch now-playing data.
+        :param station_ids: (Optional) The IDs of the stations to watch.
+            Leave as ``None`` to watch every station on the radio. Default: ``None``.
+        :param min_interval: (Optional) The minimum number of seconds between two polls of a
+            station. Default: ``5``.
+        :param max_interval: (Optional) The maximum number of seconds between two polls of a
+            station, which bounds how late listener and live changes are noticed.
+            Default: ``60``.
+        :param jitter: (Optional) The maximum number of random seconds added to each poll, so
+            stations and watchers don't all poll at the same moment. Default: ``2``.
+        :param listener_threshold: (Optional) The change in the current listener count needed
+            to call the listener callbacks. Default: ``1``.
+        :param batch_threshold: (Optional) The number of stations that must be due at once for
+            them to be fetched in a single request for every station. Default: ``2``.
+        :param resolve_interval: (Optional) The number of seconds between two requests for every
+            station when ``station_ids`` is ``None``, so stations that are added to or removed
+            from the radio are noticed. Default: ``300``.
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            message = "min_interval param must be positive and no larger than max_interval."
+            raise ClientException(message)
+
+        if jitter < 0:
+            raise ClientException("jitter param cannot be negative.")
+
+        self._client = client
+        self._station_ids = list(station_ids) if station_ids is not None else None
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.listener_threshold = listener_threshold
+        self.batch_threshold = batch_threshold
+        self.resolve_interval = resolve_interval
+
+        self._now_playing: Dict[int, NowPlaying] = {}
+        self._next_poll_at: Dict[int, float] = {}
+        self._resolved_at: Optional[float] = None
+
+        self._song_change_callbacks: List[Callback] = []
+        self._live_change_callbacks: List[Callback] = []
+        self._online_change_callbacks: List[Callback] = []
+        self._listeners_change_callbacks: List[Callback] = []
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self):
+        return f"NowPlayingWatcher(stations={sorted(self._now_playing)})"
+
+    def now_playing(
+        self,
+        station_id: int
+    ) -> Optional[NowPlaying]:
+        """
+        Retrieves the latest now-playing data of a watched station, without making a request.
+
+        :param station_id: The ID of the station.
+
+        :returns: A :class:`~.models.now_playing.NowPlaying` object, or ``None`` if the station
+            hasn't been polled yet.
+
+        Usage:
+
+        .. code-block:: python
+
+            now_playing = watcher.now_playing(1)
+        """
+        return self._now_playing.get(station_id)
+
+    def on_song_change(
+        self,
+        callback: Callback
+    ) -> Callback:
+        """
+        Registers a function that is called when a station starts playing a new song.
+
+        :param callback: The function to call. It can also be used as a decorator.
+
+        :returns: The ``callback``.
+
+        Usage:
+
+        .. code-block:: python
+
+            watcher.on_song_change(lambda previous, current: print(current.now_playing.song.text))
+        """
+        self._song_change_callbacks.append(callback)
+
+        return callback
+
+    def on_live_change(
+        self,
+        callback: Callback
+    ) -> Callback:
+        """
+        Registers a function that is called when a streamer connects to or disconnects from a
+        station.
+
+        :param callback: The function to call. It can also be used as a decorator.
+
+        :returns: The ``callback``.
+
+        Usage:
+
+        .. code-block:: python
+
+            @watcher.on_live_change
+            def announce_dj(previous, current):
+                if current.live.is_live:
+                    print(f"{current.live.streamer_name} is live!")
+        """
+        self._live_change_callbacks.append(callback)
+
+        return callback
+
+    def on_online_change(
+        self,
+        callback: Callback
+    ) -> Callback:
+        """
+        Registers a function that is called when a station goes online or offline.
+
+        :param callback: The function to call. It can also be used as a decorator.
+
+        :returns: The ``callback``.
+
+        Usage:
+
+        .. code-block:: python
+
+            @watcher.on_online_change
+            def alert(previous, current):
+                if not current.is_online:
+                    print(f"{current.station.name} is down.")
+        """
+        self._online_change_callbacks.append(callback)
+
+        return callback
+
+    def on_listeners_change(
+        self,
+        callback: Callback
+    ) -> Callback:
+        """
+        Registers a function that is called when the current listener count of a station
+        changes by at least ``listener_threshold``.
+
+        :param callback: The function to call. It can also be used as a decorator.
+
+        :returns: The ``callback``.
+
+        Usage:
+
+        .. code-block:: python
+
+            @watcher.on_listeners_change
+            def log_listeners(previous, current):
+                print(current.listeners.current - previous.listeners.current)
+        """
+        self._listeners_change_callbacks.append(callback)
+
+        return callback
+
+    def poll(self) -> float:
+        """
+        Fetches the now-playing data of every station that is due to be polled and calls the
+        callbacks of anything that changed.
+
+        :returns: The number of seconds until the next station is due.
+
+        Usage:
+
+        .. code-block:: python
+
+            import time
+
+            while True:
+                time.sleep(watcher.poll())
+        """
+        now = time.monotonic()
+
+        for now_playing in self._fetch_due(now):
+            self._update(now_playing, now)
+
+        due_at = list(self._next_poll_at.values())
+
+        if self._station_ids is None:
+            due_at.append(self._resolved_at + self.resolve_interval)
+
+        if not due_at:
+            return self.min_interval
+
+        return max(0, min(due_at) - time.monotonic())
+
+    def run(self):
+        """
+        Polls the stations until :meth:`stop` is called.
+
+        Request errors don't stop the watcher. The stations are polled again after
+        ``min_interval`` seconds. Errors raised by callbacks are logged and the other callbacks
+        are still called.
+
+        Usage:
+
+        .. code-block:: python
+
+            watcher.run()
+        """
+        self._stop_event.clear()
+
+        while not self._stop_event.is_set():
+            try:
+                delay = self.poll()
+            except (AzuracastException, requests.RequestException):
+                delay = self.min_interval
+
+            self._stop_event.wait(delay)
+
+    def start(self):
+        """
+        Starts polling the stations in a background thread.
+
+        Usage:
+
+        .. code-block:: python
+
+            watcher.start()
+        """
+        if self._thread is not None and self._thread.is_alive():
+            raise ClientException("The watcher is already running.")
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops a running watcher.
+
+        Usage:
+
+        .. code-block:: python
+
+            watcher.stop()
+        """
+        self._stop_event.set()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+
+    def _fetch_due(self, now) -> List[NowPlaying]:
+        if self._station_ids is None and (
+            self._resolved_at is None or now - self._resolved_at >= self.resolve_interval
+        ):
+            return self._resolve_stations(now)
+
+        station_ids = self._station_ids if self._station_ids is not None else self._now_playing
+        due = [
+            station_id for station_id in station_ids
+            if self._next_poll_at.get(station_id, 0) <= now
+        ]
+
+        if not due:
+            return []
+
+        # One response for every station costs one request, while 'due' separate responses
+        # cost one request each.
+        if len(due) >= self.batch_threshold:
+            watched = set(station_ids)
+            fetched = [np for np in self._client.now_playing() if np.station.id in watched]
+        else:
+            # The API returns every station's data, as a list, for an ID it doesn't know.
+            fetched = [
+                now_playing for now_playing in map(self._client.now_playing, due)
+                if isinstance(now_playing, NowPlaying)
+            ]
+
+        missing = set(due).difference(now_playing.station.id for now_playing in fetched)
+
+        for station_id in missing:
+            _logger.warning("Station %r was not found on the radio.", station_id)
+            self._next_poll_at[station_id] = now + self.max_interval
+
+        return fetched
+
+    def _resolve_stations(self, now) -> List[NowPlaying]:
+        # Fetches every station, and stops watching the ones that were removed from the radio.
+        now_playing = self._client.now_playing()
+        on_radio = {np.station.id for np in now_playing}
+
+        for station_id in set(self._now_playing).difference(on_radio):
+            del self._now_playing[station_id]
+            self._next_poll_at.pop(station_id, None)
+
+        self._resolved_at = now
+
+        return now_playing
+
+    def _update(self, current: NowPlaying, now):
+        station_id = current.station.id
+        previous = self._now_playing.get(station_id)
+
+        self._now_playing[station_id] = current
+        self._next_poll_at[station_id] = now + self._next_delay(current)
+
+        if previous is None:
+            return
+
+        delta = diff_now_playing(previous, current)
+
+        if delta.is_online is not None:
+            self._call(self._online_change_callbacks, previous, current)
+
+        if delta.live is not None and previous.live.is_live != current.live.is_live:
+            self._call(self._live_change_callbacks, previous, current)
+
+        if delta.song_changed:
+            self._call(self._song_change_callbacks, previous, current)
+
+        if delta.listener_delta and abs(delta.listener_delta) >= self.listener_threshold:
+            self._call(self._listeners_change_callbacks, previous, current)
+
+    def _next_delay(self, now_playing: NowPlaying) -> float:
+        if not now_playing.is_online or now_playing.now_playing is None:
+            delay = self.max_interval
+        else:
+            # Past its end, the song is probably being replaced right now, so check back soon.
+            remaining = now_playing.now_playing.remaining or 0
+            delay = min(max(remaining, self.min_interval), self.max_interval)
+
+        return delay + random.uniform(0, self.jitter)
+
+    def _call(self, callbacks, previous, current):
+        # A failing callback is logged, so it can't stop the watcher or the other callbacks.
+        for callback in callbacks:
+            try:
+                callback(previous, current)
+            except Exception:
+                _logger.exception("Now-playing callback %r failed.", callback)
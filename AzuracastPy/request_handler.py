@@ -1,6 +1,6 @@
 """Handles all requests made by the library."""
 
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Iterable
 from json.decoder import JSONDecodeError
 from lxml import html # A HTML parser is needed to extract some errors
 
@@ -30,12 +30,36 @@ class RequestHandler:
     ):
         return self._send_request(method='POST', url=url, body=body)
 
+    def post_stream(
+        self,
+        url: str,
+        body: Iterable[bytes]
+    ):
+        # The JSON body is sent as it's generated, so large uploads are never held in memory.
+        return self._send_request(method='POST', url=url, data=body)
+
     def get(
         self,
         url: str
     ):
         return self._send_request(method='GET', url=url)
 
+    def get_stream(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 60
+    ) -> requests.Response:
+        # Opens a long-lived response, e.g. an event stream, that is read as it arrives. The
+        # response is returned as is, so the caller checks its status and closes it.
+        return requests.get(
+            url,
+            params=params,
+            headers={**self._headers, 'accept': 'text/event-stream'},
+            stream=True,
+            timeout=(10, timeout)
+        )
+
     def put(
         self,
         url: str,
@@ -60,13 +84,19 @@ class RequestHandler:
         self,
         method: str,
         url: str,
-        body: Optional[Dict[str, Any]] = None
+        body: Optional[Dict[str, Any]] = None,
+        data: Optional[Iterable[bytes]] = None
     ) -> Dict[str, Any]:
+        headers = self._headers
+        if data is not None:
+            headers = {**headers, 'content-type': 'application/json'}
+
         with requests.request(
             method=method,
             url=url,
             json=body,
-            headers=self._headers,
+            data=data,
+            headers=headers,
             timeout=10
         ) as response:
             if response.status_code == 500:
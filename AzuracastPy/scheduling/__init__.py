@@ -0,0 +1,10 @@
+from .interval_index import IntervalIndex
+from .conflicts import ScheduleConflict, ScheduleConflictDetector
+from .recurrence import Occurrence, expand_schedule, expand_schedule_item
+from .slot_table import ScheduledOwner, ScheduleSlotTable
+from .rotation_simulator import (
+    RotationReport,
+    RotationSimulator,
+    SeparationViolation,
+    SimulatedPlay
+)
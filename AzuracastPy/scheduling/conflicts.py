@@ -0,0 +1,372 @@
+"""Class for finding overlapping schedule items across the playlists and streamers of a station."""
+
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..exceptions import ClientException
+from ..util.general_util import generate_repr_string
+from ..util.schedule_util import (
+    MINUTES_PER_DAY,
+    MINUTES_PER_WEEK,
+    minutes_to_hhmm,
+    normalize_schedule_item,
+    weekly_intervals
+)
+from .interval_index import IntervalIndex
+
+def _owner_key(owner) -> Tuple[str, Any]:
+    return type(owner).__name__, owner.id
+
+def _describe(owner) -> str:
+    if owner is None:
+        return "the new schedule item"
+
+    name = getattr(owner, "name", None) or getattr(owner, "display_name", None)
+    return f"{type(owner).__name__.lower()} '{name or owner.id}'"
+
+class _Piece:
+    # A stretch of a weekly occurrence that doesn't cross the end of the week. 'origin' is the
+    # minute the occurrence started at, which is negative when it started in the previous week.
+    __slots__ = ("key", "owner", "item", "normalized", "origin")
+
+    def __init__(self, key, owner, item, normalized, origin):
+        self.key = key
+        self.owner = owner
+        self.item = item
+        self.normalized = normalized
+        self.origin = origin
+
+def _pieces(key, owner, item) -> Iterable[Tuple[int, int, _Piece]]:
+    normalized = normalize_schedule_item(item)
+
+    for start, end, _ in weekly_intervals(normalized):
+        piece = _Piece(key, owner, item, normalized, start)
+
+        if end <= MINUTES_PER_WEEK:
+            yield start, end, piece
+        else:
+            yield start, MINUTES_PER_WEEK, piece
+            yield 0, end - MINUTES_PER_WEEK, _Piece(
+                key, owner, item, normalized, start - MINUTES_PER_WEEK
+            )
+
+def _owner_intervals(key, owner) -> List[Tuple[int, int, _Piece]]:
+    return [
+        interval
+        for item in owner.schedule_items or []
+        for interval in _pieces(key, owner, item)
+    ]
+
+def _share_a_date(first: _Piece, second: _Piece) -> bool:
+    # The pieces overlap every week, but only matter on dates allowed by both items. If the
+    # first occurrence starts on day D, the second one starts on day D + offset.
+    offset = second.origin // MINUTES_PER_DAY - first.origin // MINUTES_PER_DAY
+    weekday = first.origin // MINUTES_PER_DAY % 7 + 1
+
+    lowest = first.normalized.start_date
+    if second.normalized.start_date is not None:
+        shifted = second.normalized.start_date - timedelta(days=offset)
+        lowest = shifted if lowest is None else max(lowest, shifted)
+
+    highest = first.normalized.end_date
+    if second.normalized.end_date is not None:
+        shifted = second.normalized.end_date - timedelta(days=offset)
+        highest = shifted if highest is None else min(highest, shifted)
+
+    if lowest is None or highest is None:
+        return True
+
+    if lowest > highest:
+        return False
+
+    if (highest - lowest).days >= 6:
+        return True
+
+    return any(
+        (lowest + timedelta(days=i)).isoweekday() == weekday
+        for i in range((highest - lowest).days + 1)
+    )
+
+class ScheduleConflict:
+    """
+    Represents an overlap between two schedule items of different playlists or streamers.
+
+    ``day`` is the day of the week the overlap starts on, from ``1`` for Monday to ``7`` for
+    Sunday. ``start_time`` and ``end_time`` are in the ``HHMM`` format of schedule items.
+    """
+    def __init__(
+        self,
+        owner,
+        schedule_item,
+        other_owner,
+        other_schedule_item,
+        day: int,
+        start_time: int,
+        end_time: int
+    ):
+        """
+        Initializes a :class:`ScheduleConflict` object.
+
+        .. note::
+
+            This class should not be initialized directly. Instead, obtain instances
+            via: :meth:`ScheduleConflictDetector.conflicts` or
+            :meth:`ScheduleConflictDetector.all_conflicts`.
+        """
+        self.owner = owner
+        self.schedule_item = schedule_item
+        self.other_owner = other_owner
+        self.other_schedule_item = other_schedule_item
+        self.day = day
+        self.start_time = start_time
+        self.end_time = end_time
+
+    def __repr__(self):
+        return generate_repr_string(self)
+
+    def __str__(self):
+        return f"{_describe(self.owner)} overlaps {_describe(self.other_owner)} on day "\
+               f"{self.day} from {self.start_time:04d} to {self.end_time:04d}"
+
+class ScheduleConflictDetector:
+    """
+    Finds overlapping schedule items across the playlists and streamers of a station.
+
+    Every schedule item is laid out on a weekly timeline, one interval for each day it plays,
+    and stored in an :class:`~.scheduling.interval_index.IntervalIndex`. Checking a schedule
+    item then takes ``O(log n + k)`` time, for ``n`` stored intervals and ``k`` overlaps, instead
+    of comparing it with every other item. Overlaps on the weekly timeline only count when both
+    items are active on the same date, according to their start and end dates.
+
+    Overlaps between the schedule items of the same playlist or streamer are ignored.
+
+    Usage:
+
+    .. code-block:: python
+
+        from AzuracastPy.scheduling import ScheduleConflictDetector
+
+        detector = ScheduleConflictDetector.from_station(station)
+
+        for conflict in detector.all_conflicts():
+            print(conflict)
+
+        # Raises a ClientException instead of creating an overlapping playlist.
+        station.playlist.create(
+            name="Breakfast Show",
+            schedule=station.playlist.generate_schedule_items(
+                ("06:00", "09:00", None, None, ["monday", "friday"], False)
+            ),
+            conflict_detector=detector
+        )
+    """
+    def __init__(
+        self,
+        owners: Iterable[Any] = ()
+    ):
+        """
+        Initializes a :class:`ScheduleConflictDetector` instance.
+
+        :param owners: (Optional) The :class:`~.models.playlist.Playlist` and
+            :class:`~.models.streamer.Streamer` objects whose schedule items are checked.
+            Default: ``()``.
+        """
+        self._owners: Dict[Tuple[str, Any], Any] = {}
+        self._index: Optional[IntervalIndex] = None
+        # The intervals each owner has in the index, so they can be replaced in place.
+        self._intervals: Dict[Tuple[str, Any], List[Tuple[int, int, _Piece]]] = {}
+
+        for owner in owners:
+            self.add(owner)
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def __repr__(self):
+        return f"ScheduleConflictDetector(owners={len(self._owners)})"
+
+    @classmethod
+    def from_station(
+        cls,
+        station
+    ) -> "ScheduleConflictDetector":
+        """
+        Creates a detector from every playlist and streamer of a station.
+
+        :param station: The :class:`~.models.Station` whose schedules are checked.
+
+        :returns: A :class:`ScheduleConflictDetector` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            detector = ScheduleConflictDetector.from_station(station)
+        """
+        return cls(station.playlists() + station.streamers())
+
+    def add(
+        self,
+        owner
+    ):
+        """
+        Adds the schedule items of a playlist or streamer, replacing the ones it had before.
+
+        :param owner: The :class:`~.models.playlist.Playlist` or
+            :class:`~.models.streamer.Streamer` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            detector.add(playlist)
+        """
+        key = _owner_key(owner)
+        self._owners[key] = owner
+
+        if self._index is not None:
+            self._index.remove(self._intervals.pop(key, []))
+            self._intervals[key] = _owner_intervals(key, owner)
+            self._index.add(self._intervals[key])
+
+    def remove(
+        self,
+        owner
+    ):
+        """
+        Removes the schedule items of a playlist or streamer.
+
+        :param owner: The :class:`~.models.playlist.Playlist` or
+            :class:`~.models.streamer.Streamer` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            detector.remove(playlist)
+        """
+        key = _owner_key(owner)
+
+        if self._owners.pop(key, None) is not None and self._index is not None:
+            self._index.remove(self._intervals.pop(key, []))
+
+    def conflicts(
+        self,
+        schedule_items: Iterable[Any],
+        owner: Optional[Any] = None
+    ) -> List[ScheduleConflict]:
+        """
+        Finds the stored schedule items that overlap new schedule items.
+
+        :param schedule_items: The new schedule items, either generated with
+            ``generate_schedule_item(s)`` or taken from a playlist or streamer.
+        :param owner: (Optional) The playlist or streamer the new items are for. Its stored
+            items aren't treated as conflicts. Default: ``None``.
+
+        :returns: A list of :class:`ScheduleConflict` objects.
+
+        Usage:
+
+        .. code-block:: python
+
+            item = station.playlist.generate_schedule_item(start_time="22:00", end_time="02:00")
+            overlaps = detector.conflicts([item], owner=playlist)
+        """
+        index = self._get_index()
+        key = _owner_key(owner) if owner is not None else None
+
+        found = []
+        for start, end, piece in (
+            interval
+            for item in schedule_items
+            for interval in _pieces(key, owner, item)
+        ):
+            found.extend(self._overlaps(index, start, end, piece, lambda other: other.key != key))
+
+        return found
+
+    def check(
+        self,
+        schedule_items: Iterable[Any],
+        owner: Optional[Any] = None
+    ):
+        """
+        Raises a :class:`~.exceptions.ClientException` if new schedule items overlap stored ones.
+
+        :param schedule_items: The new schedule items.
+        :param owner: (Optional) The playlist or streamer the new items are for.
+            Default: ``None``.
+
+        Usage:
+
+        .. code-block:: python
+
+            detector.check(items, owner=streamer)
+            streamer.schedule.add(*items)
+        """
+        conflicts = self.conflicts(schedule_items, owner)
+
+        if conflicts:
+            message = "The schedule items overlap existing ones: "\
+                      f"{'; '.join(str(conflict) for conflict in conflicts)}."
+            raise ClientException(message)
+
+    def all_conflicts(self) -> List[ScheduleConflict]:
+        """
+        Finds every overlap between the stored schedule items.
+
+        :returns: A list of :class:`ScheduleConflict` objects, each overlap reported once.
+
+        Usage:
+
+        .. code-block:: python
+
+            for conflict in detector.all_conflicts():
+                print(conflict.owner.name, conflict.other_owner.name, conflict.day)
+        """
+        index = self._get_index()
+        found = []
+
+        intervals = list(index)
+
+        # Every pair is found from both of its pieces, so only the pair whose first piece comes
+        # earlier in the index is kept.
+        positions = {id(piece): i for i, (_, _, piece) in enumerate(intervals)}
+
+        for i, (start, end, piece) in enumerate(intervals):
+            found.extend(self._overlaps(
+                index, start, end, piece,
+                lambda other: other.key != piece.key and positions[id(other)] > i
+            ))
+
+        return found
+
+    def _overlaps(self, index, start, end, piece, include) -> List[ScheduleConflict]:
+        found = []
+
+        for other_start, other_end, other in index.overlapping(start, end):
+            if not include(other) or not _share_a_date(piece, other):
+                continue
+
+            overlap_start = max(start, other_start)
+            overlap_end = min(end, other_end)
+
+            found.append(ScheduleConflict(
+                piece.owner, piece.item, other.owner, other.item,
+                overlap_start // MINUTES_PER_DAY + 1,
+                minutes_to_hhmm(overlap_start), minutes_to_hhmm(overlap_end)
+            ))
+
+        return found
+
+    def _get_index(self) -> IntervalIndex:
+        # The index is built on the first query. Later changes update it in place.
+        if self._index is None:
+            self._intervals = {
+                key: _owner_intervals(key, owner) for key, owner in self._owners.items()
+            }
+            self._index = IntervalIndex(
+                interval for intervals in self._intervals.values() for interval in intervals
+            )
+
+        return self._index
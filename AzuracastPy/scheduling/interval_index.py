@@ -0,0 +1,191 @@
+"""Class for finding the intervals that overlap a range."""
+
+from bisect import bisect_left
+from math import isqrt
+from typing import Any, Iterable, Iterator, List, Tuple
+
+# Up to this many added intervals are searched one by one before the tree is rebuilt.
+_MIN_PENDING = 16
+
+class _Node:
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, center, by_start, by_end, left, right):
+        self.center = center
+        self.by_start = by_start
+        self.by_end = by_end
+        self.left = left
+        self.right = right
+
+def _build(intervals) -> "_Node":
+    if not intervals:
+        return None
+
+    # The median start always ends up at this node, so both halves get smaller.
+    center = sorted(interval[0] for interval in intervals)[len(intervals) // 2]
+
+    left, right, here = [], [], []
+
+    for interval in intervals:
+        if interval[1] <= center:
+            left.append(interval)
+        elif interval[0] > center:
+            right.append(interval)
+        else:
+            here.append(interval)
+
+    return _Node(
+        center,
+        sorted(here, key=lambda interval: interval[0]),
+        sorted(here, key=lambda interval: interval[1], reverse=True),
+        _build(left),
+        _build(right)
+    )
+
+class IntervalIndex:
+    """
+    An index of half-open ``[start, end)`` intervals, each with a value attached.
+
+    :meth:`overlapping` runs in ``O(log n + k)`` time for ``n`` intervals and ``k`` results.
+    Intervals that start inside the range are found with a binary search over the intervals
+    sorted by start, and intervals that started earlier but are still running are found with a
+    centered interval tree.
+
+    Intervals added with :meth:`add` are searched one by one until there are more than about
+    ``sqrt(n)`` of them, and intervals removed with :meth:`remove` are skipped until they make
+    up half of the tree. Only then is the tree rebuilt, so a few changes don't cost a rebuild
+    each.
+    """
+    def __init__(
+        self,
+        intervals: Iterable[Tuple[int, int, Any]]
+    ):
+        """
+        Initializes an :class:`IntervalIndex` instance.
+
+        :param intervals: ``(start, end, value)`` tuples. Empty intervals are left out.
+        """
+        self._rebuild(interval for interval in intervals if interval[1] > interval[0])
+
+    def __len__(self) -> int:
+        return len(self._intervals) - len(self._removed) + len(self._pending)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, Any]]:
+        for interval in self._intervals:
+            if id(interval) not in self._removed:
+                yield interval
+
+        yield from self._pending
+
+    def __repr__(self):
+        return f"IntervalIndex(intervals={len(self)})"
+
+    def add(
+        self,
+        intervals: Iterable[Tuple[int, int, Any]]
+    ):
+        """
+        Adds intervals to the index.
+
+        :param intervals: ``(start, end, value)`` tuples. Empty intervals are left out.
+        """
+        self._pending.extend(interval for interval in intervals if interval[1] > interval[0])
+
+        if len(self._pending) > max(_MIN_PENDING, isqrt(len(self._intervals))):
+            self._rebuild(list(self))
+
+    def remove(
+        self,
+        intervals: Iterable[Tuple[int, int, Any]]
+    ):
+        """
+        Removes intervals from the index.
+
+        :param intervals: The ``(start, end, value)`` tuples to remove, the same objects that
+            were added or returned by a query. Tuples that aren't in the index are ignored.
+        """
+        ids = {id(interval) for interval in intervals}
+
+        self._pending = [interval for interval in self._pending if id(interval) not in ids]
+        self._removed.update(ids.intersection(self._tree_ids))
+
+        if len(self._removed) * 2 > len(self._intervals):
+            self._rebuild(list(self))
+
+    def overlapping(
+        self,
+        start: int,
+        end: int
+    ) -> List[Tuple[int, int, Any]]:
+        """
+        Finds the intervals that overlap ``[start, end)``.
+
+        :param start: The start of the range.
+        :param end: The end of the range.
+
+        :returns: A list of ``(start, end, value)`` tuples.
+        """
+        if end <= start:
+            return []
+
+        found = self.containing(start)
+
+        first = bisect_left(self._starts, start)
+        last = bisect_left(self._starts, end, lo=first)
+        found.extend(
+            interval for interval in self._intervals[first:last]
+            if id(interval) not in self._removed
+        )
+        found.extend(
+            interval for interval in self._pending
+            if start <= interval[0] < end
+        )
+
+        return found
+
+    def containing(
+        self,
+        point: int
+    ) -> List[Tuple[int, int, Any]]:
+        """
+        Finds the intervals that started before ``point`` and are still running at it.
+
+        :param point: The point to look up.
+
+        :returns: A list of ``(start, end, value)`` tuples.
+        """
+        found = [
+            interval for interval in self._pending
+            if interval[0] < point < interval[1]
+        ]
+        node = self._root
+
+        while node is not None:
+            if point < node.center:
+                for interval in node.by_start:
+                    if interval[0] >= point:
+                        break
+                    if id(interval) not in self._removed:
+                        found.append(interval)
+
+                node = node.left
+            else:
+                for interval in node.by_end:
+                    if interval[1] <= point:
+                        break
+                    if interval[0] < point and id(interval) not in self._removed:
+                        found.append(interval)
+
+                node = node.right
+
+        return found
+
+    def _rebuild(self, intervals):
+        intervals = sorted(intervals, key=lambda interval: interval[0])
+
+        self._intervals = intervals
+        self._starts = [interval[0] for interval in intervals]
+        self._root = _build(intervals)
+        self._tree_ids = {id(interval) for interval in intervals}
+        self._removed = set()
+        self._pending = []
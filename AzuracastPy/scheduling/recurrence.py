@@ -0,0 +1,150 @@
+"""Functions for expanding schedule items into the dates and times they play at."""
+
+import heapq
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+from typing import Any, Iterable, Iterator, Optional
+
+from ..util.schedule_util import get_zone, localize, normalize_schedule_item
+
+Occurrence = namedtuple("Occurrence", ("start", "end", "owner"))
+Occurrence.__doc__ = """
+A single occurrence of a schedule item: a ``start`` and ``end`` :class:`~datetime.datetime`, and
+the playlist or streamer (``owner``) it belongs to.
+"""
+
+def expand_schedule_item(
+    schedule_item,
+    start: datetime,
+    end: datetime,
+    owner: Optional[Any] = None,
+    timezone=None
+) -> Iterator[Occurrence]:
+    """
+    Lazily lists the occurrences of a schedule item that overlap a window of time, in order.
+
+    Only one occurrence is held in memory at a time, so long windows cost nothing until they're
+    read. Occurrences that started before the window but are still running, e.g. from the night
+    before, are included.
+
+    :param schedule_item: The schedule item, from a playlist's or streamer's
+        ``schedule_items`` or generated with ``generate_schedule_item``.
+    :param start: The start of the window.
+    :param end: The end of the window.
+    :param owner: (Optional) The playlist or streamer the schedule item belongs to, attached to
+        each occurrence. Default: ``None``.
+    :param timezone: (Optional) The time zone the schedule is in, as a name such as
+        :attr:`~.models.Station.timezone` or a :class:`~datetime.tzinfo` object. Naive ``start``
+        and ``end`` values are taken to be in this time zone, and the occurrences are returned in
+        it. Leave as ``None`` to use the time zone of ``start``. Default: ``None``.
+
+    :returns: An iterator of :class:`Occurrence` tuples.
+
+    Usage:
+
+    .. code-block:: python
+
+        from datetime import datetime, timedelta
+
+        from AzuracastPy.scheduling import expand_schedule_item
+
+        now = datetime.now()
+
+        for occurrence in expand_schedule_item(
+            playlist.schedule_items[0], now, now + timedelta(days=7), timezone=station.timezone
+        ):
+            print(occurrence.start, occurrence.end)
+    """
+    zone = get_zone(timezone, start)
+    start = localize(start, zone)
+    end = localize(end, zone)
+
+    item = normalize_schedule_item(schedule_item)
+    start_time = time(item.start // 60, item.start % 60)
+    end_minutes = (item.start + item.duration) % 1440
+    end_time = time(end_minutes // 60, end_minutes % 60)
+    crosses_midnight = item.start + item.duration >= 1440
+
+    # An occurrence from the day before the window can still be running when it starts.
+    first_day = start.date() - timedelta(days=1)
+    last_day = end.date()
+
+    if item.start_date is not None and item.start_date > first_day:
+        first_day = item.start_date
+    if item.end_date is not None and item.end_date < last_day:
+        last_day = item.end_date
+
+    if first_day > last_day:
+        return
+
+    # The days within a week of the first day that the item plays on, as offsets. Every later
+    # occurrence is a whole number of weeks after one of them.
+    offsets = sorted((day - first_day.isoweekday()) % 7 for day in item.days)
+
+    week_start = first_day
+    while week_start <= last_day:
+        for offset in offsets:
+            day = week_start + timedelta(days=offset)
+
+            if day > last_day:
+                return
+
+            occurrence_start = datetime.combine(day, start_time, tzinfo=zone)
+
+            if occurrence_start >= end:
+                return
+
+            next_day = day + timedelta(days=1) if crosses_midnight else day
+            occurrence_end = datetime.combine(next_day, end_time, tzinfo=zone)
+
+            if occurrence_end > start or (occurrence_end == occurrence_start >= start):
+                yield Occurrence(occurrence_start, occurrence_end, owner)
+
+        week_start += timedelta(days=7)
+
+def expand_schedule(
+    owners: Iterable[Any],
+    start: datetime,
+    end: datetime,
+    timezone=None
+) -> Iterator[Occurrence]:
+    """
+    Lazily lists the occurrences of every schedule item of several playlists and streamers that
+    overlap a window of time, ordered by start time.
+
+    The occurrences of each schedule item are merged as they're read, so the whole calendar is
+    never held in memory.
+
+    :param owners: The :class:`~.models.playlist.Playlist` and
+        :class:`~.models.streamer.Streamer` objects.
+    :param start: The start of the window.
+    :param end: The end of the window.
+    :param timezone: (Optional) The time zone the schedules are in, as described in
+        :func:`expand_schedule_item`. Default: ``None``.
+
+    :returns: An iterator of :class:`Occurrence` tuples.
+
+    Usage:
+
+    .. code-block:: python
+
+        from datetime import datetime, timedelta
+
+        from AzuracastPy.scheduling import expand_schedule
+
+        now = datetime.now()
+        owners = station.playlists() + station.streamers()
+
+        for start, end, owner in expand_schedule(
+            owners, now, now + timedelta(days=90), timezone=station.timezone
+        ):
+            print(start, end, owner.id)
+    """
+    return heapq.merge(
+        *(
+            expand_schedule_item(item, start, end, owner, timezone)
+            for owner in owners
+            for item in owner.schedule_items or []
+        ),
+        key=lambda occurrence: occurrence.start
+    )
@@ -0,0 +1,359 @@
+"""Class for simulating the AutoDJ rotation of a station's playlists offline."""
+
+import random
+from collections import Counter, namedtuple
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..enums import PlaylistOrders, PlaylistSources, PlaylistTypes
+from ..util.general_util import generate_repr_string
+from ..util.schedule_util import get_zone, localize
+from .slot_table import ScheduleSlotTable
+
+SimulatedPlay = namedtuple("SimulatedPlay", ("start", "end", "file", "playlist"))
+SimulatedPlay.__doc__ = """
+A track played by the simulated AutoDJ: its ``start`` and ``end`` :class:`~datetime.datetime`,
+the :class:`~.models.StationFile` that was played, and the :class:`~.models.playlist.Playlist`
+it was picked from.
+"""
+
+SeparationViolation = namedtuple("SeparationViolation", ("artist", "start", "previous_start"))
+SeparationViolation.__doc__ = """
+A track whose ``artist`` had already played within the artist separation time. ``start`` is when
+the track started, and ``previous_start`` is when the artist's previous track started.
+"""
+
+# Interval playlists, in the order AutoDJ checks whether one of them is due.
+_INTERVAL_TYPES = (
+    PlaylistTypes.ONCE_PER_HOUR.value,
+    PlaylistTypes.ONCE_PER_X_SONGS.value,
+    PlaylistTypes.ONCE_PER_X_MINUTES.value
+)
+
+class _PlaylistState:
+    # The tracks of one playlist, and the order they're waiting to be played in.
+    __slots__ = ("playlist", "files", "pending", "last_played", "songs_since")
+
+    def __init__(self, playlist, files, start):
+        self.playlist = playlist
+        self.files = files
+        self.pending: List[Any] = []
+        self.last_played = start
+        self.songs_since = 0
+
+    def is_due(self, now) -> bool:
+        playlist = self.playlist
+
+        if playlist.type == PlaylistTypes.ONCE_PER_HOUR.value:
+            mark = now.replace(minute=(playlist.play_per_hour_minute or 0) % 60, second=0,
+                               microsecond=0)
+            if mark > now:
+                mark -= timedelta(hours=1)
+            return mark > self.last_played
+
+        if playlist.type == PlaylistTypes.ONCE_PER_X_SONGS.value:
+            return self.songs_since >= max(playlist.play_per_songs or 0, 1)
+
+        minutes = max(playlist.play_per_minutes or 0, 1)
+        return now - self.last_played >= timedelta(minutes=minutes)
+
+    def next_due(self) -> Optional[datetime]:
+        # When a playlist that plays on a clock becomes due. Song-count playlists can't become
+        # due while nothing plays, so they have none.
+        playlist = self.playlist
+
+        if playlist.type == PlaylistTypes.ONCE_PER_HOUR.value:
+            mark = self.last_played.replace(minute=(playlist.play_per_hour_minute or 0) % 60,
+                                            second=0, microsecond=0)
+            if mark <= self.last_played:
+                mark += timedelta(hours=1)
+            return mark
+
+        if playlist.type == PlaylistTypes.ONCE_PER_X_MINUTES.value:
+            return self.last_played + timedelta(minutes=max(playlist.play_per_minutes or 0, 1))
+
+        return None
+
+    def pick(self, rng, is_recent):
+        order = self.playlist.order
+
+        if order == PlaylistOrders.RANDOM.value:
+            candidates = rng.sample(self.files, len(self.files))
+        else:
+            if not self.pending:
+                self.pending = list(self.files)
+
+                if order != PlaylistOrders.SEQUENTIAL.value:
+                    rng.shuffle(self.pending)
+
+            candidates = self.pending
+
+        chosen = candidates[0]
+
+        # Like AutoDJ, avoid tracks and artists that played recently when the order allows it.
+        if self.playlist.avoid_duplicates and order != PlaylistOrders.SEQUENTIAL.value:
+            chosen = next((file for file in candidates if not is_recent(file)), chosen)
+
+        if candidates is self.pending:
+            self.pending.remove(chosen)
+
+        return chosen
+
+class RotationReport:
+    """
+    The result of a simulated week, or other stretch, of AutoDJ rotation.
+
+    ``plays`` lists every :class:`SimulatedPlay` in order. ``track_plays`` maps the ID of each
+    :class:`~.models.StationFile` that played to its number of plays, most played first.
+    ``playlist_share`` maps each playlist name to its share of the plays, from ``0`` to ``1``.
+    ``artist_violations`` lists every :class:`SeparationViolation`, and ``dead_air`` is how long
+    nothing could be played.
+    """
+    def __init__(
+        self,
+        plays: List[SimulatedPlay],
+        artist_violations: List[SeparationViolation],
+        dead_air: timedelta
+    ):
+        """
+        Initializes a :class:`RotationReport` object.
+
+        .. note::
+
+            This class should not be initialized directly. Instead, obtain an instance
+            via: :meth:`RotationSimulator.run`.
+        """
+        self.plays = plays
+        self.track_plays = dict(Counter(play.file.id for play in plays).most_common())
+        self.playlist_share = {
+            name: count / len(plays)
+            for name, count in Counter(play.playlist.name for play in plays).most_common()
+        }
+        self.artist_violations = artist_violations
+        self.dead_air = dead_air
+
+    def __repr__(self):
+        return generate_repr_string(self)
+
+class RotationSimulator:
+    """
+    Simulates how AutoDJ rotates a station's playlists, without waiting for real airplay.
+
+    The simulation follows the rules AutoDJ uses to pick the next track:
+
+    - A once-per-hour, once-per-x-songs or once-per-x-minutes playlist plays when it is due,
+      while it is scheduled or at any time if it has no schedule.
+    - Otherwise, a standard playlist is picked at random by weight among the scheduled ones, or
+      among the unscheduled ones when none is scheduled.
+    - Tracks are taken in the playlist's order, skipping tracks and artists that played within
+      the artist separation time when the playlist avoids duplicates.
+
+    The simulation starts as if every interval playlist had just played. Streamers, custom
+    playlists and remote playlists aren't simulated. With the same ``seed``, a run always gives
+    the same result, so changes to playlists can be compared with each other.
+
+    Usage:
+
+    .. code-block:: python
+
+        from datetime import datetime
+
+        from AzuracastPy.scheduling import RotationSimulator
+
+        simulator = RotationSimulator.from_station(station)
+        report = simulator.run(datetime(2024, 9, 2), seed=42)
+
+        print(report.playlist_share)
+        print(len(report.artist_violations))
+    """
+    def __init__(
+        self,
+        playlists: Iterable[Any],
+        files: Iterable[Any],
+        timezone=None,
+        artist_separation: int = 120,
+        default_length: float = 180
+    ):
+        """
+        Initializes a :class:`RotationSimulator` instance.
+
+        :param playlists: The :class:`~.models.playlist.Playlist` objects of the station.
+        :param files: The :class:`~.models.StationFile` objects of the station. A file plays in
+            the playlists listed in its ``playlists``.
+        :param timezone: (Optional) The time zone of the station's schedule, as a name such as
+            :attr:`~.models.Station.timezone` or a :class:`~datetime.tzinfo` object.
+            Default: ``None``.
+        :param artist_separation: (Optional) The number of minutes within which an artist
+            shouldn't play twice. Default: ``120``.
+        :param default_length: (Optional) The length in seconds used for files without one.
+            Default: ``180``.
+        """
+        self._playlists = [
+            playlist for playlist in playlists
+            if playlist.is_enabled is not False
+            and playlist.source != PlaylistSources.REMOTE_URL.value
+            and playlist.type != PlaylistTypes.CUSTOM.value
+        ]
+        self._files: Dict[Any, List[Any]] = {playlist.id: [] for playlist in self._playlists}
+
+        for file in files:
+            for membership in file.playlists:
+                if membership.id in self._files:
+                    self._files[membership.id].append(file)
+
+        self._timezone = timezone
+        self._table = ScheduleSlotTable(self._playlists, timezone)
+        self.artist_separation = artist_separation
+        self.default_length = default_length
+
+    def __repr__(self):
+        return f"RotationSimulator(playlists={len(self._playlists)})"
+
+    @classmethod
+    def from_station(
+        cls,
+        station,
+        **kwargs
+    ) -> "RotationSimulator":
+        """
+        Creates a simulator from the playlists and files of a station, in its time zone.
+
+        :param station: The :class:`~.models.Station` whose rotation is simulated.
+        :param kwargs: (Optional) The other parameters of :class:`RotationSimulator`.
+
+        :returns: A :class:`RotationSimulator` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            simulator = RotationSimulator.from_station(station, artist_separation=60)
+        """
+        return cls(station.playlists(), station.files(), station.timezone or None, **kwargs)
+
+    def run(
+        self,
+        start: Optional[datetime] = None,
+        duration: timedelta = timedelta(days=7),
+        seed: Optional[Any] = None
+    ) -> RotationReport:
+        """
+        Simulates the rotation over a stretch of time.
+
+        :param start: (Optional) When the simulation starts. Leave as ``None`` to start now.
+            Default: ``None``.
+        :param duration: (Optional) How long to simulate. Default: ``timedelta(days=7)``.
+        :param seed: (Optional) The seed for the random choices. Leave as ``None`` for a
+            different result every time. Default: ``None``.
+
+        :returns: A :class:`RotationReport` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            report = simulator.run(datetime(2024, 9, 2), timedelta(days=1), seed=1)
+        """
+        rng = random.Random(seed)
+        zone = get_zone(self._timezone, start or datetime.now())
+        now = localize(start or datetime.now(), zone)
+        end = now + duration
+
+        states = {
+            playlist.id: _PlaylistState(playlist, self._files[playlist.id], now)
+            for playlist in self._playlists
+            if self._files[playlist.id]
+        }
+        rotation = [
+            state for state in states.values()
+            if state.playlist.type == PlaylistTypes.DEFAULT.value
+            and not state.playlist.schedule_items
+        ]
+        separation = timedelta(minutes=self.artist_separation)
+
+        plays: List[SimulatedPlay] = []
+        violations: List[SeparationViolation] = []
+        dead_air = timedelta()
+        last_artist: Dict[str, datetime] = {}
+        last_track: Dict[Any, datetime] = {}
+
+        def is_recent(file):
+            artist = (file.artist or "").lower()
+            return (
+                now - last_track.get(file.id, now - separation) < separation
+                or (artist and now - last_artist.get(artist, now - separation) < separation)
+            )
+
+        while now < end:
+            state = self._next_playlist(now, states, rotation, rng)
+
+            if state is None:
+                # Nothing plays until the schedule changes or an interval playlist becomes due.
+                change = self._table.next_change(now, end - now)
+                resume = min(
+                    [end]
+                    + ([change] if change is not None else [])
+                    + [due for due in (other.next_due() for other in states.values())
+                       if due is not None and due > now]
+                )
+                dead_air += resume - now
+                now = resume
+                continue
+
+            file = state.pick(rng, is_recent)
+            length = timedelta(seconds=file.length or self.default_length)
+            plays.append(SimulatedPlay(now, now + length, file, state.playlist))
+
+            artist = (file.artist or "").lower()
+            if artist:
+                previous = last_artist.get(artist)
+                if previous is not None and now - previous < separation:
+                    violations.append(SeparationViolation(file.artist, now, previous))
+                last_artist[artist] = now
+
+            last_track[file.id] = now
+            state.last_played = now
+            state.songs_since = 0
+
+            for other in states.values():
+                if other is not state:
+                    other.songs_since += 1
+
+            now += length
+
+        return RotationReport(plays, violations, dead_air)
+
+    def _next_playlist(self, now, states, rotation, rng) -> Optional[_PlaylistState]:
+        scheduled = self._table.at(now)
+        scheduled_ids = {owner.id for owner, _ in scheduled}
+
+        for playlist_type in _INTERVAL_TYPES:
+            for state in states.values():
+                playlist = state.playlist
+
+                if playlist.type != playlist_type:
+                    continue
+
+                if playlist.schedule_items and playlist.id not in scheduled_ids:
+                    continue
+
+                if state.is_due(now):
+                    return state
+
+        weighted = [
+            (states[owner.id], share) for owner, share in scheduled
+            if share is not None and owner.id in states
+        ]
+
+        if not weighted:
+            weighted = [(state, state.playlist.weight or 0) for state in rotation]
+
+        if not weighted:
+            return None
+
+        if not any(share for _, share in weighted):
+            return rng.choice(weighted)[0]
+
+        return rng.choices(
+            [state for state, _ in weighted], [share for _, share in weighted]
+        )[0]
@@ -0,0 +1,331 @@
+"""Class for looking up what a station has scheduled at any point in time."""
+
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..enums import PlaylistTypes
+from ..util.schedule_util import (
+    MINUTES_PER_DAY,
+    MINUTES_PER_WEEK,
+    get_zone,
+    is_active_on,
+    localize,
+    normalize_schedule_item,
+    weekly_intervals
+)
+
+ScheduledOwner = namedtuple("ScheduledOwner", ("owner", "share"))
+ScheduledOwner.__doc__ = """
+A playlist or streamer (``owner``) that is scheduled at a point in time. For playlists that play
+by weight, ``share`` is the expected share of the songs they play at that time, from ``0`` to
+``1``. It is ``None`` for streamers and for playlists of the other types.
+"""
+
+def _owner_key(owner) -> Tuple[str, Any]:
+    return type(owner).__name__, owner.id
+
+def _is_playlist(owner) -> bool:
+    return hasattr(owner, "weight")
+
+def _is_weighted(owner) -> bool:
+    return _is_playlist(owner) and owner.type == PlaylistTypes.DEFAULT.value
+
+def _is_enabled(owner) -> bool:
+    if _is_playlist(owner):
+        return owner.is_enabled is not False
+
+    return getattr(owner, "is_active", True) is not False
+
+class _Entry:
+    # One weekly occurrence of a schedule item. 'origin' is the minute of the week it started at,
+    # which is negative for the part of a Sunday night occurrence that runs into Monday.
+    __slots__ = ("key", "owner", "normalized", "origin")
+
+    def __init__(self, key, owner, normalized, origin):
+        self.key = key
+        self.owner = owner
+        self.normalized = normalized
+        self.origin = origin
+
+    def is_active(self, day, minute) -> bool:
+        # Whether the occurrence running at this minute of the week started on an allowed date.
+        days_before = minute // MINUTES_PER_DAY - self.origin // MINUTES_PER_DAY
+        return is_active_on(self.normalized, day - timedelta(days=days_before))
+
+class ScheduleSlotTable:
+    """
+    A weekly table of which playlists and streamers are scheduled at each minute of a station's
+    week.
+
+    The week is cut into slots at every minute a schedule item starts or ends, and each slot
+    lists the items that cover it. Looking up a point in time is a binary search over the slots,
+    so it takes ``O(log n)`` time however many items the station has. When one playlist or
+    streamer changes, only the slots it covers are updated.
+
+    Scheduled playlists take the place of the general rotation, like on AzuraCast. When no
+    weighted playlist is scheduled, the enabled playlists without a schedule share the time by
+    weight.
+
+    Usage:
+
+    .. code-block:: python
+
+        from datetime import datetime
+
+        from AzuracastPy.scheduling import ScheduleSlotTable
+
+        table = ScheduleSlotTable.from_station(station)
+
+        for owner, share in table.at(datetime.now()):
+            print(owner.id, share)
+
+        print(table.next_change(datetime.now()))
+    """
+    def __init__(
+        self,
+        owners: Iterable[Any] = (),
+        timezone=None
+    ):
+        """
+        Initializes a :class:`ScheduleSlotTable` instance.
+
+        :param owners: (Optional) The :class:`~.models.playlist.Playlist` and
+            :class:`~.models.streamer.Streamer` objects of the station. Default: ``()``.
+        :param timezone: (Optional) The time zone of the station's schedule, as a name such as
+            :attr:`~.models.Station.timezone` or a :class:`~datetime.tzinfo` object. Naive
+            times passed to the table are taken to be in this time zone. Leave as ``None`` to
+            use naive times only. Default: ``None``.
+        """
+        self._zone = get_zone(timezone, datetime.now())
+
+        # Slot i covers the minutes of the week from _points[i] up to _points[i + 1].
+        self._points: List[int] = [0]
+        self._slots: List[Tuple[_Entry, ...]] = [()]
+
+        self._entries: Dict[Tuple[str, Any], List[Tuple[int, int, _Entry]]] = {}
+        self._rotation: Dict[Tuple[str, Any], Any] = {}
+
+        for owner in owners:
+            self.update(owner)
+
+    def __repr__(self):
+        return f"ScheduleSlotTable(slots={len(self._slots)}, "\
+               f"owners={len(self._entries) + len(self._rotation)})"
+
+    @classmethod
+    def from_station(
+        cls,
+        station
+    ) -> "ScheduleSlotTable":
+        """
+        Creates a table from every playlist and streamer of a station, in its time zone.
+
+        :param station: The :class:`~.models.Station` whose schedule is looked up.
+
+        :returns: A :class:`ScheduleSlotTable` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            table = ScheduleSlotTable.from_station(station)
+        """
+        return cls(station.playlists() + station.streamers(), station.timezone or None)
+
+    def update(
+        self,
+        owner
+    ):
+        """
+        Adds a playlist or streamer to the table, replacing what it had scheduled before.
+
+        Only the slots covered by its old and new schedule items are touched.
+
+        :param owner: The :class:`~.models.playlist.Playlist` or
+            :class:`~.models.streamer.Streamer` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            playlist.schedule.add(item)
+            table.update(playlist)
+        """
+        self.remove(owner)
+
+        if not _is_enabled(owner):
+            return
+
+        key = _owner_key(owner)
+
+        if not owner.schedule_items:
+            if _is_weighted(owner):
+                self._rotation[key] = owner
+            return
+
+        entries = []
+
+        for item in owner.schedule_items:
+            normalized = normalize_schedule_item(item)
+
+            for start, end, _ in weekly_intervals(normalized):
+                if end == start:
+                    continue
+
+                entry = _Entry(key, owner, normalized, start)
+
+                if end <= MINUTES_PER_WEEK:
+                    entries.append((start, end, entry))
+                else:
+                    entries.append((start, MINUTES_PER_WEEK, entry))
+                    entries.append((0, end - MINUTES_PER_WEEK, _Entry(
+                        key, owner, normalized, start - MINUTES_PER_WEEK
+                    )))
+
+        for start, end, entry in entries:
+            first = self._split(start)
+            last = self._split(end)
+
+            for i in range(first, last):
+                self._slots[i] += (entry,)
+
+        self._entries[key] = entries
+
+    def remove(
+        self,
+        owner
+    ):
+        """
+        Removes a playlist or streamer from the table.
+
+        :param owner: The :class:`~.models.playlist.Playlist` or
+            :class:`~.models.streamer.Streamer` object.
+
+        Usage:
+
+        .. code-block:: python
+
+            table.remove(playlist)
+        """
+        key = _owner_key(owner)
+        self._rotation.pop(key, None)
+
+        for start, end, entry in self._entries.pop(key, ()):
+            i = bisect_left(self._points, start)
+
+            while i < len(self._points) and self._points[i] < end:
+                self._slots[i] = tuple(other for other in self._slots[i] if other is not entry)
+                i += 1
+
+    def at(
+        self,
+        when: datetime
+    ) -> List[ScheduledOwner]:
+        """
+        Looks up what is scheduled at a point in time.
+
+        :param when: The point in time.
+
+        :returns: A list of :class:`ScheduledOwner` tuples: scheduled streamers first, then
+            playlists that don't play by weight, then playlists by their share, largest first.
+
+        Usage:
+
+        .. code-block:: python
+
+            scheduled = table.at(datetime(2024, 9, 8, 14, 30))
+        """
+        when = localize(when, self._zone)
+        minute = when.weekday() * MINUTES_PER_DAY + when.hour * 60 + when.minute
+
+        return self._describe(self._active(when.date(), minute))
+
+    def next_change(
+        self,
+        when: datetime,
+        horizon: timedelta = timedelta(days=31)
+    ) -> Optional[datetime]:
+        """
+        Finds the next time after a point in time at which the scheduled playlists or streamers
+        change.
+
+        :param when: The point in time.
+        :param horizon: (Optional) How far ahead to look. Default: ``timedelta(days=31)``.
+
+        :returns: A :class:`~datetime.datetime`, or ``None`` when nothing changes within the
+            ``horizon``.
+
+        Usage:
+
+        .. code-block:: python
+
+            change = table.next_change(datetime.now())
+        """
+        when = localize(when, self._zone)
+        limit = when + horizon
+
+        minute = when.weekday() * MINUTES_PER_DAY + when.hour * 60 + when.minute
+        week_start = (when - timedelta(minutes=minute)).replace(second=0, microsecond=0)
+        current = {entry.key for entry in self._active(when.date(), minute)}
+
+        i = bisect_right(self._points, minute)
+
+        while True:
+            if i == len(self._points):
+                i = 0
+                week_start += timedelta(days=7)
+
+            moment = week_start + timedelta(minutes=self._points[i])
+
+            if moment > limit:
+                return None
+
+            day = moment.date()
+            point = self._points[i]
+
+            if {entry.key for entry in self._active(day, point)} != current:
+                return moment
+
+            i += 1
+
+    def _active(self, day, minute) -> List[_Entry]:
+        slot = self._slots[bisect_right(self._points, minute) - 1]
+        return [entry for entry in slot if entry.is_active(day, minute)]
+
+    def _describe(self, entries) -> List[ScheduledOwner]:
+        owners = {entry.key: entry.owner for entry in entries}
+
+        streamers = [owner for owner in owners.values() if not _is_playlist(owner)]
+        weighted = [owner for owner in owners.values() if _is_weighted(owner)]
+        others = [
+            owner for owner in owners.values() if _is_playlist(owner) and not _is_weighted(owner)
+        ]
+
+        if not weighted:
+            weighted = list(self._rotation.values())
+
+        total = sum(owner.weight or 0 for owner in weighted)
+        shares = [
+            ScheduledOwner(owner, (owner.weight or 0) / total if total else 1 / len(weighted))
+            for owner in weighted
+        ]
+        shares.sort(key=lambda scheduled: scheduled.share, reverse=True)
+
+        return [ScheduledOwner(owner, None) for owner in streamers + others] + shares
+
+    def _split(self, point) -> int:
+        # Makes sure a slot starts at the point, and returns its position.
+        if point >= MINUTES_PER_WEEK:
+            return len(self._points)
+
+        i = bisect_right(self._points, point) - 1
+
+        if self._points[i] == point:
+            return i
+
+        self._points.insert(i + 1, point)
+        self._slots.insert(i + 1, self._slots[i])
+
+        return i + 1
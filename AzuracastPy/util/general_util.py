@@ -1,5 +1,7 @@
 """Functions being used internally by the library."""
 
+from typing import Any, Dict, List, Tuple
+
 from ..constants import DAYS
 
 def generate_repr_string(self) -> str:
@@ -15,6 +17,19 @@ def get_day_number(day: str) -> int:
     except KeyError:
         raise KeyError(f"We both know that '{day}' isn't a day of the week.")
 
+def get_page_rows(
+    response,
+    page: int,
+    per_page: int
+) -> Tuple[List[Dict[str, Any]], bool]:
+    # Paged endpoints return one page of rows with the total count, while stations that don't
+    # page the endpoint return every row as a list. Returns the rows, and whether there are more.
+    if isinstance(response, dict):
+        rows = response.get('rows') or []
+        return rows, page * per_page < (response.get('total') or 0) and len(rows) > 0
+
+    return response, False
+
 def convert_to_short_name(original_text: str) -> str:
     return original_text.strip().lower().replace(' ', '_')
 
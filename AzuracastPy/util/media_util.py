@@ -1,6 +1,9 @@
 import base64
+import hashlib
+import json
 import os
 import requests
+from typing import Any, Iterator, Optional
 
 from ..constants import API_ENDPOINTS
 from ..exceptions import UnexpectedErrorException
@@ -20,6 +23,51 @@ def generate_file_upload_structure(path: str, file: str):
         "file": contents
     }
 
+def stream_file_upload_structure(
+    path: str,
+    file: str,
+    chunk_size: int = 3 * 256 * 1024,
+    digest: Optional[Any] = None
+) -> Iterator[bytes]:
+    # The same body as generate_file_upload_structure, encoded a chunk at a time. Chunks are a
+    # multiple of 3 bytes long, so their base64 encodings join up into a valid whole.
+    # A hashlib 'digest' is fed every chunk, so the file can be fingerprinted in the same read.
+    if not os.path.isfile(file):
+        raise ValueError(f"File does not exist: {file}")
+
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+
+    def body():
+        yield b'{"path": ' + json.dumps(path).encode() + b', "file": "'
+
+        with open(file, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                if digest is not None:
+                    digest.update(chunk)
+
+                yield base64.b64encode(chunk)
+
+        yield b'"}'
+
+    return body()
+
+def new_fingerprint_digest():
+    # The hash behind content fingerprints. hexdigest() gives the fingerprint.
+    return hashlib.blake2b(digest_size=20)
+
+def fingerprint_file(file: str, chunk_size: int = 1024 * 1024) -> str:
+    # Streams the file through BLAKE2b, so large files are never held in memory.
+    if not os.path.isfile(file):
+        raise ValueError(f"File does not exist: {file}")
+
+    digest = new_fingerprint_digest()
+
+    with open(file, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
 def get_resource_art(self) -> bytes:
     # Had to make a raw request here because the request_handler only returns valid JSON.
     # It doesn't handle bytes. Not yet anyway.
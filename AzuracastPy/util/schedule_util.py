@@ -0,0 +1,108 @@
+"""Functions for working with the schedule items of playlists and streamers."""
+
+from collections import namedtuple
+from datetime import date, datetime
+from typing import Iterator, Optional, Tuple
+
+from ..exceptions import ClientException
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError: # Python 3.8
+    ZoneInfo = None
+
+MINUTES_PER_DAY = 1440
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+ALL_DAYS = (1, 2, 3, 4, 5, 6, 7)
+
+# A schedule item in minutes. 'start' is the minute of the day the item starts, 'duration' is
+# its length in minutes and 'days' are the days of the week (1 for Monday to 7 for Sunday) that
+# it starts on. The dates are inclusive bounds on the day an occurrence starts.
+NormalizedScheduleItem = namedtuple(
+    "NormalizedScheduleItem", ("start", "duration", "start_date", "end_date", "days", "loop_once")
+)
+
+def hhmm_to_minutes(value: int) -> int:
+    hours, minutes = divmod(int(value), 100)
+    return hours * 60 + minutes
+
+def minutes_to_hhmm(value: int) -> int:
+    hours, minutes = divmod(value % MINUTES_PER_DAY, 60)
+    return hours * 100 + minutes
+
+def _to_date(value) -> Optional[date]:
+    if not value:
+        return None
+
+    if isinstance(value, date):
+        return value
+
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+def normalize_schedule_item(item) -> NormalizedScheduleItem:
+    # Schedule items are either ScheduleItem objects from a playlist or streamer, or the
+    # dictionaries made by 'generate_schedule_item'.
+    if isinstance(item, dict):
+        fields = (
+            item.get('start_time'), item.get('end_time'), item.get('start_date'),
+            item.get('end_date'), item.get('days'), item.get('loop_once')
+        )
+    else:
+        fields = (
+            item.start_time, item.end_time, item.start_date, item.end_date, item.days,
+            getattr(item, 'loop_once', False)
+        )
+
+    start_time, end_time, start_date, end_date, days, loop_once = fields
+
+    start = hhmm_to_minutes(start_time)
+    end = hhmm_to_minutes(end_time)
+
+    # An end time before the start time means the item runs past midnight.
+    duration = end - start if end >= start else end + MINUTES_PER_DAY - start
+
+    return NormalizedScheduleItem(
+        start, duration, _to_date(start_date), _to_date(end_date),
+        tuple(sorted(set(days))) if days else ALL_DAYS, bool(loop_once)
+    )
+
+def weekly_intervals(item: NormalizedScheduleItem) -> Iterator[Tuple[int, int, int]]:
+    # Yields (start, end, day) for every day the item starts on, in minutes from Monday 00:00.
+    # 'end' goes past the end of the week for items that run from Sunday into Monday.
+    for day in item.days:
+        start = (day - 1) * MINUTES_PER_DAY + item.start
+        yield start, start + item.duration, day
+
+def is_active_on(item: NormalizedScheduleItem, day: date) -> bool:
+    # Whether an occurrence of the item starts on the given date.
+    if item.start_date is not None and day < item.start_date:
+        return False
+
+    if item.end_date is not None and day > item.end_date:
+        return False
+
+    return day.isoweekday() in item.days
+
+def get_zone(timezone, reference: datetime):
+    # A named time zone, a tzinfo object, or the time zone of the reference time.
+    if timezone is None:
+        return reference.tzinfo
+
+    if not isinstance(timezone, str):
+        return timezone
+
+    if ZoneInfo is None:
+        message = "Named time zones require Python 3.9 or newer. Pass a tzinfo object instead."
+        raise ClientException(message)
+
+    return ZoneInfo(timezone)
+
+def localize(value: datetime, zone) -> datetime:
+    if zone is None:
+        return value
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=zone)
+
+    return value.astimezone(zone)
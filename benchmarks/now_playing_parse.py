@@ -0,0 +1,93 @@
+"""
+Times how long it takes to turn the radio's now-playing responses into NowPlaying objects.
+
+The payload mirrors ``client.now_playing()`` on a large radio: 150 stations, each with 15
+song history entries, built from the test fixture. Run it from any checkout to compare
+versions of the library:
+
+.. code-block:: bash
+
+    python benchmarks/now_playing_parse.py
+"""
+
+import copy
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The checkout the script is in is measured, not an installed copy of the library.
+sys.path.insert(0, ROOT)
+
+from AzuracastPy.models.now_playing import NowPlaying
+from AzuracastPy.models.song import SONG_POOL
+
+STATIONS = 150
+HISTORY_ENTRIES = 15
+REPEAT = 7
+NUMBER = 20
+
+def build_payload():
+    with open(os.path.join(ROOT, "tests", "util", "json", "now_playing.json")) as file:
+        template = json.load(file)
+
+    payload = []
+
+    for station_id in range(1, STATIONS + 1):
+        now_playing = copy.deepcopy(template)
+        now_playing['station']['id'] = station_id
+        now_playing['station']['shortcode'] = f"station_{station_id}"
+
+        entry = now_playing['song_history'][0]
+        now_playing['song_history'] = []
+
+        for position in range(HISTORY_ENTRIES):
+            history = copy.deepcopy(entry)
+            history['sh_id'] = station_id * 100 + position
+            history['song']['id'] = f"{station_id}-{position}"
+            now_playing['song_history'].append(history)
+
+        payload.append(now_playing)
+
+    return payload
+
+def construct(payload):
+    return [NowPlaying(**now_playing) for now_playing in payload]
+
+def construct_and_read_title(payload):
+    return [np.now_playing.song.title for np in construct(payload)]
+
+def construct_and_read_everything(payload):
+    # Reads every nested object, which is what building them all up front costs.
+    return [
+        (np.station, np.listeners, np.live, np.now_playing, np.playing_next, np.song_history)
+        for np in construct(payload)
+    ]
+
+def measure(function, payload) -> float:
+    # Milliseconds per call, best of REPEAT runs. The song pool is filled by the first call, so
+    # songs are reused afterwards, as they are in a program that polls the radio.
+    SONG_POOL.clear()
+    function(payload)
+
+    return min(timeit.repeat(lambda: function(payload), repeat=REPEAT, number=NUMBER)) \
+        / NUMBER * 1000
+
+def main():
+    payload = build_payload()
+    cases = [
+        ("Construction only", construct),
+        ("Construction + reading title", construct_and_read_title),
+        ("Construction + reading everything", construct_and_read_everything)
+    ]
+
+    print(f"{STATIONS} stations, {HISTORY_ENTRIES} history entries each, Python "
+          f"{sys.version.split()[0]}")
+
+    for name, function in cases:
+        print(f"{name:<36}{measure(function, payload):8.2f} ms")
+
+if __name__ == "__main__":
+    main()
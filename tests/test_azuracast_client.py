@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock
 
 from AzuracastPy import AzuracastClient, models
+from AzuracastPy.exceptions import ClientException
 
 from .util import fake_data_generator
 
@@ -71,6 +72,87 @@ class TestAzuracastClient(unittest.TestCase):
         for history in station_now_playing.song_history:
             self.assertIsInstance(history, models.now_playing.SongHistory)
 
+    def test_now_playing_builds_nested_objects_on_first_use(self):
+        self.client._request_handler.get.return_value = \
+            fake_data_generator.return_fake_now_playing_json()
+
+        station_now_playing = self.client.now_playing(station_id=1)
+
+        self.assertNotIn("station", vars(station_now_playing))
+        self.assertNotIn("song_history", vars(station_now_playing))
+
+        station = station_now_playing.station
+
+        self.assertIs(station_now_playing.station, station)
+        self.assertIn("station", vars(station_now_playing))
+        self.assertNotIn("song_history", vars(station_now_playing))
+
+    def test_now_playing_of_offline_station(self):
+        # The API leaves out the current and next song while a station is offline.
+        self.client._request_handler.get.return_value = \
+            fake_data_generator.return_fake_now_playing_json(
+                is_online=False, now_playing=None, playing_next=None
+            )
+
+        station_now_playing = self.client.now_playing(station_id=1)
+
+        self.assertIsNone(station_now_playing.now_playing)
+        self.assertIsNone(station_now_playing.playing_next)
+        self.assertIsInstance(station_now_playing.station, models.Station)
+
+    def test_now_playing_static_learns_shortcode_from_api(self):
+        response_data = fake_data_generator.return_fake_now_playing_json()
+        self.client._request_handler.get.return_value = response_data
+
+        self.client.now_playing(station_id=1, static=True)
+        self.client.now_playing(station_id=1, static=True)
+
+        urls = [call.args[0] for call in self.client._request_handler.get.call_args_list]
+        self.assertEqual(
+            urls,
+            [
+                "http://example.com/api/nowplaying/1",
+                "http://example.com/api/nowplaying_static/yet_another_radio.json"
+            ]
+        )
+
+    def test_now_playing_static_falls_back_to_api(self):
+        response_data = fake_data_generator.return_fake_now_playing_json()
+        self.client._request_handler.get.return_value = response_data
+        self.client.now_playing(station_id=1)
+
+        self.client._request_handler.get.side_effect = [
+            ClientException("Requested resource not found."),
+            response_data
+        ]
+
+        station_now_playing = self.client.now_playing(station_id=1, static=True)
+
+        self.assertIsInstance(station_now_playing, models.NowPlaying)
+        self.assertEqual(
+            self.client._request_handler.get.call_args.args[0],
+            "http://example.com/api/nowplaying/1"
+        )
+
+    def test_now_playing_static_falls_back_to_api_for_half_written_file(self):
+        response_data = fake_data_generator.return_fake_now_playing_json()
+        self.client._request_handler.get.return_value = response_data
+        self.client.now_playing(station_id=1)
+
+        self.client._request_handler.get.side_effect = [
+            {**response_data, "station": {"name": "Yet Another Radio"}},
+            response_data
+        ]
+
+        station_now_playing = self.client.now_playing(station_id=1, static=True)
+
+        self.assertEqual(station_now_playing.station_id, 1)
+        self.assertEqual(station_now_playing.station_shortcode, "yet_another_radio")
+        self.assertEqual(
+            self.client._request_handler.get.call_args.args[0],
+            "http://example.com/api/nowplaying/1"
+        )
+
     def test_stations_method(self):
         response_data = [
             fake_data_generator.return_fake_station_json(),
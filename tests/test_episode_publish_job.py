@@ -0,0 +1,203 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import TestCase, mock
+
+import requests
+
+from AzuracastPy.exceptions import ClientException, UnexpectedErrorException
+from AzuracastPy.library import EpisodePublishJob
+
+from .util import fake_data_generator
+
+class TestEpisodePublishJob(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.journal = os.path.join(self.directory, "publish.journal")
+
+        self.podcast = fake_data_generator.return_fake_podcast_instance()
+        self.podcast._station = fake_data_generator.return_fake_station_instance()
+        self.podcast._station._request_handler = mock.MagicMock()
+        self.request_handler = self.podcast._station._request_handler
+
+        self.episodes = []
+        for i in range(1, 4):
+            media = os.path.join(self.directory, f"episode{i}.mp3")
+
+            with open(media, "wb") as file:
+                file.write(f"audio {i}".encode())
+
+            self.episodes.append({
+                "title": f"Episode {i}",
+                "description": f"Episode number {i}",
+                "media": media
+            })
+
+        art = os.path.join(self.directory, "art.jpg")
+        with open(art, "wb") as file:
+            file.write(b"art")
+        self.episodes[0]["art"] = art
+
+        self.created = {}
+        self.uploads = []
+
+        self.request_handler.post.side_effect = self._fake_create
+        self.request_handler.post_stream.side_effect = self._fake_upload
+        self.request_handler.get.side_effect = self._fake_get
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def _fake_create(self, url, body):
+        episode = fake_data_generator.return_fake_podcast_episode_json()
+        episode['id'] = f"episode-{len(self.created) + 1}"
+        episode['title'] = body['title']
+        self.created[episode['id']] = episode
+
+        return episode
+
+    def _fake_upload(self, url, body):
+        self.uploads.append((url.rsplit("/", 2)[-2], url.rsplit("/", 1)[-1], b"".join(body)))
+
+        return {"success": True}
+
+    def _fake_get(self, url):
+        if url.split("?")[0].endswith("/episodes"):
+            return list(self.created.values())
+
+        return self.created[url.rsplit("/", 1)[-1]]
+
+    def _journal_events(self):
+        with open(self.journal, encoding="utf-8") as journal:
+            return [json.loads(line)['event'] for line in journal if line.strip()]
+
+    def test_run_creates_episodes_and_streams_their_files(self):
+        job = EpisodePublishJob(self.podcast, self.episodes, self.journal, workers=2)
+
+        result = job.run()
+
+        self.assertEqual(result, {"published": 3, "skipped": 0, "failed": 0})
+        self.assertEqual(len(self.created), 3)
+        self.assertEqual(
+            sorted((kind, json.loads(body)['path']) for _, kind, body in self.uploads),
+            [("art", "art.jpg"), ("media", "episode1.mp3"), ("media", "episode2.mp3"),
+             ("media", "episode3.mp3")]
+        )
+        self.assertEqual(len(job.published), 3)
+        self.assertEqual(self._journal_events().count("created"), 3)
+
+    def test_run_resumes_from_the_last_finished_step(self):
+        def flaky_upload(url, body):
+            body = b"".join(body)
+            if b'"episode2.mp3"' in body:
+                raise UnexpectedErrorException("Connection reset.")
+            return self._fake_upload(url, [body])
+
+        self.request_handler.post_stream.side_effect = flaky_upload
+
+        result = EpisodePublishJob(
+            self.podcast, self.episodes, self.journal, retries=1, retry_delay=0
+        ).run()
+
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(len(self.created), 3)
+
+        self.request_handler.post_stream.side_effect = self._fake_upload
+        self.uploads.clear()
+
+        job = EpisodePublishJob(self.podcast, self.episodes, self.journal)
+        result = job.run()
+
+        # The failed episode isn't created again; only its media is uploaded.
+        self.assertEqual(result, {"published": 1, "skipped": 2, "failed": 0})
+        self.assertEqual(len(self.created), 3)
+        episode_id = next(
+            id for id, episode in self.created.items() if episode['title'] == "Episode 2"
+        )
+        self.assertEqual([(id, kind) for id, kind, _ in self.uploads], [(episode_id, "media")])
+
+    def test_timed_out_create_is_not_duplicated(self):
+        def create_then_time_out(url, body):
+            episode = self._fake_create(url, body)
+            if body['title'] == "Episode 2":
+                raise requests.Timeout("Read timed out.")
+            return episode
+
+        self.request_handler.post.side_effect = create_then_time_out
+
+        job = EpisodePublishJob(self.podcast, self.episodes, self.journal, retry_delay=0)
+        result = job.run()
+
+        self.assertEqual(result, {"published": 3, "skipped": 0, "failed": 0})
+        self.assertEqual(len(self.created), 3)
+        self.assertEqual(self.request_handler.post.call_count, 3)
+        self.assertEqual(len(set(job.published.values())), 3)
+
+    def test_failed_create_is_not_retried(self):
+        def refuse_episode_2(url, body):
+            if body['title'] == "Episode 2":
+                raise UnexpectedErrorException("Bad gateway.")
+            return self._fake_create(url, body)
+
+        self.request_handler.post.side_effect = refuse_episode_2
+
+        result = EpisodePublishJob(self.podcast, self.episodes, self.journal, retry_delay=0).run()
+
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(self.request_handler.post.call_count, 3)
+
+        self.request_handler.post.side_effect = self._fake_create
+
+        result = EpisodePublishJob(self.podcast, self.episodes, self.journal).run()
+
+        self.assertEqual(result, {"published": 1, "skipped": 2, "failed": 0})
+        self.assertEqual(len(self.created), 3)
+
+    def test_deleted_episodes_are_published_again(self):
+        EpisodePublishJob(self.podcast, self.episodes, self.journal).run()
+
+        del self.created["episode-3"]
+
+        result = EpisodePublishJob(self.podcast, self.episodes, self.journal).run()
+
+        self.assertEqual(result, {"published": 1, "skipped": 2, "failed": 0})
+
+    def test_paged_episode_listing_is_read_in_full(self):
+        EpisodePublishJob(self.podcast, self.episodes, self.journal).run()
+
+        def paged_get(url):
+            query = dict(pair.split("=") for pair in url.split("?")[1].split("&"))
+            page, per_page = int(query['page']), int(query['per_page'])
+            rows = list(self.created.values())
+
+            return {"rows": rows[(page - 1) * per_page:page * per_page], "total": len(rows)}
+
+        self.request_handler.get.side_effect = paged_get
+
+        with mock.patch("AzuracastPy.library.episode_publish_job._EPISODES_PER_PAGE", 2):
+            result = EpisodePublishJob(self.podcast, self.episodes, self.journal).run()
+
+        self.assertEqual(result, {"published": 0, "skipped": 3, "failed": 0})
+        self.assertEqual(self.request_handler.get.call_count, 2)
+
+    def test_invalid_manifests(self):
+        with self.assertRaises(ClientException):
+            EpisodePublishJob(self.podcast, [{"title": "No description"}], self.journal)
+
+        with self.assertRaises(ClientException):
+            EpisodePublishJob(self.podcast, [
+                {"title": "Missing", "description": "File", "media": "/no/such/file.mp3"}
+            ], self.journal)
+
+        with self.assertRaises(ClientException):
+            EpisodePublishJob(self.podcast, [self.episodes[0], dict(self.episodes[0])], self.journal)
+
+    def test_publish_helper(self):
+        result = self.podcast.episode.publish(self.episodes, self.journal, workers=3)
+
+        self.assertEqual(result, {"published": 3, "skipped": 0, "failed": 0})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+from unittest import TestCase, mock
+
+from AzuracastPy import models
+from AzuracastPy.exceptions import ClientException
+from AzuracastPy.library import LibraryMirror
+
+from .util import fake_data_generator
+
+class TestLibraryMirror(TestCase):
+    def setUp(self) -> None:
+        self.station = fake_data_generator.return_fake_station_instance()
+        self.station._request_handler = mock.MagicMock()
+        self.mirror = LibraryMirror(self.station)
+
+    def tearDown(self) -> None:
+        self.mirror.close()
+
+    def test_first_sync_adds_every_file(self):
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(1),
+            fake_data_generator.return_fake_file_json(2, isrc="USRC17607839")
+        ]
+
+        result = self.mirror.sync()
+
+        self.assertEqual(result, {"added": 2, "updated": 0, "removed": 0, "unchanged": 0})
+        self.assertEqual(len(self.mirror), 2)
+        self.assertIsNotNone(self.mirror.last_synced_at)
+
+        file = self.mirror.file(2)
+        self.assertIsInstance(file, models.StationFile)
+        self.assertEqual(file.isrc, "USRC17607839")
+
+    def test_sync_only_writes_changes(self):
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(1),
+            fake_data_generator.return_fake_file_json(2),
+            fake_data_generator.return_fake_file_json(3)
+        ]
+        self.mirror.sync()
+
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(1),
+            fake_data_generator.return_fake_file_json(2, mtime=1800000000, title="Retagged"),
+            fake_data_generator.return_fake_file_json(4)
+        ]
+
+        result = self.mirror.sync()
+
+        self.assertEqual(result, {"added": 1, "updated": 1, "removed": 1, "unchanged": 1})
+        self.assertEqual([file.id for file in self.mirror.files()], [1, 2, 4])
+        self.assertEqual(self.mirror.file(2).title, "Retagged")
+        self.assertIsNone(self.mirror.file(3))
+
+    def test_playlist_change_is_synced(self):
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(1)
+        ]
+        self.mirror.sync()
+
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(1, playlists=[])
+        ]
+
+        result = self.mirror.sync()
+
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual([file.id for file in self.mirror.files_without_playlist()], [1])
+
+    def test_playlist_rename_and_custom_fields_are_synced(self):
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(1)
+        ]
+        self.mirror.sync()
+
+        renamed = fake_data_generator.return_fake_file_json(1, custom_fields={"label": "Indie"})
+        renamed['playlists'] = [dict(playlist, name="Renamed") for playlist in renamed['playlists']]
+        self.station._request_handler.get.return_value = [renamed]
+
+        result = self.mirror.sync()
+
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual([f.id for f in self.mirror.files_in_playlist("Renamed")], [1])
+        self.assertEqual([f.id for f in self.mirror.files_in_playlist("IM HERE")], [])
+        self.assertEqual([f.id for f in self.mirror.files_with_custom_field("label", "Indie")], [1])
+
+    def test_queries(self):
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(
+                1, isrc="USRC17607839", custom_fields={"label": "Indie"}
+            ),
+            fake_data_generator.return_fake_file_json(2, playlists=[]),
+            fake_data_generator.return_fake_file_json(3, artist="Someone else")
+        ]
+        self.mirror.sync()
+
+        self.assertEqual([f.id for f in self.mirror.files_missing("isrc")], [2, 3])
+        self.assertEqual([f.id for f in self.mirror.files_in_playlist("IM HERE")], [1, 3])
+        self.assertEqual([f.id for f in self.mirror.files_without_playlist()], [2])
+        self.assertEqual([f.id for f in self.mirror.find(artist="Cochise")], [1, 2])
+        self.assertEqual([f.id for f in self.mirror.files_with_custom_field("label")], [1])
+        self.assertEqual([f.id for f in self.mirror.files_with_custom_field("label", "Other")], [])
+
+    def test_invalid_field_raises_exception(self):
+        with self.assertRaises(ClientException):
+            self.mirror.files_missing("id; DROP TABLE files")
+
+        with self.assertRaises(ClientException):
+            self.mirror.find(bitrate=128)
+
+    def test_database_of_another_station_is_rejected(self):
+        other_station = fake_data_generator.return_fake_station_instance()
+        other_station.id = 99
+
+        with mock.patch("AzuracastPy.library.mirror.sqlite3.connect", return_value=self.mirror._connection):
+            with self.assertRaises(ClientException):
+                LibraryMirror(other_station, "shared.sqlite3")
+
+if __name__ == '__main__':
+    unittest.main()
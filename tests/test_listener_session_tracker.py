@@ -0,0 +1,91 @@
+import unittest
+from unittest import TestCase
+
+from AzuracastPy import models
+from AzuracastPy.analytics import ListenerSessionTracker
+from AzuracastPy.enums import SessionEvents
+
+from .util import fake_data_generator
+
+class TestListenerSessionTracker(TestCase):
+    def setUp(self) -> None:
+        self.tracker = ListenerSessionTracker()
+
+    def test_sessions_start_and_end(self):
+        listeners = [
+            fake_data_generator.return_fake_listener_json(hash="a", connected_on=1000, connected_time=60),
+            fake_data_generator.return_fake_listener_json(hash="b", connected_on=1030, connected_time=30)
+        ]
+        events = self.tracker.ingest(listeners, timestamp=60)
+
+        self.assertEqual([event.type for event in events], [SessionEvents.START] * 2)
+        self.assertEqual(self.tracker.active_sessions, 2)
+
+        listeners = [fake_data_generator.return_fake_listener_json(hash="a", connected_on=1000, connected_time=120)]
+        events = self.tracker.ingest(listeners, timestamp=120)
+
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0].type, SessionEvents.END)
+        self.assertEqual(events[0].hash, "b")
+        self.assertEqual(events[0].duration, 30)
+        self.assertEqual(events[0].ended_at, 60)
+
+        self.assertEqual(self.tracker.sessions_started, 2)
+        self.assertEqual(self.tracker.sessions_ended, 1)
+        self.assertEqual(self.tracker.churn_rate, 0.5)
+        self.assertEqual(self.tracker.average_session_length, 30)
+        self.assertEqual(self.tracker.total_listening_hours, 150 / 3600)
+
+    def test_reconnect_between_polls_is_a_new_session(self):
+        listeners = [fake_data_generator.return_fake_listener_json(hash="a", connected_on=1000, connected_time=60)]
+        self.tracker.ingest(listeners, timestamp=60)
+
+        listeners = [fake_data_generator.return_fake_listener_json(hash="a", connected_on=1100, connected_time=20)]
+        events = self.tracker.ingest(listeners, timestamp=120)
+
+        self.assertEqual([event.type for event in events], [SessionEvents.END, SessionEvents.START])
+        self.assertEqual(self.tracker.active_sessions, 1)
+
+    def test_listeners_sharing_a_hash(self):
+        listeners = [
+            fake_data_generator.return_fake_listener_json(hash="a", connected_on=1000, connected_time=60),
+            fake_data_generator.return_fake_listener_json(hash="a", connected_on=1030, connected_time=30)
+        ]
+        events = self.tracker.ingest(listeners, timestamp=60)
+
+        self.assertEqual([event.type for event in events], [SessionEvents.START] * 2)
+        self.assertEqual(self.tracker.active_sessions, 2)
+
+        listeners = [
+            fake_data_generator.return_fake_listener_json(hash="a", connected_on=1000, connected_time=120),
+            fake_data_generator.return_fake_listener_json(hash="a", connected_on=1030, connected_time=90)
+        ]
+        events = self.tracker.ingest(listeners, timestamp=120)
+
+        self.assertEqual(events, [])
+        self.assertEqual(self.tracker.sessions_started, 2)
+        self.assertEqual(self.tracker.total_listening_hours, 210 / 3600)
+
+        listeners = [fake_data_generator.return_fake_listener_json(hash="a", connected_on=1030, connected_time=150)]
+        events = self.tracker.ingest(listeners, timestamp=180)
+
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0].type, SessionEvents.END)
+        self.assertEqual(events[0].started_at, 1000)
+        self.assertEqual(self.tracker.sessions_ended, 1)
+        self.assertEqual(self.tracker.churn_rate, 0.5)
+
+    def test_accepts_listener_objects(self):
+        listener = fake_data_generator.return_fake_listener_json(hash="a", connected_on=1000, connected_time=60)
+        events = self.tracker.ingest([models.Listener(**listener)], timestamp=60)
+
+        self.assertEqual(events[0].hash, "a")
+        self.assertEqual(self.tracker.stats()["active_sessions"], 1)
+
+    def test_empty_polls(self):
+        self.assertEqual(self.tracker.ingest([], timestamp=0), [])
+        self.assertEqual(self.tracker.churn_rate, 0)
+        self.assertEqual(self.tracker.average_session_length, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+from unittest import TestCase, mock
+
+from AzuracastPy import models
+from AzuracastPy.analytics import ListenerSnapshot
+from AzuracastPy.exceptions import ClientException
+
+from .util import fake_data_generator
+
+class TestListenerSnapshot(TestCase):
+    def setUp(self) -> None:
+        self.listeners = [
+            fake_data_generator.return_fake_listener_json(
+                hash="a", mount_name="/radio.mp3", location={"country": "US"},
+                device={"is_mobile": True}, connected_on=3600, connected_time=100
+            ),
+            fake_data_generator.return_fake_listener_json(
+                hash="b", mount_name="/radio.mp3", location={"country": "US"},
+                connected_on=3700, connected_time=4000
+            ),
+            fake_data_generator.return_fake_listener_json(
+                hash="c", mount_name="/hi.mp3", location={"country": "NG"},
+                device={"is_mobile": True}, connected_on=7300, connected_time=500
+            )
+        ]
+        self.snapshot = ListenerSnapshot.from_listeners(self.listeners, station_id=1)
+
+    def test_from_listener_objects_matches_dictionaries(self):
+        snapshot = ListenerSnapshot.from_listeners(
+            [models.Listener(**listener) for listener in self.listeners], station_id=1
+        )
+
+        self.assertEqual(snapshot.column("country"), self.snapshot.column("country"))
+        self.assertEqual(snapshot.column("is_mobile"), [True, False, True])
+
+    def test_from_station_uses_raw_response(self):
+        station = fake_data_generator.return_fake_station_instance()
+        station._request_handler = mock.MagicMock()
+        station._request_handler.get.return_value = self.listeners
+
+        snapshot = ListenerSnapshot.from_station(station)
+
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(snapshot.count_by("station_id"), {station.id: 3})
+
+    def test_count_by(self):
+        self.assertEqual(self.snapshot.count_by("country"), {"US": 2, "NG": 1})
+        self.assertEqual(self.snapshot.count_by("is_mobile"), {True: 2, False: 1})
+
+    def test_sum_by(self):
+        self.assertEqual(self.snapshot.sum_by("country"), {"US": 4100, "NG": 500})
+        self.assertEqual(self.snapshot.sum_by("mount_name"), {"/radio.mp3": 4100, "/hi.mp3": 500})
+
+    def test_histogram(self):
+        self.assertEqual(
+            self.snapshot.histogram("connected_on", bin_width=3600),
+            {3600: 2, 7200: 1}
+        )
+        self.assertEqual(
+            self.snapshot.histogram("connected_time", bins=[0, 300, 3600]),
+            {0: 1, 300: 1, 3600: 1}
+        )
+
+    def test_histogram_requires_one_kind_of_bins(self):
+        with self.assertRaises(ClientException):
+            self.snapshot.histogram("connected_time")
+
+        with self.assertRaises(ClientException):
+            self.snapshot.histogram("connected_time", bin_width=60, bins=[0])
+
+    def test_filter(self):
+        mobile_in_us = self.snapshot.filter(country="US", is_mobile=True)
+
+        self.assertEqual(len(mobile_in_us), 1)
+        self.assertEqual(mobile_in_us.column("hash"), ["a"])
+        self.assertEqual(len(self.snapshot.filter(country="FR")), 0)
+
+    def test_merge(self):
+        listeners = [
+            fake_data_generator.return_fake_listener_json(hash="d", location={"country": "FR"}),
+            fake_data_generator.return_fake_listener_json(hash="e", location={"country": "US"})
+        ]
+        other = ListenerSnapshot.from_listeners(listeners, station_id=2)
+
+        merged = ListenerSnapshot.merge(self.snapshot, other)
+
+        self.assertEqual(len(merged), 5)
+        self.assertEqual(merged.count_by("country"), {"US": 3, "NG": 1, "FR": 1})
+        self.assertEqual(merged.count_by("station_id"), {1: 3, 2: 2})
+        self.assertEqual(merged.column("hash"), ["a", "b", "c", "d", "e"])
+
+    def test_invalid_field_raises(self):
+        with self.assertRaises(ClientException):
+            self.snapshot.count_by("planet")
+
+if __name__ == '__main__':
+    unittest.main()
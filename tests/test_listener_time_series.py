@@ -0,0 +1,84 @@
+import csv
+import io
+import unittest
+from unittest import TestCase
+
+from AzuracastPy import models
+from AzuracastPy.analytics import ListenerTimeSeries
+from AzuracastPy.enums import Resolutions
+from AzuracastPy.exceptions import ClientException
+
+from .util import fake_data_generator
+
+def _fake_now_playing(current, station_id=1):
+    now_playing = fake_data_generator.return_fake_now_playing_json(
+        station={"id": station_id},
+        listeners={"total": current + 1, "unique": current, "current": current}
+    )
+    # Mounts are a list, so the first one is changed in place.
+    now_playing['station']['mounts'][0]['listeners']['current'] = current * 2
+
+    return models.NowPlaying(**now_playing)
+
+class TestListenerTimeSeries(TestCase):
+    def setUp(self) -> None:
+        self.series = ListenerTimeSeries(raw_capacity=5, minute_capacity=3, hour_capacity=2)
+
+    def test_record_creates_station_and_mount_series(self):
+        self.series.record([_fake_now_playing(3), _fake_now_playing(4, station_id=2)], 0)
+
+        self.assertEqual(
+            sorted(self.series.keys(), key=str),
+            sorted([(1, None), (1, 4), (1, 5), (2, None), (2, 4), (2, 5)], key=str)
+        )
+        self.assertEqual(list(self.series.series(1, mount_id=4)["current"]), [6])
+
+    def test_raw_buffer_keeps_latest_samples(self):
+        for i in range(8):
+            self.series.record(_fake_now_playing(i), timestamp=i)
+
+        raw = self.series.series(1)
+
+        self.assertEqual(list(raw["time"]), [3, 4, 5, 6, 7])
+        self.assertEqual(list(raw["current"]), [3, 4, 5, 6, 7])
+        self.assertEqual(list(raw["total"]), [4, 5, 6, 7, 8])
+
+    def test_minute_buckets_aggregate_samples(self):
+        for timestamp, current in ((0, 2), (30, 6), (60, 10), (90, 20), (120, 1)):
+            self.series.record(_fake_now_playing(current), timestamp)
+
+        minutes = self.series.series(1, resolution=Resolutions.MINUTE)
+
+        self.assertEqual(list(minutes["time"]), [0, 60, 120])
+        self.assertEqual(list(minutes["current_min"]), [2, 10, 1])
+        self.assertEqual(list(minutes["current_max"]), [6, 20, 1])
+        self.assertEqual(list(minutes["current_avg"]), [4, 15, 1])
+
+    def test_downsampled_buffer_is_bounded(self):
+        for minute in range(10):
+            self.series.record(_fake_now_playing(minute), minute * 60)
+
+        minutes = self.series.series(1, resolution=Resolutions.MINUTE)
+        hours = self.series.series(1, resolution=Resolutions.HOUR)
+
+        self.assertEqual(list(minutes["time"]), [420, 480, 540])
+        self.assertEqual(list(hours["current_avg"]), [4.5])
+
+    def test_to_csv(self):
+        self.series.record(_fake_now_playing(3), 100)
+        output = io.StringIO()
+
+        self.series.to_csv(output, station_id=1)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertEqual(rows, [["time", "total", "unique", "current"], ["100", "4", "3", "3"]])
+
+    def test_unknown_series_is_empty(self):
+        self.assertEqual(len(self.series.series(9)["time"]), 0)
+
+    def test_invalid_resolution_raises(self):
+        with self.assertRaises(ClientException):
+            self.series.series(1, resolution="minute")
+
+if __name__ == '__main__':
+    unittest.main()
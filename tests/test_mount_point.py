@@ -105,5 +105,14 @@ class TestStation(TestCase):
         self.assertIsNotNone(self.mount_point.links)
         self.assertIsNotNone(self.mount_point._station)
 
+    def test_mount_point_refresh_returns_changed_fields(self):
+        self.mount_point._station._request_handler.get.return_value = fake_data_generator.return_fake_mount_point_json()
+        self.mount_point._station._request_handler.get.return_value['listeners_total'] = 42
+
+        changed = self.mount_point.refresh()
+
+        self.assertEqual(changed, {"listeners_total"})
+        self.assertEqual(self.mount_point.listeners_total, 42)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
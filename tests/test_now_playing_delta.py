@@ -0,0 +1,121 @@
+import copy
+import json
+import unittest
+from unittest import TestCase
+
+from AzuracastPy import models
+from AzuracastPy.exceptions import ClientException
+from AzuracastPy.realtime import NowPlayingDelta, diff_now_playing
+
+from .util import fake_data_generator
+
+def _advance(now_playing):
+    # Moves the station on to its next song, the way the API reports it.
+    advanced = copy.deepcopy(now_playing)
+
+    history_entry = copy.deepcopy(advanced['now_playing'])
+    for key in ("elapsed", "remaining"):
+        del history_entry[key]
+
+    advanced['song_history'].insert(0, history_entry)
+    advanced['now_playing']['sh_id'] += 1
+    advanced['now_playing']['song'] = advanced['playing_next']['song']
+    advanced['playing_next']['cued_at'] += 100
+    advanced['listeners']['current'] += 3
+
+    return advanced
+
+class TestNowPlayingDelta(TestCase):
+    def setUp(self) -> None:
+        self.previous = fake_data_generator.return_fake_now_playing_json()
+        self.current = _advance(self.previous)
+
+    def test_identical_snapshots_have_no_changes(self):
+        delta = diff_now_playing(self.previous, copy.deepcopy(self.previous))
+
+        self.assertIsInstance(delta, NowPlayingDelta)
+        self.assertFalse(delta)
+        self.assertEqual(delta.to_dict(), {})
+
+    def test_raw_dictionaries(self):
+        delta = diff_now_playing(self.previous, self.current)
+
+        self.assertTrue(delta)
+        self.assertEqual(delta.song['sh_id'], self.previous['now_playing']['sh_id'] + 1)
+        self.assertEqual(len(delta.history), 1)
+        self.assertEqual(delta.history[0]['sh_id'], self.previous['now_playing']['sh_id'])
+        self.assertIsNotNone(delta.playing_next)
+        self.assertEqual(delta.listener_delta, 3)
+        self.assertIsNone(delta.live)
+        self.assertIsNone(delta.is_online)
+
+        self.assertEqual(
+            set(delta.to_dict()),
+            {"song", "history", "playing_next", "listeners", "listener_delta"}
+        )
+
+    def test_model_objects(self):
+        delta = diff_now_playing(
+            models.NowPlaying(**self.previous),
+            models.NowPlaying(**self.current)
+        )
+
+        self.assertIsInstance(delta.song, models.now_playing.CurrentSong)
+        self.assertIsInstance(delta.history[0], models.SongHistory)
+        self.assertEqual(delta.listener_delta, 3)
+
+        # Serialized object deltas match serialized dictionary deltas.
+        json.dumps(delta.to_dict())
+
+    def test_live_and_online_flips(self):
+        self.current = copy.deepcopy(self.previous)
+        self.current['live']['is_live'] = True
+        self.current['live']['streamer_name'] = "DJ"
+        self.current['is_online'] = False
+
+        delta = diff_now_playing(self.previous, self.current)
+
+        self.assertEqual(delta.live['streamer_name'], "DJ")
+        self.assertIs(delta.is_online, False)
+        self.assertEqual(delta.to_dict(), {"live": self.current['live'], "is_online": False})
+
+    def test_song_cleared(self):
+        self.current = copy.deepcopy(self.previous)
+        self.current['now_playing'] = None
+
+        delta = diff_now_playing(self.previous, self.current)
+
+        self.assertTrue(delta.song_changed)
+        self.assertIsNone(delta.song)
+        self.assertTrue(delta)
+        self.assertEqual(delta.to_dict(), {"song": None})
+
+        self.assertFalse(diff_now_playing(self.current, copy.deepcopy(self.current)).song_changed)
+
+    def test_next_song_cleared(self):
+        self.current = copy.deepcopy(self.previous)
+        self.current['playing_next'] = None
+
+        delta = diff_now_playing(self.previous, self.current)
+
+        self.assertTrue(delta.playing_next_changed)
+        self.assertIsNone(delta.playing_next)
+        self.assertTrue(delta)
+        self.assertEqual(delta.to_dict(), {"playing_next": None})
+
+        unchanged = diff_now_playing(self.current, copy.deepcopy(self.current))
+        self.assertFalse(unchanged.playing_next_changed)
+        self.assertFalse(unchanged)
+
+    def test_first_snapshot_is_all_changes(self):
+        delta = diff_now_playing(None, self.current)
+
+        self.assertEqual(len(delta.history), len(self.current['song_history']))
+        self.assertIsNotNone(delta.song)
+
+    def test_mixed_snapshot_types_raise(self):
+        with self.assertRaises(ClientException):
+            diff_now_playing(self.previous, models.NowPlaying(**self.current))
+
+if __name__ == '__main__':
+    unittest.main()
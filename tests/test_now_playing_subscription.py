@@ -0,0 +1,216 @@
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from AzuracastPy import AzuracastClient, models
+from AzuracastPy.exceptions import AzuracastAPIException
+from AzuracastPy.realtime import NowPlayingSubscription
+from AzuracastPy.realtime.subscription import _iter_sse_events
+
+from .util import fake_data_generator
+
+def _publication(sh_id, offset):
+    now_playing = fake_data_generator.return_fake_now_playing_json(now_playing={"sh_id": sh_id})
+
+    return {"data": {"np": now_playing}, "offset": offset}
+
+def _frame(message):
+    return f"data: {json.dumps(message)}\n\n"
+
+class _FakeSSEServer(ThreadingHTTPServer):
+    """Serves one scripted event stream per connection, like AzuraCast's SSE endpoint."""
+    daemon_threads = True
+
+    def __init__(self, streams, status=200):
+        super().__init__(("127.0.0.1", 0), _FakeSSEHandler)
+        self.streams = list(streams)
+        self.status = status
+        self.requests = []
+        self.headers = []
+        self.stopped = threading.Event()
+
+class _FakeSSEHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(parse_qs(urlparse(self.path).query))
+        self.server.headers.append(dict(self.headers))
+
+        if self.server.status != 200:
+            self.send_response(self.server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        frames, keep_open = self.server.streams.pop(0) if self.server.streams else ([], True)
+
+        for frame in frames:
+            data = frame.encode()
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        if keep_open:
+            self.server.stopped.wait(5)
+
+        self.wfile.write(b"0\r\n\r\n")
+        self.close_connection = True
+
+class TestNowPlayingSubscription(TestCase):
+    def _start_server(self, streams, status=200, x_api_key=None):
+        server = _FakeSSEServer(streams, status)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            server.stopped.set()
+            server.shutdown()
+            server.server_close()
+
+        self.addCleanup(stop)
+
+        client = AzuracastClient(
+            radio_url=f"http://127.0.0.1:{server.server_address[1]}", x_api_key=x_api_key
+        )
+
+        return server, client
+
+    def test_iterates_pushed_updates_and_resumes_after_disconnect(self):
+        first_stream = [
+            ": keep-alive\n\n",
+            _frame({
+                "connect": {
+                    "subs": {
+                        "station:yet_another_radio": {
+                            "epoch": "abc",
+                            "publications": [_publication(1, 1)]
+                        }
+                    }
+                }
+            }),
+            _frame({
+                "channel": "station:yet_another_radio",
+                "pub": _publication(2, 2)
+            })
+        ]
+        second_stream = [
+            # Already received before the connection dropped.
+            _frame({
+                "channel": "station:yet_another_radio",
+                "pub": _publication(2, 2)
+            }),
+            _frame({
+                "channel": "station:yet_another_radio",
+                "pub": _publication(3, 3)
+            })
+        ]
+        server, client = self._start_server([(first_stream, False), (second_stream, True)])
+
+        subscription = NowPlayingSubscription(client, "yet_another_radio", retry_delay=0.01)
+
+        received = []
+        for now_playing in subscription:
+            self.assertIsInstance(now_playing, models.NowPlaying)
+            received.append(now_playing.now_playing.sh_id)
+
+            if len(received) == 3:
+                subscription.close()
+
+        self.assertEqual(received, [1, 2, 3])
+
+        first_request = json.loads(server.requests[0]['cs'][0])
+        second_request = json.loads(server.requests[1]['cs'][0])
+
+        self.assertEqual(first_request, {"subs": {"station:yet_another_radio": {"recover": True}}})
+        self.assertEqual(
+            second_request,
+            {"subs": {"station:yet_another_radio": {"recover": True, "epoch": "abc", "offset": 2}}}
+        )
+
+    def test_cached_update_after_epoch_change_is_not_dropped(self):
+        first_stream = [
+            _frame({
+                "channel": "station:yet_another_radio",
+                "pub": _publication(1, 5)
+            })
+        ]
+        second_stream = [
+            # The stream was replaced, so the offsets start over.
+            _frame({
+                "connect": {
+                    "subs": {"station:yet_another_radio": {"epoch": "def"}},
+                    "data": [dict(_publication(2, 1), channel="station:yet_another_radio")]
+                }
+            })
+        ]
+        _, client = self._start_server([(first_stream, False), (second_stream, True)])
+
+        subscription = NowPlayingSubscription(client, "yet_another_radio", retry_delay=0.01)
+
+        received = []
+        for now_playing in subscription:
+            received.append(now_playing.now_playing.sh_id)
+
+            if len(received) == 2:
+                subscription.close()
+
+        self.assertEqual(received, [1, 2])
+
+    def test_async_iteration(self):
+        stream = [
+            _frame({
+                "channel": "station:yet_another_radio",
+                "pub": _publication(7, 1)
+            })
+        ]
+        _, client = self._start_server([(stream, True)])
+
+        async def receive_first():
+            async for now_playing in NowPlayingSubscription(client, "yet_another_radio"):
+                return now_playing
+
+        now_playing = asyncio.run(receive_first())
+
+        self.assertEqual(now_playing.now_playing.sh_id, 7)
+
+    def test_disabled_endpoint_raises(self):
+        _, client = self._start_server([], status=404)
+
+        with self.assertRaises(AzuracastAPIException):
+            next(iter(NowPlayingSubscription(client, "yet_another_radio")))
+
+    def test_request_sends_client_headers(self):
+        stream = [
+            _frame({
+                "channel": "station:yet_another_radio",
+                "pub": _publication(7, 1)
+            })
+        ]
+        server, client = self._start_server([(stream, True)], x_api_key="secret")
+
+        with NowPlayingSubscription(client, "yet_another_radio") as subscription:
+            next(iter(subscription))
+
+        self.assertEqual(server.headers[0]['X-API-Key'], "secret")
+        self.assertEqual(server.headers[0]['accept'], "text/event-stream")
+
+    def test_iter_sse_events_handles_split_chunks(self):
+        chunks = ["data: fir", "st\r", "\ndata: line\r\n\r\n: comment\n", "id: 4\ndata: x\n", "\n"]
+
+        events = list(_iter_sse_events(chunks))
+
+        self.assertEqual(events, [{"data": "first\nline"}, {"id": "4", "data": "x"}])
+
+if __name__ == '__main__':
+    unittest.main()
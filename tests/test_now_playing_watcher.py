@@ -0,0 +1,193 @@
+import unittest
+from unittest import TestCase, mock
+
+from AzuracastPy.exceptions import ClientException
+from AzuracastPy.realtime import NowPlayingWatcher
+
+from .util import fake_data_generator
+
+class TestNowPlayingWatcher(TestCase):
+    def setUp(self) -> None:
+        self.client = mock.MagicMock()
+        self.clock = mock.patch("AzuracastPy.realtime.watcher.time.monotonic", return_value=0)
+        self.monotonic = self.clock.start()
+
+    def tearDown(self) -> None:
+        self.clock.stop()
+
+    def test_song_change_calls_callback(self):
+        watcher = NowPlayingWatcher(self.client, station_ids=[1], jitter=0)
+        callback = mock.MagicMock()
+        watcher.on_song_change(callback)
+
+        first = fake_data_generator.return_fake_now_playing_instance(now_playing={"sh_id": 1})
+        second = fake_data_generator.return_fake_now_playing_instance(now_playing={"sh_id": 2})
+        self.client.now_playing.side_effect = [first, second]
+
+        watcher.poll()
+        callback.assert_not_called()
+
+        self.monotonic.return_value = 100
+        watcher.poll()
+
+        callback.assert_called_once_with(first, second)
+        self.assertIs(watcher.now_playing(1), second)
+
+    def test_song_change_to_nothing_calls_callback(self):
+        watcher = NowPlayingWatcher(self.client, station_ids=[1], jitter=0)
+        callback = watcher.on_song_change(mock.MagicMock())
+
+        self.client.now_playing.side_effect = [
+            fake_data_generator.return_fake_now_playing_instance(),
+            fake_data_generator.return_fake_now_playing_instance(
+                is_online=False, now_playing=None, playing_next=None
+            )
+        ]
+
+        watcher.poll()
+        self.monotonic.return_value = 100
+        watcher.poll()
+
+        callback.assert_called_once()
+
+    def test_failing_callback_is_isolated(self):
+        watcher = NowPlayingWatcher(self.client, station_ids=[1, 2], jitter=0)
+        failing = watcher.on_song_change(mock.MagicMock(side_effect=ValueError("boom")))
+        callback = watcher.on_song_change(mock.MagicMock())
+
+        self.client.now_playing.side_effect = [
+            [
+                fake_data_generator.return_fake_now_playing_instance(
+                    station={"id": station_id}, now_playing={"sh_id": sh_id}
+                )
+                for station_id in (1, 2)
+            ]
+            for sh_id in (1, 2)
+        ]
+
+        watcher.poll()
+        self.monotonic.return_value = 100
+
+        with self.assertLogs("AzuracastPy.realtime.watcher", level="ERROR"):
+            watcher.poll()
+
+        self.assertEqual(failing.call_count, 2)
+        self.assertEqual(callback.call_count, 2)
+        self.assertEqual(watcher.now_playing(2).now_playing.sh_id, 2)
+
+    def test_next_poll_follows_remaining_time(self):
+        watcher = NowPlayingWatcher(self.client, station_ids=[1], jitter=0)
+        self.client.now_playing.return_value = fake_data_generator.return_fake_now_playing_instance(
+            now_playing={"remaining": 41}
+        )
+
+        self.assertEqual(watcher.poll(), 41)
+
+        # Nothing is due yet, so no request is made.
+        self.monotonic.return_value = 20
+        watcher.poll()
+        self.assertEqual(self.client.now_playing.call_count, 1)
+
+    def test_next_poll_is_bounded_by_intervals(self):
+        watcher = NowPlayingWatcher(
+            self.client, station_ids=[1], min_interval=5, max_interval=30, jitter=0
+        )
+
+        self.client.now_playing.return_value = fake_data_generator.return_fake_now_playing_instance(
+            now_playing={"remaining": 600}
+        )
+        self.assertEqual(watcher.poll(), 30)
+
+        self.monotonic.return_value = 30
+        self.client.now_playing.return_value = fake_data_generator.return_fake_now_playing_instance(
+            now_playing={"remaining": 0}
+        )
+        self.assertEqual(watcher.poll(), 5)
+
+    def test_due_stations_are_batched(self):
+        watcher = NowPlayingWatcher(self.client, station_ids=[1, 2], jitter=0)
+        self.client.now_playing.return_value = [
+            fake_data_generator.return_fake_now_playing_instance(station={"id": 1}),
+            fake_data_generator.return_fake_now_playing_instance(station={"id": 2}),
+            fake_data_generator.return_fake_now_playing_instance(station={"id": 3})
+        ]
+
+        watcher.poll()
+
+        self.client.now_playing.assert_called_once_with()
+        self.assertIsNotNone(watcher.now_playing(2))
+        self.assertIsNone(watcher.now_playing(3))
+
+    def test_every_station_is_resolved_again_periodically(self):
+        watcher = NowPlayingWatcher(self.client, resolve_interval=300, jitter=0)
+
+        def radio(*station_ids):
+            return [
+                fake_data_generator.return_fake_now_playing_instance(station={"id": station_id})
+                for station_id in station_ids
+            ]
+
+        self.client.now_playing.side_effect = [radio(1, 2), radio(2, 3)]
+
+        watcher.poll()
+        self.assertIsNotNone(watcher.now_playing(1))
+
+        self.monotonic.return_value = 300
+        watcher.poll()
+
+        self.assertEqual(self.client.now_playing.call_args_list, [mock.call(), mock.call()])
+        self.assertIsNone(watcher.now_playing(1))
+        self.assertIsNotNone(watcher.now_playing(3))
+
+    def test_unknown_station_is_skipped(self):
+        watcher = NowPlayingWatcher(self.client, station_ids=[9], max_interval=60, jitter=0)
+
+        # The API returns every station for an ID it doesn't know.
+        self.client.now_playing.return_value = [
+            fake_data_generator.return_fake_now_playing_instance(station={"id": 1})
+        ]
+
+        with self.assertLogs("AzuracastPy.realtime.watcher", level="WARNING"):
+            self.assertEqual(watcher.poll(), 60)
+
+        self.assertIsNone(watcher.now_playing(9))
+        self.assertIsNone(watcher.now_playing(1))
+
+    def test_live_online_and_listener_callbacks(self):
+        watcher = NowPlayingWatcher(self.client, station_ids=[1], jitter=0, listener_threshold=5)
+        live = watcher.on_live_change(mock.MagicMock())
+        online = watcher.on_online_change(mock.MagicMock())
+        listeners = watcher.on_listeners_change(mock.MagicMock())
+
+        self.client.now_playing.side_effect = [
+            fake_data_generator.return_fake_now_playing_instance(listeners={"current": 10}),
+            fake_data_generator.return_fake_now_playing_instance(
+                listeners={"current": 12}, live={"is_live": True}
+            ),
+            fake_data_generator.return_fake_now_playing_instance(
+                listeners={"current": 20}, live={"is_live": True}, is_online=False
+            )
+        ]
+
+        for now in (0, 100, 200):
+            self.monotonic.return_value = now
+            watcher.poll()
+
+        live.assert_called_once()
+        online.assert_called_once()
+        listeners.assert_called_once()
+
+    def test_offline_station_without_song(self):
+        watcher = NowPlayingWatcher(self.client, station_ids=[1], max_interval=60, jitter=0)
+        self.client.now_playing.return_value = fake_data_generator.return_fake_now_playing_instance(
+            is_online=False, now_playing=None, playing_next=None
+        )
+
+        self.assertEqual(watcher.poll(), 60)
+
+    def test_invalid_intervals_raise(self):
+        with self.assertRaises(ClientException):
+            NowPlayingWatcher(self.client, min_interval=10, max_interval=5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -116,5 +116,26 @@ class TestStation(TestCase):
         self.assertIsNotNone(self.playlist.links)
         self.assertIsNotNone(self.playlist._station)
 
+    def test_playlist_refresh_returns_changed_fields(self):
+        self.playlist._station._request_handler.get.return_value = fake_data_generator.return_fake_playlist_json()
+        self.playlist._station._request_handler.get.return_value['name'] = "Changed on server"
+        self.playlist._station._request_handler.get.return_value['weight'] = 7
+
+        schedule_helper = self.playlist.schedule
+
+        changed = self.playlist.refresh()
+
+        self.assertEqual(changed, {"name", "weight"})
+        self.assertEqual(self.playlist.name, "Changed on server")
+        self.assertEqual(self.playlist.weight, 7)
+        self.assertIs(self.playlist.schedule, schedule_helper)
+
+    def test_playlist_refresh_without_changes(self):
+        self.playlist._station._request_handler.get.return_value = fake_data_generator.return_fake_playlist_json()
+
+        changed = self.playlist.refresh()
+
+        self.assertEqual(changed, set())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,15 @@
+import json
+import os
+import tempfile
 import unittest
 from unittest import TestCase, mock
 from requests import Response
 
+from AzuracastPy.util.media_util import (
+    generate_file_upload_structure,
+    stream_file_upload_structure
+)
+
 from .util import fake_data_generator
 
 class TestStation(TestCase):
@@ -80,5 +88,40 @@ class TestStation(TestCase):
         self.assertIsNotNone(self.podcast_episode.links)
         self.assertIsNotNone(self.podcast_episode._podcast)
 
+    def test_upload_media_streams_the_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            media = os.path.join(directory, "episode.mp3")
+
+            with open(media, "wb") as file:
+                file.write(os.urandom(1000))
+
+            request_handler = self.podcast_episode._podcast._station._request_handler
+
+            sent = []
+            request_handler.post_stream.side_effect = lambda url, body: (
+                sent.append((url, b"".join(body))) or {"success": True}
+            )
+
+            self.podcast_episode.upload_media(media)
+
+            self.assertTrue(self.podcast_episode.has_media)
+            self.assertTrue(sent[0][0].endswith(f"/episode/{self.podcast_episode.id}/media"))
+            self.assertEqual(
+                json.loads(sent[0][1]), generate_file_upload_structure("episode.mp3", media)
+            )
+
+    def test_streamed_upload_structure_matches_in_memory_one(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "art.jpg")
+
+            with open(path, "wb") as file:
+                file.write(os.urandom(100))
+
+            for chunk_size in (1, 3, 10, 99, 1000):
+                body = b"".join(stream_file_upload_structure("a \"b\".jpg", path, chunk_size))
+                self.assertEqual(
+                    json.loads(body), generate_file_upload_structure("a \"b\".jpg", path)
+                )
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,154 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import xml.etree.ElementTree as ElementTree
+from unittest import TestCase, mock
+
+from AzuracastPy.library import PodcastFeedWriter
+from AzuracastPy.models import PodcastEpisode
+
+from .util import fake_data_generator
+
+ITUNES = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+
+class TestPodcastFeedWriter(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "feed.xml")
+
+        self.podcast = fake_data_generator.return_fake_podcast_instance()
+        self.podcast._station = fake_data_generator.return_fake_station_instance()
+        self.podcast._station._request_handler = mock.MagicMock()
+
+        self.episodes = [self._episode_json(i, publish_at=1700000000 + i * 86400) for i in range(3)]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def _episode_json(self, number, publish_at):
+        return fake_data_generator.return_fake_podcast_episode_json(
+            id=f"episode-{number}",
+            title=f"Episode {number} & more",
+            publish_at=publish_at,
+            has_media=True,
+            media={"original_name": f"episode-{number}.mp3", "length": 3725}
+        )
+
+    def _read_feed(self):
+        return ElementTree.parse(self.path).getroot().find("channel")
+
+    def test_update_writes_feed(self):
+        with PodcastFeedWriter(self.podcast, self.path) as writer:
+            result = writer.update(self.episodes)
+
+        self.assertEqual(result, {"rendered": 3, "unchanged": 0, "removed": 0})
+
+        channel = self._read_feed()
+        self.assertEqual(channel.find("title").text, "Title")
+        self.assertEqual(channel.find(f"{ITUNES}owner/{ITUNES}email").text, "Email@gmail.com")
+
+        items = channel.findall("item")
+        self.assertEqual([item.find("guid").text for item in items],
+                         ["episode-2", "episode-1", "episode-0"])
+        self.assertEqual(items[0].find("title").text, "Episode 2 & more")
+        self.assertEqual(items[0].find(f"{ITUNES}duration").text, "01:02:05")
+        self.assertEqual(items[0].find("enclosure").get("type"), "audio/mpeg")
+        self.assertEqual(items[0].find(f"{ITUNES}image").get("href"), self.podcast.art)
+
+    def test_update_groups_categories(self):
+        with PodcastFeedWriter(self.podcast, self.path) as writer:
+            writer.update(self.episodes)
+
+        categories = self._read_feed().findall(f"{ITUNES}category")
+        self.assertEqual([category.get("text") for category in categories], ["Arts", "Business"])
+        self.assertEqual(
+            [child.get("text") for child in categories[0]],
+            ["Performing Arts", "Fashion & Beauty"]
+        )
+
+    def test_update_only_renders_changed_episodes(self):
+        with PodcastFeedWriter(self.podcast, self.path) as writer:
+            writer.update(self.episodes)
+
+        self.episodes[1]['title'] = "Renamed"
+
+        with PodcastFeedWriter(self.podcast, self.path) as writer:
+            with mock.patch("AzuracastPy.library.podcast_feed_writer._render_episode",
+                            return_value="") as render:
+                result = writer.update(self.episodes)
+
+        self.assertEqual(result, {"rendered": 1, "unchanged": 2, "removed": 0})
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(render.call_args[0][0]['title'], "Renamed")
+
+    def test_update_removes_missing_episodes(self):
+        with PodcastFeedWriter(self.podcast, self.path) as writer:
+            writer.update(self.episodes)
+            result = writer.update(self.episodes[1:])
+
+            self.assertEqual(len(writer), 2)
+
+        self.assertEqual(result, {"rendered": 0, "unchanged": 2, "removed": 1})
+        guids = [item.find("guid").text for item in self._read_feed().findall("item")]
+        self.assertEqual(guids, ["episode-2", "episode-1"])
+
+    def test_update_skips_unpublished_episodes(self):
+        self.episodes[0]['has_media'] = False
+        self.episodes[1]['publish_at'] = int(time.time()) + 3600
+
+        with PodcastFeedWriter(self.podcast, self.path) as writer:
+            result = writer.update(self.episodes)
+
+        self.assertEqual(result["rendered"], 1)
+        self.assertEqual(len(self._read_feed().findall("item")), 1)
+
+    def test_update_accepts_episode_objects(self):
+        episodes = [PodcastEpisode(**episode, _podcast=self.podcast) for episode in self.episodes]
+
+        with PodcastFeedWriter(self.podcast, self.path) as writer:
+            writer.update(self.episodes)
+            result = writer.update(episodes)
+
+        self.assertEqual(result, {"rendered": 0, "unchanged": 3, "removed": 0})
+
+    def test_update_fetches_episodes(self):
+        self.podcast._station._request_handler.get.return_value = {
+            "rows": self.episodes, "total": len(self.episodes)
+        }
+
+        with PodcastFeedWriter(self.podcast, self.path) as writer:
+            result = writer.update()
+
+        self.assertEqual(result["rendered"], 3)
+
+        # Only the podcast's own episodes are fetched, a page at a time.
+        self.podcast._station._request_handler.get.assert_called_once()
+        url = self.podcast._station._request_handler.get.call_args[0][0]
+        self.assertIn(f"/podcast/{self.podcast.id}/episodes?page=1", url)
+
+    def test_enclosure_length_is_the_media_size(self):
+        self.episodes[0]['media']['size'] = 4096
+        self.episodes[1]['id'] = 7
+
+        with PodcastFeedWriter(self.podcast, self.path) as writer:
+            writer.update(self.episodes)
+
+        items = {item.find("guid").text: item for item in self._read_feed().findall("item")}
+        self.assertEqual(items["episode-0"].find("enclosure").get("length"), "4096")
+        self.assertEqual(items["episode-2"].find("enclosure").get("length"), "0")
+        self.assertIn("7", items)
+
+    def test_state_path(self):
+        state = os.path.join(self.directory, "custom.state")
+
+        with PodcastFeedWriter(self.podcast, self.path, state=state) as writer:
+            writer.update(self.episodes)
+
+        self.assertTrue(os.path.isfile(state))
+        self.assertFalse(os.path.exists(f"{self.path}.state"))
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+if __name__ == '__main__':
+    unittest.main()
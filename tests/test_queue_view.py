@@ -0,0 +1,126 @@
+import unittest
+from unittest import TestCase, mock
+
+from AzuracastPy.exceptions import ClientException
+from AzuracastPy.queue import QueueView
+
+from .util import fake_data_generator
+
+class TestQueueView(TestCase):
+    def setUp(self) -> None:
+        self.station = fake_data_generator.return_fake_station_instance()
+        self.station._request_handler = mock.MagicMock()
+        self.station._request_handler.delete.return_value = {"success": True}
+
+        self.queue = [
+            fake_data_generator.return_fake_queue_item_json(
+                10, cued_at=1000, played_at=2000, duration=120, is_request=False
+            ),
+            fake_data_generator.return_fake_queue_item_json(
+                11, cued_at=1010, played_at=2120, duration=120, is_request=True
+            ),
+            fake_data_generator.return_fake_queue_item_json(
+                12, cued_at=1020, played_at=2240, duration=120, is_request=True
+            )
+        ]
+        self.station._request_handler.get.side_effect = lambda url: list(self.queue)
+
+        self.clock = mock.patch("AzuracastPy.queue.queue_view.time.monotonic", return_value=0)
+        self.monotonic = self.clock.start()
+
+        self.view = QueueView(self.station, ttl=5)
+
+    def tearDown(self) -> None:
+        self.clock.stop()
+
+    def test_items_are_cached_for_the_ttl(self):
+        self.assertEqual([item.id for item in self.view.items()], [10, 11, 12])
+        self.assertEqual(len(self.view), 3)
+
+        self.monotonic.return_value = 4
+        self.view.items()
+        self.assertEqual(self.station._request_handler.get.call_count, 1)
+
+        self.monotonic.return_value = 5
+        self.view.items()
+        self.assertEqual(self.station._request_handler.get.call_count, 2)
+
+    def test_lookups_by_id_and_time(self):
+        self.assertEqual(self.view.get(11).played_at, 2120)
+        self.assertEqual([item.id for item in self.view.cued_between(1005, 1020)], [11, 12])
+        self.assertEqual(self.view.playing_at(2130).id, 11)
+        self.assertIsNone(self.view.playing_at(1999))
+        self.assertIsNone(self.view.playing_at(2360))
+
+        with self.assertRaises(ClientException):
+            self.view.get(99)
+
+    def test_refresh_detects_head_removal_and_tail_append(self):
+        first = self.view.items()
+
+        self.queue = self.queue[1:] + [
+            fake_data_generator.return_fake_queue_item_json(
+                13, cued_at=1030, played_at=2360, duration=120, is_request=False
+            )
+        ]
+        change = self.view.refresh()
+
+        self.assertEqual([item.id for item in change.removed], [10])
+        self.assertEqual([item.id for item in change.added], [13])
+        self.assertFalse(change.reordered)
+        self.assertIs(self.view.get(11), first[1])
+
+        self.queue = [self.queue[1], self.queue[0], self.queue[2]]
+        change = self.view.refresh()
+
+        self.assertEqual((change.removed, change.added, change.reordered), ([], [], True))
+
+    def test_bulk_delete(self):
+        requests = [item for item in self.view if item.is_request]
+
+        def delete(url):
+            if url.endswith("/12"):
+                return {"success": False, "message": "Not found."}
+            return {"success": True}
+
+        self.station._request_handler.delete.side_effect = delete
+
+        result = self.view.delete(requests, workers=2)
+
+        self.assertEqual(result, {"deleted": 1, "failed": 1})
+        self.assertEqual(self.view.failures, {12: "Not found."})
+        self.assertEqual([item.id for item in self.view.items()], [10, 12])
+        self.assertEqual(self.station._request_handler.get.call_count, 1)
+
+    def test_bulk_delete_records_request_errors(self):
+        def delete(url):
+            if url.endswith("/12"):
+                raise ClientException("Requested resource not found.")
+            return {"success": True}
+
+        self.station._request_handler.delete.side_effect = delete
+
+        result = self.view.delete([11, 12])
+
+        self.assertEqual(result, {"deleted": 1, "failed": 1})
+        self.assertEqual(self.view.failures, {12: "Requested resource not found."})
+
+    def test_queue_item_id_and_delete(self):
+        item = self.view.get(10)
+
+        item.delete()
+
+        self.station._request_handler.delete.assert_called_once_with(
+            f"{self.station._request_handler.radio_url}/api/station/{self.station.id}/queue/10"
+        )
+        self.assertIsNone(item.id)
+
+    def test_delete_rejects_invalid_items(self):
+        with self.assertRaises(ClientException):
+            self.view.delete(["10"])
+
+        with self.assertRaises(ClientException):
+            self.view.delete([10], workers=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from unittest import TestCase, mock
+from urllib.parse import parse_qs, urlparse
+
+from AzuracastPy.exceptions import ClientException
+from AzuracastPy.queue import RequestCatalog
+
+from .util import fake_data_generator
+
+CATALOG = [
+    fake_data_generator.return_fake_requestable_song_json(
+        request_id=f"r{i}", song={"id": f"s{i}", "text": f"Artist - Song {i}"}
+    )
+    for i in range(1, 8)
+]
+
+def _paged_get(url):
+    params = {key: values[0] for key, values in parse_qs(urlparse(url).query).items()}
+    page, per_page = int(params['page']), int(params['per_page'])
+
+    rows = CATALOG
+    if 'searchPhrase' in params:
+        rows = [row for row in rows if params['searchPhrase'] in row['song']['text']]
+
+    return {
+        "page": page,
+        "per_page": per_page,
+        "total": len(rows),
+        "rows": rows[(page - 1) * per_page:page * per_page]
+    }
+
+class TestRequestCatalog(TestCase):
+    def setUp(self) -> None:
+        self.station = fake_data_generator.return_fake_station_instance()
+        self.station._request_handler = mock.MagicMock()
+        self.station._request_handler.get.side_effect = _paged_get
+
+        self.clock = mock.patch("AzuracastPy.queue.request_catalog.time.monotonic", return_value=0)
+        self.monotonic = self.clock.start()
+
+        self.catalog = RequestCatalog(self.station, per_page=3, ttl=60)
+
+    def tearDown(self) -> None:
+        self.clock.stop()
+
+    def test_first_page_only_fetches_one_page(self):
+        page = self.catalog.page(1)
+
+        self.assertEqual([song.request_id for song in page], ["r1", "r2", "r3"])
+        self.assertEqual((self.catalog.total, self.catalog.total_pages), (7, 3))
+        self.assertEqual(self.station._request_handler.get.call_count, 1)
+        self.assertIn("page=1&per_page=3", self.station._request_handler.get.call_args.args[0])
+
+    def test_pages_are_cached_for_the_ttl(self):
+        self.catalog.page(2)
+        self.catalog.page(2)
+        self.assertEqual(self.station._request_handler.get.call_count, 1)
+
+        self.monotonic.return_value = 60
+        self.catalog.page(2)
+        self.assertEqual(self.station._request_handler.get.call_count, 2)
+
+    def test_songs_and_index(self):
+        self.assertIsNone(self.catalog.song("r7"))
+
+        self.assertEqual([song.request_id for song in self.catalog], [f"r{i}" for i in range(1, 8)])
+        self.assertEqual(self.station._request_handler.get.call_count, 3)
+
+        self.catalog.clear()
+        self.assertEqual(self.catalog.song("r7").text, "Artist - Song 7")
+
+    def test_search(self):
+        results = list(self.catalog.songs(search="Song 5"))
+
+        self.assertEqual([song.request_id for song in results], ["r5"])
+        self.assertIn("searchPhrase=Song+5", self.station._request_handler.get.call_args.args[0])
+
+    def test_unpaged_response_is_split_locally(self):
+        self.station._request_handler.get.side_effect = lambda url: CATALOG
+
+        self.assertEqual([song.request_id for song in self.catalog.page(3)], ["r7"])
+        self.assertEqual([song.request_id for song in self.catalog.page(1)], ["r1", "r2", "r3"])
+        self.assertEqual(self.catalog.page(4), [])
+        self.assertEqual(self.station._request_handler.get.call_count, 2)
+
+        self.assertEqual(
+            [song.request_id for song in self.catalog.songs(search="Song 2")], ["r2"]
+        )
+
+    def test_invalid_params(self):
+        with self.assertRaises(ClientException):
+            RequestCatalog(self.station, per_page=0)
+
+        with self.assertRaises(ClientException):
+            self.catalog.page(0)
+
+if __name__ == '__main__':
+    unittest.main()
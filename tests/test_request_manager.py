@@ -0,0 +1,165 @@
+import unittest
+from unittest import TestCase, mock
+
+import requests
+
+from AzuracastPy.exceptions import AzuracastAPIException, ClientException
+from AzuracastPy.queue import RequestManager
+
+from .util import fake_data_generator
+
+class TestRequestManager(TestCase):
+    def setUp(self) -> None:
+        self.station = fake_data_generator.return_fake_station_instance()
+        self.station._request_handler = mock.MagicMock()
+
+        catalog = [
+            fake_data_generator.return_fake_requestable_song_json(
+                request_id=f"r{i}", song={"id": f"s{i}"}
+            )
+            for i in range(1, 6)
+        ]
+        queue = [fake_data_generator.return_fake_queue_item_json(1, song={"id": "s5"})]
+
+        def get(url):
+            return catalog if url.endswith("/requests") else queue
+
+        self.station._request_handler.get.side_effect = get
+        self.station._request_handler.post.return_value = {
+            "success": True, "message": "Your request has been submitted."
+        }
+
+        self.clock = mock.patch("AzuracastPy.queue.request_manager.time.monotonic", return_value=0)
+        self.monotonic = self.clock.start()
+        self.sleep = mock.patch("AzuracastPy.queue.request_manager.time.sleep").start()
+
+        self.manager = RequestManager(self.station, min_interval=2)
+
+    def tearDown(self) -> None:
+        mock.patch.stopall()
+
+    def _statuses(self, *request_ids):
+        return [self.manager.request(request_id).status for request_id in request_ids]
+
+    def test_requests_are_checked_locally(self):
+        self.assertEqual(
+            self._statuses("r1", "r1", "missing", "r5", "r2"),
+            ["pending", "duplicate", "not_requestable", "already_queued", "pending"]
+        )
+        self.assertEqual(self.manager.pending, ["r1", "r2"])
+        self.station._request_handler.post.assert_not_called()
+
+        # The catalog and the queue are fetched once for every request.
+        self.assertEqual(self.station._request_handler.get.call_count, 2)
+
+    def test_flush_paces_requests(self):
+        self._statuses("r1", "r2", "r3")
+
+        def sleep(seconds):
+            self.monotonic.return_value += seconds
+
+        self.sleep.side_effect = sleep
+
+        outcomes = self.manager.flush()
+
+        self.assertEqual([outcome.status for outcome in outcomes], ["requested"] * 3)
+        self.assertEqual(outcomes[0].message, "Your request has been submitted.")
+        self.assertEqual([call.args[0] for call in self.sleep.call_args_list], [2, 2])
+        self.assertEqual(self.manager.pending, [])
+
+        # A song can't be requested again within the request threshold.
+        self.assertEqual(self._statuses("r1"), ["recently_requested"])
+
+        self.monotonic.return_value += 15 * 60
+        self.assertEqual(self._statuses("r1"), ["pending"])
+
+    def test_flush_without_blocking(self):
+        self._statuses("r1", "r2")
+
+        self.assertEqual(len(self.manager.flush(block=False)), 1)
+        self.assertEqual(self.manager.flush(block=False), [])
+
+        self.monotonic.return_value = 2
+        self.assertEqual(len(self.manager.flush(block=False)), 1)
+        self.sleep.assert_not_called()
+
+    def test_flush_stops_when_another_thread_sent_the_last_request(self):
+        self._statuses("r1", "r2")
+        self.manager.flush(block=False)
+
+        # Another thread sends the last request while this one waits.
+        def sleep(seconds):
+            self.monotonic.return_value += seconds
+            self.manager.flush(block=False)
+
+        self.sleep.side_effect = sleep
+        self.monotonic.return_value = 1
+
+        self.assertEqual(self.manager.flush(), [])
+        self.assertEqual(self.station._request_handler.post.call_count, 2)
+
+    def test_expired_request_times_are_pruned(self):
+        self._statuses("r1")
+        self.manager.flush()
+
+        self.monotonic.return_value = 15 * 60
+        self._statuses("r2")
+        self.manager.flush()
+
+        self.assertEqual(list(self.manager._requested_at), ["s2"])
+
+    def test_rejected_requests(self):
+        self._statuses("r1", "r2")
+
+        self.station._request_handler.post.side_effect = [
+            AzuracastAPIException("You have submitted a request too recently!"),
+            {"success": False, "message": "This song was already requested."}
+        ]
+
+        outcomes = self.manager.flush()
+
+        self.assertEqual(
+            [(outcome.status, outcome.message) for outcome in outcomes],
+            [
+                ("rejected", "You have submitted a request too recently!"),
+                ("rejected", "This song was already requested.")
+            ]
+        )
+
+    def test_network_errors_are_rejected(self):
+        self._statuses("r1", "r2")
+
+        self.station._request_handler.post.side_effect = [
+            requests.ConnectionError("Connection reset."),
+            {"success": True, "message": "Your request has been submitted."}
+        ]
+
+        outcomes = self.manager.flush()
+
+        self.assertEqual(
+            [(outcome.request_id, outcome.status) for outcome in outcomes],
+            [("r1", "rejected"), ("r2", "requested")]
+        )
+        self.assertEqual(outcomes[0].message, "Connection reset.")
+
+    def test_lock_is_not_held_while_fetching(self):
+        get = self.station._request_handler.get.side_effect
+
+        def unlocked_get(url):
+            self.assertFalse(self.manager._lock.locked())
+            return get(url)
+
+        self.station._request_handler.get.side_effect = unlocked_get
+
+        self.assertEqual(self._statuses("r1"), ["pending"])
+        self.assertEqual(self.station._request_handler.get.call_count, 2)
+
+    def test_invalid_params(self):
+        with self.assertRaises(ClientException):
+            self.manager.request(1)
+
+        with self.assertRaises(ClientException):
+            RequestManager(self.station, min_interval=-1)
+
+if __name__ == '__main__':
+    unittest.main()
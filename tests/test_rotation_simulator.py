@@ -0,0 +1,137 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest import TestCase, mock
+
+from AzuracastPy.scheduling import RotationSimulator
+
+from .util import fake_data_generator
+
+def _fake_file(id, artist, playlist_id, length=180):
+    return fake_data_generator.return_fake_file_instance(
+        id, artist=artist, text=f"{artist} - Track {id}", length=length,
+        playlists=[{"id": playlist_id, "name": str(playlist_id), "weight": 3}]
+    )
+
+# 2024-01-01 is a Monday.
+MONDAY = datetime(2024, 1, 1)
+
+class TestRotationSimulator(TestCase):
+    def setUp(self) -> None:
+        self.playlists = [
+            fake_data_generator.return_fake_playlist_instance(id=1, name="Heavy", weight=9),
+            fake_data_generator.return_fake_playlist_instance(id=2, name="Light", weight=1),
+            fake_data_generator.return_fake_playlist_instance(
+                id=3, name="Jingles", type="once_per_x_songs", order="sequential"
+            ),
+            fake_data_generator.return_fake_playlist_instance(
+                id=4, name="Night",
+                schedule_items=[fake_data_generator.return_fake_schedule_item_json(0, 600)]
+            )
+        ]
+        self.playlists[2].play_per_songs = 4
+
+        self.files = [_fake_file(i, f"Artist {i % 10}", 1) for i in range(1, 31)]
+        self.files += [_fake_file(i, f"Artist {i}", 2) for i in range(31, 41)]
+        self.files += [_fake_file(41, "Station", 3, length=10)]
+        self.files += [_fake_file(i, f"Night {i}", 4) for i in range(42, 52)]
+
+        self.simulator = RotationSimulator(self.playlists, self.files)
+
+    def test_run_is_deterministic_with_a_seed(self):
+        first = self.simulator.run(MONDAY, timedelta(days=1), seed=3)
+        second = self.simulator.run(MONDAY, timedelta(days=1), seed=3)
+
+        self.assertEqual(
+            [(play.start, play.file.id) for play in first.plays],
+            [(play.start, play.file.id) for play in second.plays]
+        )
+
+    def test_scheduled_and_interval_playlists(self):
+        report = self.simulator.run(MONDAY, timedelta(days=7), seed=1)
+
+        self.assertEqual(report.dead_air, timedelta())
+        self.assertEqual(report.plays[-1].end >= MONDAY + timedelta(days=7), True)
+
+        for play in report.plays:
+            hour = play.start.hour
+            if play.playlist.name in ("Heavy", "Light"):
+                self.assertGreaterEqual(hour, 6)
+            elif play.playlist.name == "Night":
+                self.assertLess(hour, 6)
+
+        # Every fifth track is a jingle.
+        names = [play.playlist.name for play in report.plays]
+        self.assertEqual(names[4], "Jingles")
+        self.assertEqual(names[9], "Jingles")
+        self.assertAlmostEqual(report.playlist_share["Jingles"], 0.2, delta=0.01)
+
+        self.assertGreater(report.playlist_share["Heavy"], report.playlist_share["Light"] * 4)
+        self.assertEqual(sum(report.track_plays.values()), len(report.plays))
+        self.assertEqual(report.track_plays[41], names.count("Jingles"))
+
+    def test_artist_separation_violations(self):
+        playlist = fake_data_generator.return_fake_playlist_instance(id=1, name="Tiny")
+        files = [_fake_file(i, "Same Artist", 1) for i in range(1, 4)]
+
+        report = RotationSimulator([playlist], files, artist_separation=3).run(
+            MONDAY, timedelta(hours=1), seed=0
+        )
+
+        self.assertEqual(len(report.plays), 20)
+        self.assertEqual(report.artist_violations, [])
+
+        report = RotationSimulator([playlist], files, artist_separation=60).run(
+            MONDAY, timedelta(hours=1), seed=0
+        )
+
+        self.assertEqual(len(report.artist_violations), 19)
+        self.assertEqual(report.artist_violations[0].start, MONDAY + timedelta(minutes=3))
+        self.assertEqual(report.artist_violations[0].previous_start, MONDAY)
+
+    def test_dead_air_when_nothing_can_play(self):
+        playlist = fake_data_generator.return_fake_playlist_instance(
+            id=1, name="Evening",
+            schedule_items=[fake_data_generator.return_fake_schedule_item_json(1800, 2000)]
+        )
+        files = [_fake_file(1, "Artist", 1, length=600)]
+
+        report = RotationSimulator([playlist], files).run(MONDAY, timedelta(days=1), seed=0)
+
+        self.assertEqual(len(report.plays), 12)
+        self.assertEqual(report.plays[0].start, MONDAY + timedelta(hours=18))
+        self.assertEqual(report.dead_air, timedelta(hours=22))
+
+    def test_interval_playlists_play_during_dead_air(self):
+        playlists = [
+            fake_data_generator.return_fake_playlist_instance(
+                id=1, name="Evening",
+                schedule_items=[fake_data_generator.return_fake_schedule_item_json(1800, 2000)]
+            ),
+            fake_data_generator.return_fake_playlist_instance(
+                id=2, name="Jingles", type="once_per_hour"
+            )
+        ]
+        playlists[1].play_per_hour_minute = 0
+        files = [_fake_file(1, "Artist", 1, length=600), _fake_file(2, "Station", 2, length=60)]
+
+        report = RotationSimulator(playlists, files).run(MONDAY, timedelta(days=1), seed=0)
+
+        jingles = [play.start for play in report.plays if play.playlist.name == "Jingles"]
+        self.assertEqual(len(jingles), 23)
+        self.assertEqual(jingles[0], MONDAY + timedelta(hours=1))
+        self.assertEqual(
+            report.dead_air + sum((play.end - play.start for play in report.plays), timedelta()),
+            timedelta(days=1)
+        )
+
+    def test_from_station(self):
+        station = fake_data_generator.return_fake_station_instance()
+        station.playlists = mock.MagicMock(return_value=self.playlists)
+        station.files = mock.MagicMock(return_value=self.files)
+
+        report = RotationSimulator.from_station(station).run(MONDAY, timedelta(hours=1), seed=0)
+
+        self.assertGreater(len(report.plays), 0)
+
+if __name__ == '__main__':
+    unittest.main()
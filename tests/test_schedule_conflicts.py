@@ -0,0 +1,226 @@
+import random
+import unittest
+from unittest import TestCase, mock
+
+from AzuracastPy import models
+from AzuracastPy.exceptions import ClientException
+from AzuracastPy.scheduling import IntervalIndex, ScheduleConflictDetector
+
+from .util import fake_data_generator
+
+class TestIntervalIndex(TestCase):
+    def test_matches_a_full_scan(self):
+        generator = random.Random(4)
+
+        for _ in range(50):
+            intervals = []
+            for value in range(generator.randint(0, 60)):
+                start = generator.randint(0, 200)
+                intervals.append((start, start + generator.randint(0, 40), value))
+
+            index = IntervalIndex(intervals)
+
+            for _ in range(20):
+                start = generator.randint(-10, 250)
+                end = start + generator.randint(1, 40)
+
+                expected = sorted(
+                    i for i in intervals if i[0] < i[1] and i[0] < end and i[1] > start
+                )
+                self.assertEqual(sorted(index.overlapping(start, end)), expected)
+
+    def test_added_and_removed_intervals_match_a_full_scan(self):
+        generator = random.Random(7)
+        intervals = []
+        index = IntervalIndex([])
+
+        for value in range(300):
+            start = generator.randint(0, 200)
+            interval = (start, start + generator.randint(0, 40), value)
+            intervals.append(interval)
+            index.add([interval])
+
+            if generator.random() < 0.3:
+                removed = intervals.pop(generator.randrange(len(intervals)))
+                index.remove([removed])
+
+            start = generator.randint(-10, 250)
+            end = start + generator.randint(1, 40)
+
+            expected = sorted(
+                i for i in intervals if i[0] < i[1] and i[0] < end and i[1] > start
+            )
+            self.assertEqual(sorted(index.overlapping(start, end)), expected)
+
+        self.assertEqual(sorted(index), sorted(i for i in intervals if i[0] < i[1]))
+
+class TestScheduleConflictDetector(TestCase):
+    def test_overlapping_playlists_are_reported_once(self):
+        detector = ScheduleConflictDetector([
+            fake_data_generator.return_fake_playlist_instance(id=1, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(900, 1200, days=[1, 2])
+            ]),
+            fake_data_generator.return_fake_playlist_instance(id=2, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(1100, 1300, days=[2, 3])
+            ])
+        ])
+
+        conflicts = detector.all_conflicts()
+
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(
+            (conflicts[0].day, conflicts[0].start_time, conflicts[0].end_time), (2, 1100, 1200)
+        )
+        self.assertEqual(
+            {conflicts[0].owner.id, conflicts[0].other_owner.id}, {1, 2}
+        )
+
+    def test_overnight_item_overlaps_the_next_day(self):
+        detector = ScheduleConflictDetector([
+            fake_data_generator.return_fake_playlist_instance(id=1, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(2300, 100, days=[7])
+            ]),
+            fake_data_generator.return_fake_streamer_instance(id=2, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(30, 200, days=[1])
+            ])
+        ])
+
+        conflicts = detector.all_conflicts()
+
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(
+            (conflicts[0].day, conflicts[0].start_time, conflicts[0].end_time), (1, 30, 100)
+        )
+
+    def test_items_on_different_dates_do_not_conflict(self):
+        detector = ScheduleConflictDetector([
+            fake_data_generator.return_fake_playlist_instance(id=1, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(
+                    900, 1200, start_date="2024-01-01", end_date="2024-01-31"
+                )
+            ]),
+            fake_data_generator.return_fake_playlist_instance(id=2, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(
+                    900, 1200, start_date="2024-02-01", end_date="2024-02-28"
+                )
+            ]),
+            # 2024-01-29 is the only Monday in this range, and only the first item has that date.
+            fake_data_generator.return_fake_playlist_instance(id=3, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(
+                    1000, 1100, days=[1], start_date="2024-01-29", end_date="2024-02-04"
+                )
+            ])
+        ])
+
+        conflicts = detector.all_conflicts()
+
+        self.assertEqual(
+            [sorted((c.owner.id, c.other_owner.id)) for c in conflicts], [[1, 3]]
+        )
+
+    def test_overnight_dates_are_compared_by_the_day_each_item_starts(self):
+        # The first item starts on Sunday 2024-01-07 and runs into Monday 2024-01-08.
+        detector = ScheduleConflictDetector([
+            fake_data_generator.return_fake_playlist_instance(id=1, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(
+                    2300, 100, days=[7], start_date="2024-01-07", end_date="2024-01-07"
+                )
+            ]),
+            fake_data_generator.return_fake_playlist_instance(id=2, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(
+                    0, 200, days=[1], start_date="2024-01-08", end_date="2024-01-08"
+                )
+            ]),
+            fake_data_generator.return_fake_playlist_instance(id=3, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(
+                    0, 200, days=[1], start_date="2024-01-15", end_date="2024-01-15"
+                )
+            ])
+        ])
+
+        conflicts = detector.all_conflicts()
+
+        self.assertEqual(
+            [sorted((c.owner.id, c.other_owner.id)) for c in conflicts], [[1, 2]]
+        )
+
+    def test_check_ignores_the_owners_own_items(self):
+        playlist = fake_data_generator.return_fake_playlist_instance(id=1, schedule_items=[
+            fake_data_generator.return_fake_schedule_item_json(900, 1200)
+        ])
+        detector = ScheduleConflictDetector([playlist])
+
+        item = {"start_time": 1000, "end_time": 1100, "start_date": None, "end_date": None,
+                "days": [], "loop_once": False}
+
+        detector.check([item], owner=playlist)
+
+        with self.assertRaises(ClientException):
+            detector.check([item])
+
+        detector.remove(playlist)
+        self.assertEqual(detector.conflicts([item]), [])
+
+    def test_added_owner_updates_the_index_in_place(self):
+        playlist = fake_data_generator.return_fake_playlist_instance(id=1, schedule_items=[
+            fake_data_generator.return_fake_schedule_item_json(900, 1200, days=[1])
+        ])
+        detector = ScheduleConflictDetector([playlist])
+        item = fake_data_generator.return_fake_schedule_item_json(1300, 1400, days=[1])
+
+        self.assertEqual(detector.conflicts([item]), [])
+        index = detector._index
+
+        playlist.schedule_items = [
+            models.playlist.ScheduleItem(**fake_data_generator.return_fake_schedule_item_json(
+                1330, 1500, days=[1]
+            ))
+        ]
+        detector.add(playlist)
+
+        self.assertIs(detector._index, index)
+        self.assertEqual(len(detector.conflicts([item])), 1)
+
+        detector.remove(playlist)
+        self.assertEqual(detector.conflicts([item]), [])
+
+    def test_create_rejects_conflicts_before_sending(self):
+        station = fake_data_generator.return_fake_station_instance()
+        station._request_handler = mock.MagicMock()
+
+        detector = ScheduleConflictDetector([
+            fake_data_generator.return_fake_playlist_instance(id=1, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(900, 1200)
+            ])
+        ])
+
+        with self.assertRaises(ClientException):
+            station.playlist.create(
+                name="Overlapping",
+                schedule=station.playlist.generate_schedule_items(
+                    ("10:00", "11:00", None, None, ["monday"], False)
+                ),
+                conflict_detector=detector
+            )
+
+        station._request_handler.post.assert_not_called()
+
+    def test_create_adds_the_new_playlist_to_the_detector(self):
+        station = fake_data_generator.return_fake_station_instance()
+        station._request_handler = mock.MagicMock()
+        station._request_handler.post.return_value = {"id": 5}
+        station._request_handler.get.return_value = dict(
+            fake_data_generator.return_fake_playlist_json(),
+            id=5,
+            schedule_items=[fake_data_generator.return_fake_schedule_item_json(1300, 1400)]
+        )
+
+        detector = ScheduleConflictDetector()
+        station.playlist.create(name="New", conflict_detector=detector)
+
+        self.assertEqual(len(detector), 1)
+        item = fake_data_generator.return_fake_schedule_item_json(1330, 1500)
+        self.assertEqual(len(detector.conflicts([item])), 7)
+
+if __name__ == '__main__':
+    unittest.main()
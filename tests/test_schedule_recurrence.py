@@ -0,0 +1,92 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from AzuracastPy.scheduling import expand_schedule, expand_schedule_item
+
+from .util import fake_data_generator
+
+# 2024-01-01 is a Monday.
+MONDAY = datetime(2024, 1, 1)
+
+class TestExpandScheduleItem(TestCase):
+    def test_weekly_days(self):
+        occurrences = list(expand_schedule_item(
+            fake_data_generator.return_fake_schedule_item_json(900, 1030, days=[1, 3]),
+            MONDAY, MONDAY + timedelta(days=14)
+        ))
+
+        self.assertEqual(
+            [occurrence.start for occurrence in occurrences],
+            [datetime(2024, 1, day, 9) for day in (1, 3, 8, 10)]
+        )
+        self.assertEqual(occurrences[0].end, datetime(2024, 1, 1, 10, 30))
+
+    def test_overnight_item_from_before_the_window_is_included(self):
+        occurrences = list(expand_schedule_item(
+            fake_data_generator.return_fake_schedule_item_json(2200, 200),
+            MONDAY + timedelta(hours=1), MONDAY + timedelta(days=1)
+        ))
+
+        self.assertEqual(
+            [(o.start, o.end) for o in occurrences],
+            [
+                (datetime(2023, 12, 31, 22), datetime(2024, 1, 1, 2)),
+                (datetime(2024, 1, 1, 22), datetime(2024, 1, 2, 2))
+            ]
+        )
+
+    def test_date_bounds(self):
+        occurrences = list(expand_schedule_item(
+            fake_data_generator.return_fake_schedule_item_json(
+                900, 1000, start_date="2024-01-03", end_date="2024-01-04"
+            ),
+            MONDAY, MONDAY + timedelta(days=30)
+        ))
+
+        self.assertEqual([o.start.day for o in occurrences], [3, 4])
+
+    def test_timezone(self):
+        zone = timezone(timedelta(hours=2))
+
+        occurrences = expand_schedule_item(
+            fake_data_generator.return_fake_schedule_item_json(900, 1000),
+            datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 2, tzinfo=timezone.utc),
+            timezone=zone
+        )
+        first = next(occurrences)
+
+        self.assertEqual(first.start, datetime(2024, 1, 1, 9, tzinfo=zone))
+        self.assertEqual(first.start.tzinfo, zone)
+
+    def test_is_lazy(self):
+        occurrences = expand_schedule_item(
+            fake_data_generator.return_fake_schedule_item_json(0, 100), MONDAY, datetime(9999, 1, 1)
+        )
+
+        self.assertEqual(next(occurrences).start, MONDAY)
+
+class TestExpandSchedule(TestCase):
+    def test_merges_owners_in_start_order(self):
+        morning = fake_data_generator.return_fake_playlist_instance(id=1, schedule_items=[
+            fake_data_generator.return_fake_schedule_item_json(900, 1000)
+        ])
+        evening = fake_data_generator.return_fake_playlist_instance(id=2, schedule_items=[
+            fake_data_generator.return_fake_schedule_item_json(1800, 1900),
+            fake_data_generator.return_fake_schedule_item_json(600, 700)
+        ])
+
+        occurrences = list(expand_schedule(
+            [morning, evening], MONDAY, MONDAY + timedelta(days=2)
+        ))
+
+        self.assertEqual(
+            [(o.start.day, o.start.hour, o.owner.id) for o in occurrences],
+            [(1, 6, 2), (1, 9, 1), (1, 18, 2), (2, 6, 2), (2, 9, 1), (2, 18, 2)]
+        )
+        self.assertEqual(
+            [o.start for o in occurrences], sorted(o.start for o in occurrences)
+        )
+
+if __name__ == '__main__':
+    unittest.main()
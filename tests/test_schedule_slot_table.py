@@ -0,0 +1,104 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from AzuracastPy import models
+from AzuracastPy.scheduling import ScheduleSlotTable
+
+from .util import fake_data_generator
+
+def _ids(scheduled):
+    return [(type(owner).__name__, owner.id, share) for owner, share in scheduled]
+
+# 2024-01-01 is a Monday.
+MONDAY = datetime(2024, 1, 1)
+
+class TestScheduleSlotTable(TestCase):
+    def setUp(self) -> None:
+        self.rotation = fake_data_generator.return_fake_playlist_instance(id=1, weight=1)
+        self.morning = fake_data_generator.return_fake_playlist_instance(
+            id=2, weight=2, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(600, 1000, days=[1, 2, 3, 4, 5])
+            ]
+        )
+        self.brunch = fake_data_generator.return_fake_playlist_instance(
+            id=3, weight=6, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(900, 1100, days=[1])
+            ]
+        )
+        self.jingles = fake_data_generator.return_fake_playlist_instance(
+            id=4, type="once_per_x_songs", schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(0, 0)
+            ]
+        )
+        self.dj = fake_data_generator.return_fake_streamer_instance(id=5, schedule_items=[
+            fake_data_generator.return_fake_schedule_item_json(2200, 200, days=[7])
+        ])
+
+        self.table = ScheduleSlotTable(
+            [self.rotation, self.morning, self.brunch, self.jingles, self.dj]
+        )
+
+    def test_general_rotation_when_nothing_is_scheduled(self):
+        self.assertEqual(_ids(self.table.at(MONDAY + timedelta(hours=12))), [("Playlist", 1, 1.0)])
+
+    def test_scheduled_playlists_share_by_weight(self):
+        self.assertEqual(
+            _ids(self.table.at(MONDAY + timedelta(hours=9, minutes=30))),
+            [("Playlist", 3, 0.75), ("Playlist", 2, 0.25)]
+        )
+
+    def test_overnight_streamer_slot(self):
+        self.assertEqual(
+            _ids(self.table.at(MONDAY + timedelta(hours=1))),
+            [("Streamer", 5, None), ("Playlist", 1, 1.0)]
+        )
+        self.assertEqual(
+            _ids(self.table.at(MONDAY + timedelta(days=6, hours=23))),
+            [("Streamer", 5, None), ("Playlist", 1, 1.0)]
+        )
+
+    def test_next_change(self):
+        self.assertEqual(
+            self.table.next_change(MONDAY + timedelta(hours=7)),
+            MONDAY + timedelta(hours=9)
+        )
+        self.assertEqual(
+            self.table.next_change(MONDAY + timedelta(days=5, hours=12)),
+            MONDAY + timedelta(days=6, hours=22)
+        )
+
+    def test_update_replaces_an_owners_slots(self):
+        self.brunch.schedule_items = [
+            models.playlist.ScheduleItem(
+                **fake_data_generator.return_fake_schedule_item_json(1200, 1300, days=[1])
+            )
+        ]
+        self.table.update(self.brunch)
+
+        self.assertEqual(
+            _ids(self.table.at(MONDAY + timedelta(hours=9, minutes=30))), [("Playlist", 2, 1.0)]
+        )
+        self.assertEqual(
+            _ids(self.table.at(MONDAY + timedelta(hours=12, minutes=30))), [("Playlist", 3, 1.0)]
+        )
+
+        self.table.remove(self.dj)
+        self.assertEqual(_ids(self.table.at(MONDAY + timedelta(hours=1))), [("Playlist", 1, 1.0)])
+
+    def test_date_bounds(self):
+        table = ScheduleSlotTable([
+            fake_data_generator.return_fake_playlist_instance(id=1, schedule_items=[
+                fake_data_generator.return_fake_schedule_item_json(
+                    900, 1000, start_date="2024-01-02", end_date="2024-01-02"
+                )
+            ])
+        ])
+
+        self.assertEqual(table.at(MONDAY + timedelta(hours=9)), [])
+        self.assertEqual(_ids(table.at(MONDAY + timedelta(days=1, hours=9))), [("Playlist", 1, 1.0)])
+        self.assertEqual(table.next_change(MONDAY), MONDAY + timedelta(days=1, hours=9))
+        self.assertIsNone(table.next_change(MONDAY + timedelta(days=2)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+from unittest import TestCase
+
+from AzuracastPy import models
+from AzuracastPy.exceptions import ClientException
+from AzuracastPy.library import SearchIndex
+
+from .util import fake_data_generator
+
+class TestSearchIndex(TestCase):
+    def setUp(self) -> None:
+        self.index = SearchIndex()
+        self.index.add_all([
+            fake_data_generator.return_fake_requestable_song_instance(
+                request_id="1", song={"artist": "Cochise", "title": "MEGAMAN"}
+            ),
+            fake_data_generator.return_fake_requestable_song_instance(
+                request_id="2", song={"artist": "Cochise", "title": "GRIND"}
+            ),
+            fake_data_generator.return_fake_requestable_song_instance(
+                request_id="3",
+                song={"artist": "Beyoncé", "title": "Halo", "album": "I Am... Sasha Fierce"}
+            ),
+            fake_data_generator.return_fake_requestable_song_instance(
+                request_id="4",
+                song={
+                    "artist": "Rick Astley", "title": "Never Gonna Give You Up",
+                    "isrc": "GBARL9300135"
+                }
+            )
+        ])
+
+    def _search_ids(self, query):
+        return [result.request_id for result in self.index.search(query)]
+
+    def test_exact_match(self):
+        self.assertEqual(self._search_ids("megaman"), ["1"])
+        self.assertEqual(set(self._search_ids("cochise")), {"1", "2"})
+
+    def test_all_query_words_must_match(self):
+        self.assertEqual(self._search_ids("cochise grind"), ["2"])
+        self.assertEqual(self._search_ids("cochise halo"), [])
+
+    def test_prefix_match(self):
+        self.assertEqual(self._search_ids("never gon"), ["4"])
+
+    def test_fuzzy_match(self):
+        self.assertEqual(self._search_ids("megamn"), ["1"])
+        self.assertEqual(self._search_ids("rick astly"), ["4"])
+
+    def test_accents_and_other_fields(self):
+        self.assertEqual(self._search_ids("beyonce"), ["3"])
+        self.assertEqual(self._search_ids("sasha fierce"), ["3"])
+        self.assertEqual(self._search_ids("GBARL9300135"), ["4"])
+
+    def test_exact_matches_rank_first(self):
+        self.index.add(fake_data_generator.return_fake_requestable_song_instance(
+            request_id="5", song={"artist": "Somebody", "title": "Grinder"}
+        ))
+
+        self.assertEqual(self._search_ids("grind")[0], "2")
+
+    def test_incremental_add_and_remove(self):
+        song = fake_data_generator.return_fake_requestable_song_instance(
+            request_id="6", song={"artist": "Daft Punk", "title": "One More Time"}
+        )
+
+        self.index.add(song)
+        self.assertEqual(self._search_ids("daft punk"), ["6"])
+        self.assertIn(song, self.index)
+
+        self.index.remove(song)
+        self.assertEqual(self._search_ids("daft punk"), [])
+        self.assertEqual(len(self.index), 4)
+
+    def test_readding_an_item_replaces_it(self):
+        self.index.add(fake_data_generator.return_fake_requestable_song_instance(
+            request_id="1", song={"artist": "Cochise", "title": "Renamed"}
+        ))
+
+        self.assertEqual(self._search_ids("megaman"), [])
+        self.assertEqual(self._search_ids("renamed"), ["1"])
+        self.assertEqual(len(self.index), 4)
+
+    def test_station_files_are_searchable_by_path(self):
+        file = models.StationFile(**fake_data_generator.return_fake_file_json(), _station=None)
+
+        self.index.add(file)
+
+        self.assertEqual(self.index.search("y2mate"), [file])
+
+    def test_invalid_item_raises_exception(self):
+        with self.assertRaises(ClientException):
+            self.index.add("not a song")
+
+if __name__ == '__main__':
+    unittest.main()
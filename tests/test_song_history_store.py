@@ -0,0 +1,89 @@
+import unittest
+from unittest import TestCase, mock
+
+from AzuracastPy import models
+from AzuracastPy.analytics import SongHistoryStore
+from AzuracastPy.exceptions import ClientException
+
+from .util import fake_data_generator
+
+SONGS = {
+    artist: {"id": f"{artist}_id", "artist": artist, "text": f"{artist} - Song"}
+    for artist in ("A", "B", "C", "D")
+}
+
+class TestSongHistoryStore(TestCase):
+    def setUp(self) -> None:
+        self.store = SongHistoryStore()
+        self.store.add([
+            fake_data_generator.return_fake_song_history_json(
+                sh_id=1, song=SONGS["A"], playlist="Day", listeners_start=5, listeners_end=8
+            ),
+            fake_data_generator.return_fake_song_history_json(
+                sh_id=2, song=SONGS["B"], playlist="Day", is_request=True,
+                listeners_start=8, listeners_end=6
+            ),
+            fake_data_generator.return_fake_song_history_json(
+                sh_id=3, song=SONGS["A"], playlist="Night", is_request=True,
+                listeners_start=6, listeners_end=10
+            )
+        ], station_id=1)
+
+    def test_add_skips_entries_already_added(self):
+        added = self.store.add([
+            models.SongHistory(**fake_data_generator.return_fake_song_history_json(
+                sh_id=3, song=SONGS["A"], playlist="Night"
+            )),
+            models.SongHistory(**fake_data_generator.return_fake_song_history_json(
+                sh_id=4, song=SONGS["C"], playlist="Night"
+            ))
+        ], station_id=2)
+
+        self.assertEqual(added, 1)
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(self.store.column("sh_id"), [1, 2, 3, 4])
+        self.assertEqual(self.store.column("station_id"), [1, 1, 1, 2])
+
+    def test_add_station(self):
+        station = fake_data_generator.return_fake_station_instance()
+        station._request_handler = mock.MagicMock()
+        station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_song_history_json(
+                sh_id=10, song=SONGS["D"], playlist="Day"
+            )
+        ]
+
+        self.assertEqual(self.store.add_station(station), 1)
+        self.assertEqual(self.store.column("station_id")[-1], station.id)
+
+    def test_plays_by(self):
+        self.assertEqual(self.store.plays_by("artist"), {"A": 2, "B": 1})
+        self.assertEqual(self.store.plays_by("playlist"), {"Day": 2, "Night": 1})
+        self.assertEqual(self.store.plays_by("is_request"), {True: 2, False: 1})
+
+    def test_sum_by(self):
+        self.assertEqual(self.store.column("listener_gain"), [3, -2, 4])
+        self.assertEqual(self.store.sum_by("song_id"), {"A_id": 7, "B_id": -2})
+        self.assertEqual(self.store.sum_by("artist", "duration"), {"A": 350, "B": 175})
+
+    def test_request_ratio(self):
+        self.assertEqual(self.store.request_ratio(), 2 / 3)
+        self.assertEqual(self.store.request_ratio("artist"), {"A": 0.5, "B": 1.0})
+        self.assertEqual(SongHistoryStore().request_ratio(), 0.0)
+
+    def test_top(self):
+        self.assertEqual(self.store.top("artist", 1), [("A", 2)])
+        self.assertEqual(
+            self.store.top("text", 2, value_field="listener_gain"),
+            [("A - Song", 7), ("B - Song", -2)]
+        )
+
+    def test_invalid_fields(self):
+        with self.assertRaises(ClientException):
+            self.store.plays_by("genre")
+
+        with self.assertRaises(ClientException):
+            self.store.sum_by("artist", "playlist")
+
+if __name__ == '__main__':
+    unittest.main()
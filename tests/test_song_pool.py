@@ -0,0 +1,80 @@
+import unittest
+from unittest import TestCase
+
+from AzuracastPy import models
+from AzuracastPy.models.song import SONG_POOL, SongPool
+
+from .util import fake_data_generator
+
+class TestSongPool(TestCase):
+    def setUp(self) -> None:
+        self.pool = SongPool(maxsize=2)
+
+    def test_same_track_is_shared(self):
+        first = self.pool.get(fake_data_generator.return_fake_song_json(id="a"))
+        second = self.pool.get(fake_data_generator.return_fake_song_json(id="a"))
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_changed_data_replaces_song(self):
+        first = self.pool.get(fake_data_generator.return_fake_song_json(id="a"))
+        second = self.pool.get(fake_data_generator.return_fake_song_json(id="a", title="Edited"))
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.title, "Edited")
+        edited = fake_data_generator.return_fake_song_json(id="a", title="Edited")
+        self.assertIs(self.pool.get(edited), second)
+
+    def test_mutated_caller_data_replaces_song(self):
+        song = fake_data_generator.return_fake_song_json(id="a")
+        first = self.pool.get(song)
+
+        song['title'] = "Edited"
+        second = self.pool.get(song)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.title, "Edited")
+
+    def test_least_recently_used_song_is_evicted(self):
+        first = self.pool.get(fake_data_generator.return_fake_song_json(id="a"))
+        self.pool.get(fake_data_generator.return_fake_song_json(id="b"))
+        self.pool.get(fake_data_generator.return_fake_song_json(id="a"))
+        self.pool.get(fake_data_generator.return_fake_song_json(id="c"))
+
+        self.assertEqual(len(self.pool), 2)
+        self.assertIs(self.pool.get(fake_data_generator.return_fake_song_json(id="a")), first)
+        self.assertEqual(list(self.pool._songs), ["c", "a"])
+
+    def test_zero_maxsize_turns_pooling_off(self):
+        self.pool.maxsize = 0
+
+        song = fake_data_generator.return_fake_song_json(id="a")
+        self.assertIsNot(self.pool.get(song), self.pool.get(song))
+        self.assertEqual(len(self.pool), 0)
+
+    def test_songs_cannot_be_modified(self):
+        song = self.pool.get(fake_data_generator.return_fake_song_json(id="a"))
+
+        with self.assertRaises(AttributeError):
+            song.title = "Edited"
+
+        with self.assertRaises(AttributeError):
+            del song.title
+
+    def test_models_share_songs(self):
+        history_json = fake_data_generator.return_fake_song_history_json()
+
+        first = models.SongHistory(**history_json)
+        second = models.SongHistory(**dict(history_json, sh_id=history_json['sh_id'] + 1))
+
+        self.assertIs(first.song, second.song)
+        self.assertIn(history_json['song']['id'], SONG_POOL._songs)
+
+    def test_playing_next_song_is_a_song(self):
+        now_playing = models.NowPlaying(**fake_data_generator.return_fake_now_playing_json())
+
+        self.assertIsInstance(now_playing.playing_next.song, models.Song)
+
+if __name__ == '__main__':
+    unittest.main()
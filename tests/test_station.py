@@ -8,8 +8,10 @@ from AzuracastPy.enums import (
     Languages,
     PodcastCategories,
     WebhookConfigTypes,
-    WebhookTriggers
+    WebhookTriggers,
+    StationResources
 )
+from AzuracastPy.exceptions import ClientException
 
 import unittest
 from unittest import TestCase, mock
@@ -630,5 +632,105 @@ class TestStation(TestCase):
         self.assertIsInstance(result, dict)
         self.assertEqual(result['message'], "Your request has been submitted and will be played soon.")
 
+    def test_refresh_all_only_reports_changed_objects(self):
+        playlist_json = fake_data_generator.return_fake_playlist_json()
+
+        unchanged = models.Playlist(**playlist_json, _station=self.station)
+        changed = models.Playlist(**{**playlist_json, "id": 2}, _station=self.station)
+        removed = models.Playlist(**{**playlist_json, "id": 3}, _station=self.station)
+
+        self.station._request_handler.get.return_value = [
+            playlist_json,
+            {**playlist_json, "id": 2, "name": "Renamed", "num_songs": 10}
+        ]
+
+        result = self.station.refresh_all(StationResources.PLAYLISTS, [unchanged, changed, removed])
+
+        self.assertEqual(result, {2: {"name", "num_songs"}, 3: None})
+        self.assertEqual(changed.name, "Renamed")
+        self.assertEqual(changed.num_songs, 10)
+        self.assertIsNone(removed.id)
+        self.assertEqual(self.station._request_handler.get.call_count, 1)
+
+    def test_refresh_all_with_invalid_kind(self):
+        with self.assertRaises(ClientException):
+            self.station.refresh_all("playlists", [])
+
+    def test_helpers_are_built_on_first_use(self):
+        self.assertNotIn("file", vars(self.station))
+
+        helper = self.station.file
+
+        self.assertIsInstance(helper, models.helpers.FileHelper)
+        self.assertIs(self.station.file, helper)
+        self.assertIs(helper._station, self.station)
+
+    def test_mounts_are_built_on_first_use(self):
+        self.assertNotIn("mounts", vars(self.station))
+        self.assertTrue(all(isinstance(mount, models.Mount) for mount in self.station.mounts))
+
+    def _fake_podcast_episodes_get(self, url):
+        if url.endswith("/podcasts"):
+            podcasts = []
+            for id in ("p1", "p2"):
+                podcast = fake_data_generator.return_fake_podcast_json()
+                podcast['id'] = id
+                podcasts.append(podcast)
+            return podcasts
+
+        podcast_id = url.split("/podcast/")[1].split("/")[0]
+        page = int(url.split("page=")[1].split("&")[0])
+
+        rows = []
+        for i in range(5):
+            episode = fake_data_generator.return_fake_podcast_episode_json()
+            episode['id'] = f"{podcast_id}-{i}"
+            episode['publish_at'] = 1000 + i if i else ""
+            rows.append(episode)
+
+        return {"page": page, "per_page": 2, "total": len(rows), "rows": rows[(page - 1) * 2:page * 2]}
+
+    def test_iter_episodes_pages_every_podcast(self):
+        self.station._request_handler.get.side_effect = self._fake_podcast_episodes_get
+
+        episodes = list(self.station.iter_episodes(workers=3, per_page=2))
+
+        self.assertEqual(
+            sorted(episode.id for episode in episodes),
+            sorted(f"{podcast_id}-{i}" for podcast_id in ("p1", "p2") for i in range(5))
+        )
+        self.assertTrue(all(isinstance(episode, models.PodcastEpisode) for episode in episodes))
+        self.assertEqual({episode._podcast.id for episode in episodes}, {"p1", "p2"})
+
+        # One request for the podcasts, and three pages for each podcast.
+        self.assertEqual(self.station._request_handler.get.call_count, 7)
+
+    def test_iter_episodes_since(self):
+        self.station._request_handler.get.side_effect = self._fake_podcast_episodes_get
+
+        with mock.patch("AzuracastPy.models.station.PodcastEpisode", wraps=models.PodcastEpisode) as episode_class:
+            episodes = list(self.station.iter_episodes(since=1003, per_page=2))
+
+        # The first episode of each podcast has no publish time, so it's kept.
+        self.assertEqual(
+            sorted(episode.id for episode in episodes),
+            ["p1-0", "p1-3", "p1-4", "p2-0", "p2-3", "p2-4"]
+        )
+        self.assertEqual(episode_class.call_count, 6)
+
+    def test_published_since_falls_back_to_creation_time(self):
+        for episode, expected in (
+            ({"publish_at": 1005, "created_at": 900}, True),
+            ({"publish_at": "", "created_at": 1005}, True),
+            ({"publish_at": None, "created_at": 900}, False),
+            ({"publish_at": "not a time"}, True)
+        ):
+            with self.subTest(episode=episode):
+                self.assertIs(models.station._published_since(episode, 1000), expected)
+
+    def test_iter_episodes_with_invalid_workers(self):
+        with self.assertRaises(ClientException):
+            list(self.station.iter_episodes(workers=0))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
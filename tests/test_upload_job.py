@@ -0,0 +1,181 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import TestCase, mock
+
+import requests
+
+from AzuracastPy.exceptions import ClientException, UnexpectedErrorException
+from AzuracastPy.library import UploadJob
+
+from .util import fake_data_generator
+
+class TestUploadJob(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.journal = os.path.join(self.directory, "upload.journal")
+
+        self.station = fake_data_generator.return_fake_station_instance()
+        self.station._request_handler = mock.MagicMock()
+
+        self.files = {}
+        for i in range(1, 4):
+            source = os.path.join(self.directory, f"song{i}.mp3")
+
+            with open(source, "wb") as file:
+                file.write(f"audio {i}".encode())
+
+            self.files[f"music/song{i}.mp3"] = source
+
+        self.uploaded = {}
+        self.station._request_handler.post_stream.side_effect = self._fake_upload
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def _fake_upload(self, url, body, prefix=""):
+        path = prefix + json.loads(b"".join(body))['path']
+        id = len(self.uploaded) + 1
+        self.uploaded[path] = id
+
+        return fake_data_generator.return_fake_file_json(id, path=path)
+
+    def _journal_entries(self):
+        with open(self.journal, encoding="utf-8") as journal:
+            return [json.loads(line) for line in journal if line.strip()]
+
+    def test_run_uploads_every_file_and_journals_them(self):
+        job = UploadJob(self.station, self.files, self.journal, workers=2, retry_delay=0)
+
+        result = job.run()
+
+        self.assertEqual(result, {"uploaded": 3, "skipped": 0, "failed": 0})
+        self.assertEqual(set(self.uploaded), set(self.files))
+
+        events = [entry['event'] for entry in self._journal_entries()]
+        self.assertEqual(events, ["started", "completed", "completed", "completed"])
+
+    def test_resumed_job_only_uploads_missing_files(self):
+        UploadJob(self.station, self.files, self.journal, workers=3, retry_delay=0).run()
+
+        # The second file was deleted from the station in the meantime.
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(
+                self.uploaded["music/song1.mp3"], path="music/song1.mp3"
+            ),
+            fake_data_generator.return_fake_file_json(
+                self.uploaded["music/song3.mp3"], path="music/song3.mp3"
+            )
+        ]
+        self.uploaded.clear()
+
+        job = UploadJob(self.station, self.files, self.journal)
+        result = job.run()
+
+        self.assertEqual(job.workers, 3)
+        self.assertEqual(job.retry_delay, 0)
+        self.assertEqual(result, {"uploaded": 1, "skipped": 2, "failed": 0})
+        self.assertEqual(list(self.uploaded), ["music/song2.mp3"])
+
+    def test_resumed_job_compares_paths_stored_by_station(self):
+        # The station stores the files under normalized paths.
+        self.station._request_handler.post_stream.side_effect = (
+            lambda url, body: self._fake_upload(url, body, prefix="/")
+        )
+        UploadJob(self.station, self.files, self.journal, retry_delay=0).run()
+
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(id, path=path)
+            for path, id in self.uploaded.items()
+        ]
+        self.uploaded.clear()
+
+        result = UploadJob(self.station, self.files, self.journal).run()
+
+        self.assertEqual(result, {"uploaded": 0, "skipped": 3, "failed": 0})
+        self.assertEqual(self.uploaded, {})
+
+    def test_partial_journal_line_is_ignored(self):
+        job = UploadJob(self.station, self.files, self.journal, retry_delay=0)
+        job.run()
+
+        with open(self.journal, "a", encoding="utf-8") as journal:
+            journal.write('{"event": "compl')
+
+        self.station._request_handler.get.return_value = [
+            fake_data_generator.return_fake_file_json(id, path=path)
+            for path, id in self.uploaded.items()
+        ]
+
+        job = UploadJob(self.station, self.files, self.journal)
+
+        self.assertEqual(len(job.completed), 3)
+        self.assertEqual(job.run()["skipped"], 3)
+
+        with open(self.journal, encoding="utf-8") as journal:
+            last_entry = json.loads(journal.readlines()[-1])
+
+        self.assertEqual(last_entry['event'], "started")
+
+    def test_transient_errors_are_retried(self):
+        self.station._request_handler.post_stream.side_effect = [
+            UnexpectedErrorException("Bad gateway."),
+            fake_data_generator.return_fake_file_json(1, path="music/song1.mp3")
+        ]
+
+        job = UploadJob(
+            self.station, {"music/song1.mp3": self.files["music/song1.mp3"]}, self.journal,
+            retries=1, retry_delay=0
+        )
+
+        self.assertEqual(job.run(), {"uploaded": 1, "skipped": 0, "failed": 0})
+
+    def test_upload_stored_despite_error_is_not_retried(self):
+        def upload_then_time_out(url, body):
+            self._fake_upload(url, body)
+            raise requests.Timeout("Read timed out.")
+
+        self.station._request_handler.post_stream.side_effect = upload_then_time_out
+        self.station._request_handler.get.side_effect = lambda url: [
+            fake_data_generator.return_fake_file_json(id, path=path)
+            for path, id in self.uploaded.items()
+        ]
+
+        job = UploadJob(self.station, self.files, self.journal, retry_delay=0)
+
+        self.assertEqual(job.run(), {"uploaded": 3, "skipped": 0, "failed": 0})
+        self.assertEqual(self.station._request_handler.post_stream.call_count, 3)
+        self.assertEqual(
+            {path: upload['id'] for path, upload in job.completed.items()},
+            self.uploaded
+        )
+
+    def test_failures_are_recorded_after_retries(self):
+        self.station._request_handler.post_stream.side_effect = UnexpectedErrorException(
+            "Bad gateway."
+        )
+
+        job = UploadJob(self.station, self.files, self.journal, retries=2, retry_delay=0)
+        result = job.run()
+
+        self.assertEqual(result, {"uploaded": 0, "skipped": 0, "failed": 3})
+        self.assertEqual(self.station._request_handler.post_stream.call_count, 9)
+        self.assertEqual(set(job.failures), set(self.files))
+
+    def test_journal_from_another_station_raises(self):
+        UploadJob(self.station, self.files, self.journal, retry_delay=0).run()
+
+        other_station = fake_data_generator.return_fake_station_instance()
+        other_station.id = 2
+
+        with self.assertRaises(ClientException):
+            UploadJob(other_station, self.files, self.journal)
+
+    def test_invalid_workers_raises(self):
+        with self.assertRaises(ClientException):
+            UploadJob(self.station, self.files, self.journal, workers=0)
+
+if __name__ == '__main__':
+    unittest.main()
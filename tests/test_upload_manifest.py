@@ -0,0 +1,204 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import TestCase, mock
+
+from AzuracastPy import models
+from AzuracastPy.enums import DuplicateActions
+from AzuracastPy.exceptions import ClientException
+from AzuracastPy.library import UploadManifest
+
+from .util import fake_data_generator
+
+def _upload_returning(file_json):
+    def upload(url, body):
+        # Drain the streamed body the way the HTTP client would.
+        b"".join(body)
+
+        return file_json
+
+    return upload
+
+class TestUploadManifest(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.manifest = UploadManifest()
+
+        self.station = fake_data_generator.return_fake_station_instance()
+        self.station._request_handler = mock.MagicMock()
+
+    def tearDown(self) -> None:
+        self.manifest.close()
+        shutil.rmtree(self.directory)
+
+    def _write_file(self, name, content):
+        path = os.path.join(self.directory, name)
+
+        with open(path, "wb") as file:
+            file.write(content)
+
+        return path
+
+    def test_fingerprint_matches_for_identical_content(self):
+        first = self._write_file("a.mp3", b"same audio")
+        second = self._write_file("b.mp3", b"same audio")
+        third = self._write_file("c.mp3", b"other audio")
+
+        self.assertEqual(self.manifest.fingerprint(first), self.manifest.fingerprint(second))
+        self.assertNotEqual(self.manifest.fingerprint(first), self.manifest.fingerprint(third))
+
+    def test_fingerprint_is_recomputed_when_file_changes(self):
+        path = self._write_file("a.mp3", b"audio")
+        before = self.manifest.fingerprint(path)
+
+        with open(path, "wb") as file:
+            file.write(b"edited audio")
+
+        self.assertNotEqual(self.manifest.fingerprint(path), before)
+
+    def test_fingerprint_raises_for_missing_file(self):
+        with self.assertRaises(ValueError):
+            self.manifest.fingerprint(os.path.join(self.directory, "missing.mp3"))
+
+    def test_record_lookup_and_forget(self):
+        fingerprint = self.manifest.fingerprint(self._write_file("a.mp3", b"audio"))
+        station_file = fake_data_generator.return_fake_file_instance(
+            5, self.station, path="music/a.mp3"
+        )
+
+        self.assertIsNone(self.manifest.lookup(fingerprint, self.station.id))
+
+        self.manifest.record(fingerprint, station_file)
+
+        upload = self.manifest.lookup(fingerprint, self.station.id)
+        self.assertEqual(upload['id'], 5)
+        self.assertEqual(upload['path'], "music/a.mp3")
+        self.assertEqual(len(self.manifest), 1)
+
+        self.manifest.forget(fingerprint, self.station.id)
+
+        self.assertIsNone(self.manifest.lookup(fingerprint, self.station.id))
+        self.assertEqual(len(self.manifest), 0)
+
+    def test_find_duplicates_groups_files_with_same_content(self):
+        first = self._write_file("a.mp3", b"same audio")
+        second = self._write_file("b.mp3", b"same audio")
+        third = self._write_file("c.mp3", b"diff audio")
+
+        duplicates = self.manifest.find_duplicates([first, second, third])
+
+        self.assertEqual(list(duplicates.values()), [[first, second]])
+
+    def test_find_cross_station_duplicates(self):
+        fingerprint = self.manifest.fingerprint(self._write_file("a.mp3", b"audio"))
+        other_station = fake_data_generator.return_fake_station_instance()
+        other_station.id = 2
+
+        station_file = fake_data_generator.return_fake_file_instance(1, self.station, path="a.mp3")
+        self.manifest.record(fingerprint, station_file)
+        self.manifest.record(
+            fingerprint,
+            fake_data_generator.return_fake_file_instance(_station=other_station)
+        )
+
+        duplicates = self.manifest.find_cross_station_duplicates()
+
+        self.assertEqual(len(duplicates[fingerprint]), 2)
+        self.assertEqual(len(self.manifest.locations(fingerprint)), 2)
+
+    def test_upload_records_new_file_in_manifest(self):
+        path = self._write_file("a.mp3", b"audio")
+        file_json = fake_data_generator.return_fake_file_json()
+        self.station._request_handler.post_stream.side_effect = _upload_returning(file_json)
+
+        result = self.station.file.upload("music/a.mp3", path, manifest=self.manifest)
+
+        self.assertIsInstance(result, models.StationFile)
+        self.assertEqual(
+            self.manifest.lookup(self.manifest.fingerprint(path), self.station.id)['id'],
+            file_json['id']
+        )
+
+    def test_upload_skips_content_already_on_station(self):
+        path = self._write_file("a.mp3", b"audio")
+        file_json = fake_data_generator.return_fake_file_json()
+        self.station._request_handler.post_stream.side_effect = _upload_returning(file_json)
+        self.station._request_handler.get.return_value = file_json
+
+        self.station.file.upload("music/a.mp3", path, manifest=self.manifest)
+        copy = self._write_file("copy.mp3", b"audio")
+        result = self.station.file.upload("music/copy.mp3", copy, manifest=self.manifest)
+
+        self.assertEqual(result.id, file_json['id'])
+        self.assertEqual(self.station._request_handler.post_stream.call_count, 1)
+
+    def test_upload_moves_existing_file_when_requested(self):
+        path = self._write_file("a.mp3", b"audio")
+        file_json = fake_data_generator.return_fake_file_json()
+        self.station._request_handler.get.return_value = file_json
+        self.station._request_handler.put.return_value = {"success": True}
+
+        fingerprint = self.manifest.fingerprint(path)
+        station_file = fake_data_generator.return_fake_file_instance(
+            file_json['id'], self.station, path=file_json['path']
+        )
+        self.manifest.record(fingerprint, station_file)
+
+        result = self.station.file.upload(
+            "music/new/place.mp3", path,
+            manifest=self.manifest,
+            on_duplicate=DuplicateActions.MOVE
+        )
+
+        self.assertEqual(result.path, "music/new/place.mp3")
+        self.station._request_handler.post_stream.assert_not_called()
+        self.station._request_handler.put.assert_called_once()
+        self.assertEqual(
+            self.manifest.lookup(fingerprint, self.station.id)['path'],
+            "music/new/place.mp3"
+        )
+
+    def test_upload_uploads_again_when_recorded_file_was_deleted(self):
+        path = self._write_file("a.mp3", b"audio")
+        file_json = fake_data_generator.return_fake_file_json()
+        self.station._request_handler.get.side_effect = ClientException("Record not found.")
+        self.station._request_handler.post_stream.side_effect = _upload_returning(file_json)
+
+        fingerprint = self.manifest.fingerprint(path)
+        station_file = fake_data_generator.return_fake_file_instance(999, self.station, path="old.mp3")
+        self.manifest.record(fingerprint, station_file)
+
+        result = self.station.file.upload("music/a.mp3", path, manifest=self.manifest)
+
+        self.assertEqual(result.id, file_json['id'])
+        self.assertEqual(self.manifest.lookup(fingerprint, self.station.id)['id'], file_json['id'])
+
+    def test_upload_fingerprints_streamed_content_without_rereading(self):
+        path = self._write_file("a.mp3", b"audio")
+        expected = self.manifest.fingerprint(self._write_file("b.mp3", b"audio"))
+        file_json = fake_data_generator.return_fake_file_json()
+        self.station._request_handler.post_stream.side_effect = _upload_returning(file_json)
+
+        patched = mock.patch("AzuracastPy.library.upload_manifest.fingerprint_file")
+
+        with patched as fingerprint_file:
+            self.station.file.upload(
+                "music/a.mp3", path,
+                manifest=self.manifest,
+                on_duplicate=DuplicateActions.UPLOAD
+            )
+
+            self.assertEqual(self.manifest.fingerprint(path), expected)
+            fingerprint_file.assert_not_called()
+
+        self.assertEqual(self.manifest.lookup(expected, self.station.id)['id'], file_json['id'])
+
+    def test_upload_raises_for_invalid_on_duplicate(self):
+        path = self._write_file("a.mp3", b"audio")
+
+        with self.assertRaises(ClientException):
+            self.station.file.upload("a.mp3", path, manifest=self.manifest, on_duplicate="skip")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,16 @@ from AzuracastPy import models
 
 FAKE_JSON_DIR = 'tests/util/json'
 
+def _apply_overrides(data, overrides):
+    # Nested dictionaries are merged, so e.g. location={"country": "US"} keeps the other fields.
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(data.get(key), dict):
+            _apply_overrides(data[key], value)
+        else:
+            data[key] = value
+
+    return data
+
 def return_fake_station_json():
     with open(f'{FAKE_JSON_DIR}/station.json', 'r') as file:
         return json.loads(file.read())
@@ -11,9 +21,19 @@ def return_fake_station_json():
 def return_fake_station_instance():
     return models.Station(**return_fake_station_json(), _request_handler=None)
 
-def return_fake_file_json():
+def return_fake_file_json(id=None, **overrides):
     with open(f'{FAKE_JSON_DIR}/file.json', 'r') as file:
-        return json.loads(file.read())
+        file_json = json.loads(file.read())
+
+    if id is not None:
+        # Files with the same unique ID are copies of each other.
+        file_json['id'] = id
+        file_json['unique_id'] = f"unique-{id}"
+
+    return _apply_overrides(file_json, overrides)
+
+def return_fake_file_instance(id=None, _station=None, **overrides):
+    return models.StationFile(**return_fake_file_json(id, **overrides), _station=_station)
 
 def return_fake_mount_point_json():
     with open(f'{FAKE_JSON_DIR}/mount_point.json', 'r') as file:
@@ -22,32 +42,54 @@ def return_fake_mount_point_json():
 def return_fake_mount_point_instance():
     return models.MountPoint(**return_fake_mount_point_json(), _station=None)
 
-def return_fake_now_playing_json():
+def return_fake_now_playing_json(**overrides):
     with open(f'{FAKE_JSON_DIR}/now_playing.json', 'r') as file:
-        return json.loads(file.read())
+        return _apply_overrides(json.loads(file.read()), overrides)
+
+def return_fake_now_playing_instance(**overrides):
+    return models.NowPlaying(**return_fake_now_playing_json(**overrides))
 
-def return_fake_playlist_json():
+def return_fake_playlist_json(**overrides):
     with open(f'{FAKE_JSON_DIR}/playlist.json', 'r') as file:
-        return json.loads(file.read())
+        return _apply_overrides(json.loads(file.read()), overrides)
 
-def return_fake_playlist_instance():
-    return models.Playlist(**return_fake_playlist_json(), _station=None)
+def return_fake_playlist_instance(**overrides):
+    return models.Playlist(**return_fake_playlist_json(**overrides), _station=None)
 
-def return_fake_requestable_song_json():
+def return_fake_requestable_song_json(**overrides):
     with open(f'{FAKE_JSON_DIR}/requestable_song.json', 'r') as file:
-        return json.loads(file.read())
+        return _apply_overrides(json.loads(file.read()), overrides)
+
+def return_fake_requestable_song_instance(**overrides):
+    return models.RequestableSong(**return_fake_requestable_song_json(**overrides))
 
-def return_fake_song_history_json():
+def return_fake_song_history_json(**overrides):
     with open(f'{FAKE_JSON_DIR}/song_history.json', 'r') as file:
-        return json.loads(file.read())
+        return _apply_overrides(json.loads(file.read()), overrides)
+
+def return_fake_song_json(**overrides):
+    return _apply_overrides(return_fake_song_history_json()['song'], overrides)
+
+def return_fake_schedule_item_json(start_time, end_time, **overrides):
+    schedule_item = {
+        "start_time": start_time,
+        "end_time": end_time,
+        "start_date": None,
+        "end_date": None,
+        "days": [],
+        "loop_once": False,
+        "id": 1
+    }
+
+    return _apply_overrides(schedule_item, overrides)
 
 def return_fake_schedule_time_json():
     with open(f'{FAKE_JSON_DIR}/schedule_time.json', 'r') as file:
         return json.loads(file.read())
 
-def return_fake_listener_json():
+def return_fake_listener_json(**overrides):
     with open(f'{FAKE_JSON_DIR}/listener.json', 'r') as file:
-        return json.loads(file.read())
+        return _apply_overrides(json.loads(file.read()), overrides)
 
 def return_fake_station_status_json():
     with open(f'{FAKE_JSON_DIR}/station_status.json', 'r') as file:
@@ -60,16 +102,22 @@ def return_fake_podcast_json():
 def return_fake_podcast_instance():
     return models.Podcast(**return_fake_podcast_json(), _station=None)
 
-def return_fake_podcast_episode_json():
+def return_fake_podcast_episode_json(**overrides):
     with open(f'{FAKE_JSON_DIR}/podcast_episode.json', 'r') as file:
-        return json.loads(file.read())
+        return _apply_overrides(json.loads(file.read()), overrides)
 
 def return_fake_podcast_episode_instance():
     return models.PodcastEpisode(**return_fake_podcast_episode_json(), _podcast=None)
 
-def return_fake_queue_item_json():
+def return_fake_queue_item_json(id=None, **overrides):
     with open(f'{FAKE_JSON_DIR}/queue_item.json', 'r') as file:
-        return json.loads(file.read())
+        queue_item = json.loads(file.read())
+
+    if id is not None:
+        # Queue items are only identified by their link.
+        queue_item['links'] = {"self": f"http://localhost/api/station/1/queue/{id}"}
+
+    return _apply_overrides(queue_item, overrides)
 
 def return_fake_hls_stream_json():
     with open(f'{FAKE_JSON_DIR}/hls_stream.json', 'r') as file:
@@ -92,12 +140,12 @@ def return_fake_sftp_user_json():
 def return_fake_sftp_user_instance():
     return models.SFTPUser(**return_fake_sftp_user_json(), _station=None)
 
-def return_fake_streamer_json():
+def return_fake_streamer_json(**overrides):
     with open(f'{FAKE_JSON_DIR}/streamer.json', 'r') as file:
-        return json.loads(file.read())
+        return _apply_overrides(json.loads(file.read()), overrides)
 
-def return_fake_streamer_instance():
-    return models.Streamer(**return_fake_streamer_json(), _station=None)
+def return_fake_streamer_instance(**overrides):
+    return models.Streamer(**return_fake_streamer_json(**overrides), _station=None)
 
 def return_fake_webhook_json():
     with open(f'{FAKE_JSON_DIR}/webhook.json', 'r') as file: